@@ -7,16 +7,17 @@ This CLI unifies all exam operations (setup, exam, score, cleanup) into a single
 entry point with both interactive menu and direct command-line access.
 """
 
-import argcomplete
-import argparse
+from __future__ import annotations
+
+# Only os and sys are imported up front: tab completion answers from the cached
+# exam IDs before anything else loads. Other modules are imported where used.
 import os
-import re
-import shutil
-import signal
-import subprocess
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
 
 __version__ = "1.7.0"
 
@@ -83,6 +84,7 @@ def print_info(message: str) -> None:
 
 def get_project_root() -> Path:
     """Get the project root directory."""
+    from pathlib import Path
     return Path(__file__).parent.resolve()
 
 
@@ -96,6 +98,15 @@ def get_exams_dir() -> Path:
     return get_project_root() / "exams"
 
 
+def import_lib(name: str):
+    """Import a Python helper module from scripts/lib."""
+    import importlib
+    lib_dir = str(get_scripts_dir() / "lib")
+    if lib_dir not in sys.path:
+        sys.path.insert(0, lib_dir)
+    return importlib.import_module(name)
+
+
 # =============================================================================
 # ASCII Banner (T009)
 # =============================================================================
@@ -140,32 +151,18 @@ def show_version() -> None:
     print()
 
 
-class VersionAction(argparse.Action):
-    """Custom version action that displays banner and description."""
-
-    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help="Show version and exit"):
-        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
-
-    def __call__(self, parser, namespace, values, option_string=None):
-        show_version()
-        parser.exit()
-
-
 # =============================================================================
 # Exam Discovery (T005)
 # =============================================================================
 
-def discover_exams() -> List[str]:
-    """Discover available exams in the exams/ directory."""
-    exams_dir = get_exams_dir()
-    if not exams_dir.exists():
-        return []
+def get_exam_index() -> dict:
+    """Load the compiled exam index (scripts/lib/exam_index.py), rebuilt when exams change."""
+    return import_lib("exam_index").load(get_exams_dir())
 
-    exams = []
-    for item in sorted(exams_dir.iterdir()):
-        if item.is_dir() and (item / "exam.conf").exists():
-            exams.append(item.name)
-    return exams
+
+def discover_exams() -> list[str]:
+    """Discover available exams in the exams/ directory."""
+    return list(get_exam_index()["exams"])
 
 
 def normalize_exam_id(exam_id: str) -> str:
@@ -179,31 +176,15 @@ def normalize_exam_id(exam_id: str) -> str:
 # Exam Config Parser (T006)
 # =============================================================================
 
-def parse_exam_config(exam_id: str) -> Optional[Dict[str, str]]:
-    """Parse exam.conf file and return configuration as dictionary."""
-    config_file = get_exams_dir() / exam_id / "exam.conf"
-    if not config_file.exists():
+def parse_exam_config(exam_id: str) -> dict | None:
+    """Return the exam.conf assignments of an exam from the exam index (arrays as lists)."""
+    exam = get_exam_index()["exams"].get(exam_id)
+    if not exam:
         return None
-
-    config = {}
-    try:
-        content = config_file.read_text()
-        # Parse shell variable assignments
-        for line in content.splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                # Handle simple KEY=value or KEY="value"
-                match = re.match(r'^([A-Z_]+)=["\'"]?([^"\'"\n]*)["\'"]?', line)
-                if match:
-                    key, value = match.groups()
-                    config[key] = value.strip('"\'')
-    except Exception:
-        return None
-
-    return config
+    return dict(exam["config"])
 
 
-def get_exam_info(exam_id: str) -> Optional[Dict[str, str]]:
+def get_exam_info(exam_id: str) -> dict[str, str] | None:
     """Get formatted exam information."""
     config = parse_exam_config(exam_id)
     if not config:
@@ -225,8 +206,9 @@ def get_exam_info(exam_id: str) -> Optional[Dict[str, str]]:
 # Script Runner (T007)
 # =============================================================================
 
-def run_script(script_name: str, args: List[str] = None, capture: bool = False) -> Tuple[int, str, str]:
+def run_script(script_name: str, args: list[str] | None = None, capture: bool = False) -> tuple[int, str, str]:
     """Run a bash script from the scripts directory."""
+    import subprocess
     script_path = get_scripts_dir() / script_name
     if not script_path.exists():
         return 1, "", f"Script not found: {script_path}"
@@ -252,6 +234,7 @@ def run_script(script_name: str, args: List[str] = None, capture: bool = False)
 
 def check_command(cmd: str) -> bool:
     """Check if a command is available in PATH."""
+    import shutil
     return shutil.which(cmd) is not None
 
 
@@ -273,8 +256,32 @@ def check_prerequisites(verbose: bool = True) -> bool:
     return all_ok
 
 
+_cluster_client = None
+
+
+def get_cluster_client():
+    """Keep-alive API client for the current kubeconfig context (scripts/lib/kube_client.py).
+
+    Created once and shared by every cluster check of the process. Returns None
+    when the context needs kubectl (exec plugins, auth providers, ...).
+    """
+    global _cluster_client
+    if _cluster_client is None:
+        kube_client = import_lib("kube_client")
+        try:
+            _cluster_client = kube_client.KubeClient.from_kubeconfig()
+        except (kube_client.Unsupported, OSError):
+            _cluster_client = False
+    return _cluster_client or None
+
+
 def check_cluster_connectivity() -> bool:
-    """Check if kubectl can connect to a cluster."""
+    """Check if the cluster's API server answers."""
+    client = get_cluster_client()
+    if client:
+        return client.reachable()
+
+    import subprocess
     try:
         result = subprocess.run(
             ["kubectl", "cluster-info"],
@@ -287,6 +294,41 @@ def check_cluster_connectivity() -> bool:
         return False
 
 
+def detect_installed_exams() -> dict[str, tuple[int, int, int]] | None:
+    """Detect installed exams with one namespace listing (scripts/lib/exam_detect.py).
+
+    Returns {exam_id: (found, total, percent)}, or None if the cluster cannot be read.
+    """
+    client = get_cluster_client()
+    if client:
+        try:
+            namespaces = client.namespaces()
+        except import_lib("kube_client").ClusterError:
+            return None
+        installed = import_lib("exam_detect").detect(str(get_exams_dir()), namespaces)
+        return {exam_id: (found, total, percent) for exam_id, found, total, percent, _ in installed}
+
+    import subprocess
+    helper = get_scripts_dir() / "lib" / "exam_detect.py"
+    try:
+        result = subprocess.run(
+            [sys.executable, str(helper), str(get_exams_dir())],
+            capture_output=True,
+            text=True,
+            timeout=15
+        )
+    except Exception:
+        return None
+    if result.returncode not in (0, 1):
+        return None
+
+    installed = {}
+    for line in result.stdout.splitlines():
+        exam_id, found, total, percent, _ = line.split("\t")
+        installed[exam_id] = (int(found), int(total), int(percent))
+    return installed
+
+
 # =============================================================================
 # Signal Handler (T010)
 # =============================================================================
@@ -334,7 +376,7 @@ def show_menu() -> None:
     print()
 
 
-def select_exam(prompt: str = "Select an exam") -> Optional[str]:
+def select_exam(prompt: str = "Select an exam") -> str | None:
     """Display exam selection menu and return selected exam ID."""
     exams = discover_exams()
     if not exams:
@@ -486,6 +528,40 @@ def run_interactive_menu() -> None:
         print()
 
 
+# =============================================================================
+# Warm Pool
+# =============================================================================
+
+POOL_ACTIONS = ["fill", "release", "status", "drain"]
+
+
+def get_pool_dir() -> Path:
+    """Get the warm pool state directory (shared with ckad-pool.sh)."""
+    from pathlib import Path
+    return Path(os.environ.get("CKAD_POOL_DIR", get_project_root() / ".cache" / "pool"))
+
+
+def pool_has_ready(exam_id: str) -> bool:
+    """Check whether the warm pool holds a ready environment for an exam."""
+    return any((get_pool_dir() / exam_id).glob("*.ready"))
+
+
+def replenish_pool(exam_id: str) -> None:
+    """Refill the warm pool in a detached background process."""
+    import subprocess
+    exam_pool_dir = get_pool_dir() / exam_id
+    exam_pool_dir.mkdir(parents=True, exist_ok=True)
+    with open(exam_pool_dir / "fill.log", "a") as log:
+        subprocess.Popen(
+            ["bash", str(get_scripts_dir() / "ckad-pool.sh"), "fill", "-e", exam_id],
+            cwd=get_project_root(),
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
 # =============================================================================
 # CLI Commands (T018-T030)
 # =============================================================================
@@ -507,12 +583,24 @@ def cmd_exam_start(args) -> int:
     print_info(f"Starting exam: {exam_id}")
     print()
 
-    # Setup
-    print_info("Setting up exam environment...")
-    returncode, _, _ = run_script("ckad-setup.sh", ["-e", exam_id])
-    if returncode != 0:
-        print_error("Setup failed")
-        return returncode
+    # Claim a warm environment if the pool has one, otherwise set up from scratch
+    claimed = False
+    if not getattr(args, 'no_pool', False) and pool_has_ready(exam_id):
+        print_info("Claiming warm environment from the pool...")
+        returncode, _, _ = run_script("ckad-pool.sh", ["claim", "-e", exam_id])
+        claimed = returncode == 0
+        if claimed:
+            replenish_pool(exam_id)
+            print_info("Replenishing the warm pool in the background")
+        else:
+            print_warning("Could not claim a warm environment, running full setup")
+
+    if not claimed:
+        print_info("Setting up exam environment...")
+        returncode, _, _ = run_script("ckad-setup.sh", ["-e", exam_id])
+        if returncode != 0:
+            print_error("Setup failed")
+            return returncode
 
     # Start exam (skip detection since we just ran setup)
     print()
@@ -574,6 +662,9 @@ def cmd_score(args) -> int:
         print_error(f"Exam not found: {exam_id}")
         return 1
 
+    if getattr(args, "watch", False):
+        return watch_score(exam_id, args.interval)
+
     show_banner()
     print_info(f"Scoring exam: {exam_id}")
     print()
@@ -582,6 +673,123 @@ def cmd_score(args) -> int:
     return returncode
 
 
+def score_questions(exam_id: str, questions: list[str] | None = None) -> dict[str, tuple[int, int]]:
+    """Score an exam (or only the given questions) and return {question: (score, max_score)}."""
+    import json
+    script_args = ["-e", exam_id, "--format", "ndjson", "-j", "4"]
+    if questions:
+        script_args += ["-q", ",".join(questions)]
+    _, stdout, _ = run_script("ckad-score.sh", script_args, capture=True)
+
+    results = {}
+    for line in stdout.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get("type") == "question":
+            results[record["question"]] = (record["score"], record["max_score"])
+    return results
+
+
+def draw_watch_table(exam: dict, results: dict, rescored: set, status: str) -> None:
+    """Redraw the live score table (or print the re-scored rows when not on a terminal)."""
+    import time
+    topics = {q["id"]: q["topic"] for q in exam["questions"]}
+    regular = [q for q in results if not q.startswith("P")]
+    score = sum(results[q][0] for q in regular)
+    possible = sum(results[q][1] for q in regular)
+    percentage = score * 100 // possible if possible else 0
+    passing = exam["summary"]["passing"]
+    stamp = time.strftime("%H:%M:%S")
+
+    if not sys.stdout.isatty():
+        for question in sorted(rescored, key=question_sort_key):
+            scored, maximum = results.get(question, (0, 0))
+            print(f"{stamp} Q{question} {scored}/{maximum} total {score}/{possible} ({percentage}%)", flush=True)
+        return
+
+    print("\033[H\033[2J", end="")
+    print(color(f"Live score: {exam['summary']['name']}", Colors.BOLD) + f"   (updated {stamp})")
+    print()
+    print(f"{'Question':<10} {'Score':<8}   Topic")
+    print(f"{'-' * 8:<10} {'-' * 6:<8}   {'-' * 40}")
+    for question in sorted(results, key=question_sort_key):
+        scored, maximum = results[question]
+        cell = f"{scored}/{maximum}"
+        if maximum and scored == maximum:
+            cell = color(f"{cell:<8}", Colors.GREEN)
+        elif scored:
+            cell = color(f"{cell:<8}", Colors.YELLOW)
+        else:
+            cell = f"{cell:<8}"
+        marker = color("*", Colors.CYAN) if question in rescored else " "
+        print(f"{'Q' + question:<10} {cell} {marker} {topics.get(question, '')}")
+    print()
+    total = f"TOTAL: {score}/{possible} ({percentage}%, pass {passing}%)"
+    print(color(total, Colors.GREEN if percentage >= passing else Colors.YELLOW))
+    print()
+    print(status)
+
+
+def question_sort_key(question: str) -> tuple:
+    """Order regular questions numerically, preview questions last."""
+    preview = question.startswith("P")
+    number = question[1:] if preview else question
+    return (preview, int(number) if number.isdigit() else 0)
+
+
+def watch_score(exam_id: str, interval: int) -> int:
+    """Score once, then re-score only the questions whose cluster objects or files change.
+
+    Changes come from a score_watch.ChangeTracker: the watch API for the cluster
+    objects the scoring functions read, inotify for answer files in exam/course.
+    Blind questions (inputs no watch can see, or a cluster that cannot be
+    watched) are re-scored every `interval` seconds.
+    """
+    import time
+    score_watch = import_lib("score_watch")
+    exam = get_exam_index()["exams"][exam_id]
+
+    tracker = score_watch.ChangeTracker(
+        exam["dependencies"], str(get_project_root() / "exam" / "course"), get_cluster_client()
+    )
+    tracker.start()
+    print_info(f"Scoring {exam_id}...")
+    tracker.take()
+    results = score_questions(exam_id)
+
+    draw_watch_table(exam, results, set(), watch_status(tracker, interval))
+    next_poll = time.monotonic() + interval
+    while True:
+        if tracker.wait(max(0.0, next_poll - time.monotonic())):
+            # Let a burst of events (kubectl apply, an editor save) settle
+            time.sleep(0.3)
+        polling = time.monotonic() >= next_poll
+        if polling:
+            next_poll = time.monotonic() + interval
+        dirty = tracker.take(blind=polling)
+        if not dirty:
+            continue
+        scored = score_questions(exam_id, sorted(dirty, key=question_sort_key))
+        tracker.mark_changed(dirty - set(scored))
+        results.update(scored)
+        draw_watch_table(exam, results, set(scored), watch_status(tracker, interval))
+
+
+def watch_status(tracker, interval: int) -> str:
+    """Status line of the live score table."""
+    status = tracker.status()
+    if status["cluster"] == "watch":
+        cluster = f"{len(status['resources'])} resource kinds (watch API)"
+        if status["broken"]:
+            cluster += f", {len(status['broken'])} failing: {', '.join(sorted(status['broken']))}"
+    else:
+        cluster = "no cluster watch (kubeconfig needs kubectl)"
+    return (f"Watching {cluster} and exam/course ({status['files']}); "
+            f"{len(status['blind'])} questions re-scored every {interval}s. Ctrl+C to stop.")
+
+
 def cmd_cleanup(args) -> int:
     """Cleanup exam resources."""
     exam_id = normalize_exam_id(args.exam) if args.exam else None
@@ -602,6 +810,60 @@ def cmd_cleanup(args) -> int:
     return returncode
 
 
+def cmd_pool(args) -> int:
+    """Manage the warm pool of pre-provisioned exam environments."""
+    exam_id = normalize_exam_id(args.exam) if args.exam else None
+
+    if exam_id:
+        if exam_id not in discover_exams():
+            print_error(f"Exam not found: {exam_id}")
+            return 1
+        exam_ids = [exam_id]
+    elif args.pool_action == "status":
+        exam_ids = discover_exams()
+    else:
+        exam_id = select_exam(f"Select exam to {args.pool_action} the pool for")
+        if not exam_id:
+            return 1
+        exam_ids = [exam_id]
+
+    returncode = 0
+    for eid in exam_ids:
+        script_args = [args.pool_action, "-e", eid]
+        if args.size is not None:
+            script_args += ["-n", str(args.size)]
+        code, _, _ = run_script("ckad-pool.sh", script_args)
+        returncode = returncode or code
+    return returncode
+
+
+IMAGE_ACTIONS = ["list", "pull", "load"]
+
+
+def cmd_images(args) -> int:
+    """Manage the offline image cache of exam workloads."""
+    exam_id = normalize_exam_id(args.exam) if args.exam else None
+
+    if exam_id:
+        if exam_id not in discover_exams():
+            print_error(f"Exam not found: {exam_id}")
+            return 1
+        exam_ids = [exam_id]
+    elif args.images_action in ("list", "pull"):
+        exam_ids = discover_exams()
+    else:
+        exam_id = select_exam("Select exam to load images for")
+        if not exam_id:
+            return 1
+        exam_ids = [exam_id]
+
+    returncode = 0
+    for eid in exam_ids:
+        code, _, _ = run_script("ckad-images.sh", [args.images_action, "-e", eid])
+        returncode = returncode or code
+    return returncode
+
+
 def cmd_list(args) -> int:
     """List available exams."""
     exams = discover_exams()
@@ -664,11 +926,67 @@ def cmd_info(args) -> int:
 # Shell Completion Generation
 # =============================================================================
 
-def get_exam_ids_for_completion() -> List[str]:
-    """Get list of exam IDs for shell completion."""
+def get_exam_ids_for_completion() -> list[str]:
+    """Get list of exam IDs for shell completion.
+
+    Read from the exam index's summary rows (.cache/exam-index.tsv) without
+    loading the index itself, unless exams/ or an exam.conf is newer; then the
+    index is rebuilt.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    exams_dir = os.path.join(root, "exams")
+    index_file = os.environ.get("CKAD_EXAM_INDEX", os.path.join(root, ".cache", "exam-index.json"))
+    rows_file = os.path.splitext(index_file)[0] + ".tsv"
+    try:
+        built = os.stat(rows_file).st_mtime_ns
+        with open(rows_file, encoding="utf-8") as f:
+            exam_ids = [line.split("\t", 1)[0] for line in f]
+        sources = [exams_dir] + [os.path.join(exams_dir, eid, "exam.conf") for eid in exam_ids]
+        if all(os.stat(path).st_mtime_ns <= built for path in sources):
+            return exam_ids
+    except OSError:
+        pass
     return discover_exams()
 
 
+def complete_exam_id() -> bool:
+    """Answer an argcomplete request for an -e/--exam value from the cached exam IDs.
+
+    Writes the IFS-separated matches where argcomplete would, so completing an
+    exam ID loads neither argcomplete nor the parser. Exam IDs need no quoting,
+    and the shell hooks add the trailing space themselves. Returns False when
+    the full completer is needed.
+    """
+    line = os.environ.get("COMP_LINE", "")
+    try:
+        line = line[:int(os.environ.get("COMP_POINT", len(line)))]
+    except ValueError:
+        return False
+    head, _, prefix = line.rpartition(" ")
+    words = head.split()
+    if not words or words[-1] not in ("-e", "--exam") or any(c in prefix for c in "\"'\\"):
+        return False
+
+    completions = [eid for eid in get_exam_ids_for_completion() if eid.startswith(prefix)]
+    output = os.environ.get("_ARGCOMPLETE_IFS", "\013").join(completions)
+    try:
+        with open(os.environ.get("_ARGCOMPLETE_STDOUT_FILENAME") or 8, "w") as f:
+            f.write(output)
+    except OSError:
+        return False
+    return True
+
+
+def set_exam_completers(parser) -> None:
+    """Complete -e/--exam values with the cached exam IDs in every (sub)command."""
+    for action in parser._actions:
+        if "--exam" in action.option_strings:
+            action.completer = lambda **kwargs: get_exam_ids_for_completion()
+        if isinstance(action.choices, dict):
+            for subparser in action.choices.values():
+                set_exam_completers(subparser)
+
+
 def generate_bash_completion() -> str:
     """Generate bash completion script."""
     exam_ids = " ".join(get_exam_ids_for_completion())
@@ -680,8 +998,10 @@ _ckad_dojo_completions() {{
     local cur prev words cword
     _init_completion || return
 
-    local commands="exam setup score cleanup list info status completion"
+    local commands="exam setup score cleanup pool images list info status completion"
     local exam_subcommands="start stop"
+    local pool_actions="fill release status drain"
+    local image_actions="list pull load"
     local shells="bash zsh fish"
     local exam_ids="{exam_ids}"
 
@@ -694,6 +1014,12 @@ _ckad_dojo_completions() {{
                 exam)
                     COMPREPLY=($(compgen -W "$exam_subcommands" -- "$cur"))
                     ;;
+                pool)
+                    COMPREPLY=($(compgen -W "$pool_actions" -- "$cur"))
+                    ;;
+                images)
+                    COMPREPLY=($(compgen -W "$image_actions" -- "$cur"))
+                    ;;
                 completion)
                     COMPREPLY=($(compgen -W "$shells" -- "$cur"))
                     ;;
@@ -712,6 +1038,12 @@ _ckad_dojo_completions() {{
                         COMPREPLY=($(compgen -W "-e --exam --help -h" -- "$cur"))
                     fi
                     ;;
+                pool)
+                    COMPREPLY=($(compgen -W "-e --exam -n --size --help -h" -- "$cur"))
+                    ;;
+                images)
+                    COMPREPLY=($(compgen -W "-e --exam --help -h" -- "$cur"))
+                    ;;
                 setup|score|cleanup|info|status)
                     if [[ "$prev" == "-e" || "$prev" == "--exam" ]]; then
                         COMPREPLY=($(compgen -W "$exam_ids" -- "$cur"))
@@ -740,8 +1072,10 @@ _uv_ckad_dojo_completions() {{
 
     # Check if we're completing "uv run ckad-dojo ..."
     if [[ "${{words[1]}}" == "run" && "${{words[2]}}" == "ckad-dojo" ]]; then
-        local commands="exam setup score cleanup list info status completion"
+        local commands="exam setup score cleanup pool images list info status completion"
         local exam_subcommands="start stop"
+        local pool_actions="fill release status drain"
+        local image_actions="list pull load"
         local shells="bash zsh fish"
         local exam_ids="{exam_ids}"
 
@@ -757,6 +1091,12 @@ _uv_ckad_dojo_completions() {{
                     exam)
                         COMPREPLY=($(compgen -W "$exam_subcommands" -- "$cur"))
                         ;;
+                    pool)
+                        COMPREPLY=($(compgen -W "$pool_actions" -- "$cur"))
+                        ;;
+                    images)
+                        COMPREPLY=($(compgen -W "$image_actions" -- "$cur"))
+                        ;;
                     completion)
                         COMPREPLY=($(compgen -W "$shells" -- "$cur"))
                         ;;
@@ -795,13 +1135,15 @@ def generate_zsh_completion() -> str:
 # Generated by: uv run ckad-dojo completion zsh
 
 _ckad_dojo() {{
-    local -a commands exam_subcommands shells exam_ids
+    local -a commands exam_subcommands pool_actions image_actions shells exam_ids
 
     commands=(
         'exam:Exam operations (start, stop)'
         'setup:Setup exam environment'
         'score:Score exam answers'
         'cleanup:Cleanup exam resources'
+        'pool:Manage warm exam environments'
+        'images:Cache and preload exam images'
         'list:List available exams'
         'info:Show exam details'
         'status:Show environment status'
@@ -813,6 +1155,19 @@ _ckad_dojo() {{
         'stop:Stop current exam session'
     )
 
+    pool_actions=(
+        'fill:Provision environments until the pool is full'
+        'release:Delete claimed environments and restore the kubectl context'
+        'status:Show pooled environments'
+        'drain:Delete pooled environments'
+    )
+
+    image_actions=(
+        'list:List exam images and their cache state'
+        'pull:Pull missing images into the cache'
+        'load:Side-load cached images into the cluster'
+    )
+
     shells=(bash zsh fish)
     exam_ids=({exam_ids})
 
@@ -838,6 +1193,25 @@ _ckad_dojo() {{
                             '(-h --help){{-h,--help}}[Show help]'
                     fi
                     ;;
+                pool)
+                    if (( CURRENT == 2 )); then
+                        _describe -t actions 'pool actions' pool_actions
+                    else
+                        _arguments \\
+                            '(-e --exam){{-e,--exam}}[Exam ID]:exam:($exam_ids)' \\
+                            '(-n --size){{-n,--size}}[Environments to keep ready]:size:' \\
+                            '(-h --help){{-h,--help}}[Show help]'
+                    fi
+                    ;;
+                images)
+                    if (( CURRENT == 2 )); then
+                        _describe -t actions 'images actions' image_actions
+                    else
+                        _arguments \\
+                            '(-e --exam){{-e,--exam}}[Exam ID]:exam:($exam_ids)' \\
+                            '(-h --help){{-h,--help}}[Show help]'
+                    fi
+                    ;;
                 completion)
                     if (( CURRENT == 2 )); then
                         _describe -t shells 'shell type' shells
@@ -878,6 +1252,8 @@ def generate_fish_completion() -> str:
         "complete -c ckad-dojo -n '__fish_use_subcommand' -a setup -d 'Setup exam environment'",
         "complete -c ckad-dojo -n '__fish_use_subcommand' -a score -d 'Score exam answers'",
         "complete -c ckad-dojo -n '__fish_use_subcommand' -a cleanup -d 'Cleanup exam resources'",
+        "complete -c ckad-dojo -n '__fish_use_subcommand' -a pool -d 'Manage warm exam environments'",
+        "complete -c ckad-dojo -n '__fish_use_subcommand' -a images -d 'Cache and preload exam images'",
         "complete -c ckad-dojo -n '__fish_use_subcommand' -a list -d 'List available exams'",
         "complete -c ckad-dojo -n '__fish_use_subcommand' -a info -d 'Show exam details'",
         "complete -c ckad-dojo -n '__fish_use_subcommand' -a status -d 'Show environment status'",
@@ -887,6 +1263,12 @@ def generate_fish_completion() -> str:
         "complete -c ckad-dojo -n '__fish_seen_subcommand_from exam' -a start -d 'Start an exam session'",
         "complete -c ckad-dojo -n '__fish_seen_subcommand_from exam' -a stop -d 'Stop current exam session'",
         "",
+        "# Pool actions",
+        "complete -c ckad-dojo -n '__fish_seen_subcommand_from pool' -a 'fill release status drain' -d 'Pool action'",
+        "",
+        "# Images actions",
+        "complete -c ckad-dojo -n '__fish_seen_subcommand_from images' -a 'list pull load' -d 'Images action'",
+        "",
         "# Completion shells",
         "complete -c ckad-dojo -n '__fish_seen_subcommand_from completion' -a 'bash zsh fish' -d 'Shell type'",
         "",
@@ -894,7 +1276,7 @@ def generate_fish_completion() -> str:
     ]
 
     # Add exam ID completions
-    for cmd in ["setup", "score", "cleanup", "info", "status"]:
+    for cmd in ["setup", "score", "cleanup", "pool", "images", "info", "status"]:
         lines.append(f"complete -c ckad-dojo -n '__fish_seen_subcommand_from {cmd}' -s e -l exam -d 'Exam ID' -xa '{' '.join(exam_ids)}'")
 
     # Add exam ID for exam start
@@ -952,36 +1334,23 @@ def cmd_status(args) -> int:
     else:
         exams_to_check = discover_exams()
 
+    installed = detect_installed_exams()
+
     print()
     for eid in exams_to_check:
         config = parse_exam_config(eid)
         if not config:
             continue
 
-        # Try to detect if namespaces exist
-        try:
-            result = subprocess.run(
-                ["kubectl", "get", "namespaces", "-o", "name"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            existing_ns = set(result.stdout.strip().split("\n"))
-            existing_ns = {ns.replace("namespace/", "") for ns in existing_ns}
-
-            # Check first namespace from exam config
-            exam_name = config.get("EXAM_NAME", eid)
-            # Simple heuristic: check if common namespace exists
-            has_resources = any(
-                ns in existing_ns
-                for ns in ["neptune", "saturn", "andromeda", "olympus", "athena"]
-            )
-
-            status = color("SETUP", Colors.GREEN) if has_resources else color("NOT SETUP", Colors.YELLOW)
-            print(f"  {exam_name}: {status}")
-
-        except Exception:
-            print(f"  {eid}: {color('UNKNOWN', Colors.YELLOW)}")
+        exam_name = config.get("EXAM_NAME", eid)
+        if installed is None:
+            print(f"  {exam_name}: {color('UNKNOWN', Colors.YELLOW)}")
+        elif eid not in installed:
+            print(f"  {exam_name}: {color('NOT SETUP', Colors.YELLOW)}")
+        else:
+            found, total, percent = installed[eid]
+            state = color("SETUP", Colors.GREEN) if found == total else color("PARTIAL", Colors.YELLOW)
+            print(f"  {exam_name}: {state} ({percent}%, {found}/{total} namespaces)")
 
     print()
     return 0
@@ -993,6 +1362,18 @@ def cmd_status(args) -> int:
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser with all subcommands."""
+    import argparse
+
+    class VersionAction(argparse.Action):
+        """Custom version action that displays banner and description."""
+
+        def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help="Show version and exit"):
+            super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            show_version()
+            parser.exit()
+
     parser = argparse.ArgumentParser(
         prog="ckad-dojo",
         description="CKAD Exam Simulator - Centralized CLI for exam management",
@@ -1034,6 +1415,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable timer pause functionality"
     )
+    exam_start.add_argument(
+        "--no-pool",
+        action="store_true",
+        help="Always run a full setup instead of claiming a warm environment"
+    )
 
     exam_subparsers.add_parser("stop", help="Stop current exam session")
 
@@ -1052,6 +1438,17 @@ def create_parser() -> argparse.ArgumentParser:
         description="Calculate and display exam score"
     )
     score_parser.add_argument("-e", "--exam", help="Exam ID (e.g., ckad-simulation1)")
+    score_parser.add_argument(
+        "-w", "--watch",
+        action="store_true",
+        help="Keep a live score table, re-scoring questions as their resources or files change"
+    )
+    score_parser.add_argument(
+        "--interval",
+        type=int,
+        default=30,
+        help="Seconds between re-scores of questions no watch can see (default: 30)"
+    )
 
     # cleanup command
     cleanup_parser = subparsers.add_parser(
@@ -1061,6 +1458,32 @@ def create_parser() -> argparse.ArgumentParser:
     )
     cleanup_parser.add_argument("-e", "--exam", help="Exam ID (e.g., ckad-simulation1)")
 
+    # pool command
+    pool_parser = subparsers.add_parser(
+        "pool",
+        help="Manage warm exam environments",
+        description="Keep pre-provisioned exam environments (kind clusters) ready, "
+                    "so 'exam start' claims one instead of running the full setup"
+    )
+    pool_parser.add_argument("pool_action", choices=POOL_ACTIONS, help="Pool action")
+    pool_parser.add_argument("-e", "--exam", help="Exam ID (e.g., ckad-simulation1)")
+    pool_parser.add_argument(
+        "-n", "--size",
+        type=int,
+        help="Environments to keep ready per exam (remembered, default: 1)"
+    )
+
+    # images command
+    images_parser = subparsers.add_parser(
+        "images",
+        help="Cache and preload exam images",
+        description="Cache the images exams use (manifests, templates, Helm values) as "
+                    "local archives and side-load them into the cluster, so exam "
+                    "workloads never wait on an image pull"
+    )
+    images_parser.add_argument("images_action", choices=IMAGE_ACTIONS, help="Images action")
+    images_parser.add_argument("-e", "--exam", help="Exam ID (default: all exams for list/pull)")
+
     # list command
     subparsers.add_parser(
         "list",
@@ -1128,11 +1551,21 @@ Installation instructions:
 
 def main() -> int:
     """Main entry point for the CLI."""
+    # Tab completion: exam IDs are answered without building the parser,
+    # anything else goes through argcomplete (which exits when done)
+    if "_ARGCOMPLETE" in os.environ:
+        if complete_exam_id():
+            return 0
+        import argcomplete
+        parser = create_parser()
+        set_exam_completers(parser)
+        argcomplete.autocomplete(parser)
+
     # Setup signal handler
+    import signal
     signal.signal(signal.SIGINT, signal_handler)
 
     parser = create_parser()
-    argcomplete.autocomplete(parser)
     args = parser.parse_args()
 
     # Handle --no-color
@@ -1169,6 +1602,12 @@ def main() -> int:
     elif args.command == "cleanup":
         return cmd_cleanup(args)
 
+    elif args.command == "pool":
+        return cmd_pool(args)
+
+    elif args.command == "images":
+        return cmd_images(args)
+
     elif args.command == "list":
         return cmd_list(args)
 
@@ -9,6 +9,7 @@ SCRIPT_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/lib" && pwd)"
 source "$SCRIPT_LIB_DIR/common.sh"
 source "$SCRIPT_LIB_DIR/setup-functions.sh"
 source "$SCRIPT_LIB_DIR/timer.sh"
+source "$SCRIPT_LIB_DIR/phases.sh"
 
 # Show help
 show_help() {
@@ -31,6 +32,9 @@ show_help() {
 	echo "  4. Delete all exam namespaces"
 	echo "  5. Remove ./exam/course/ directory"
 	echo "  6. Stop and remove local Docker registry"
+	echo "  7. Delete the cluster claimed from the warm pool, if any"
+	echo ""
+	echo "Independent steps run concurrently; a per-step timing report is printed at the end."
 	echo ""
 	echo "WARNING: This will delete all exam resources!"
 }
@@ -40,13 +44,10 @@ list_exams() {
 	echo ""
 	echo "Available Exams:"
 	echo "────────────────────────────────────────────────────────────────"
-	for exam_dir in "$EXAMS_DIR"/*/; do
-		if [ -d "$exam_dir" ] && [ -f "$exam_dir/exam.conf" ]; then
-			source "$exam_dir/exam.conf"
-			local exam_id=$(basename "$exam_dir")
-			printf "  %-25s %s\n" "$exam_id" "$EXAM_NAME"
-		fi
-	done
+	local exam_id name _
+	while IFS=$'\t' read -r exam_id name _; do
+		printf "  %-25s %s\n" "$exam_id" "$name"
+	done < <(exam_index_rows)
 	echo ""
 }
 
@@ -145,51 +146,45 @@ main() {
 		print_success "Timer stopped"
 	fi
 
-	# Step 1: Cleanup Helm releases (before namespace deletion)
-	cleanup_helm
-
-	# Step 2: Clean up resources in default namespace
-	cleanup_default_namespace
-
-	# Step 3: Delete namespaces
-	cleanup_namespaces
-
-	# Step 4: Clean up PersistentVolumes (cluster-scoped)
-	cleanup_persistent_volumes
-
-	# Step 5: Clean up custom StorageClasses (cluster-scoped)
-	cleanup_storage_classes
+	# Reset timer state
+	timer_reset 2>/dev/null || true
 
-	# Step 6: Remove exam directories
+	# Cleanup phases: cluster, filesystem and Docker work run side by side,
+	# dependencies only keep the steps that touch the same objects in order
+	phase_add helm cleanup_helm
+	phase_add default-namespace cleanup_default_namespace
+	phase_add namespaces cleanup_namespaces helm
+	phase_add persistent-volumes cleanup_persistent_volumes namespaces
+	phase_add storage-classes cleanup_storage_classes persistent-volumes
+	phase_add namespace-wait wait_for_namespace_deletion namespaces
 	if [ "$KEEP_DIRS" = false ]; then
-		cleanup_directories
+		phase_add directories cleanup_directories
 	else
 		print_section "Keeping exam directories (--keep-dirs)"
 	fi
-
-	# Step 7: Stop registry
 	if [ "$KEEP_REGISTRY" = false ]; then
-		cleanup_registry
+		phase_add registry cleanup_registry
+		phase_add docker-containers cleanup_docker_containers
+		phase_add docker-images cleanup_docker_images docker-containers registry
 	else
 		print_section "Keeping local registry (--keep-registry)"
+		phase_add docker-containers cleanup_docker_containers
+		phase_add docker-images cleanup_docker_images docker-containers
 	fi
 
-	# Step 8: Clean up exam Docker containers
-	cleanup_docker_containers
-
-	# Step 9: Clean up exam Docker images (localhost:5000/*)
-	cleanup_docker_images
-
-	# Step 10: Reset timer state
-	timer_reset 2>/dev/null || true
+	phase_run_all || true
 
-	# Wait for namespace deletion
-	wait_for_namespace_deletion
+	# A cluster claimed from the warm pool is deleted, restoring the previous context
+	if ls "${CKAD_POOL_DIR:-$PROJECT_DIR/.cache/pool}/$CURRENT_EXAM_ID"/*.claimed &>/dev/null; then
+		bash "$SCRIPT_DIR/ckad-pool.sh" release -e "$CURRENT_EXAM_ID" || true
+	fi
 
 	# Summary
 	local end_time=$(date +%s)
 	local duration=$((end_time - start_time))
 
+	echo ""
+	phase_report
 	echo ""
 	print_footer
 	echo ""
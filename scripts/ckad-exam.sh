@@ -78,33 +78,20 @@ list_exams() {
 	echo -e "${BLUE}Available Exams:${NC}"
 	echo "───────────────────────────────────────────────────────────────────"
 
-	for exam_dir in "$EXAMS_DIR"/*/; do
-		if [ -d "$exam_dir" ] && [ -f "$exam_dir/exam.conf" ]; then
-			source "$exam_dir/exam.conf"
-			local exam_id=$(basename "$exam_dir")
-			printf "  %-25s %s\n" "$exam_id" "$EXAM_NAME"
-			printf "    Duration: %d min | Questions: %d | Points: %d | Pass: %d%%\n" \
-				"$EXAM_DURATION" "$TOTAL_QUESTIONS" "$TOTAL_POINTS" "$PASSING_PERCENTAGE"
-			echo ""
-		fi
-	done
-}
-
-# Get array of available exams
-get_available_exams() {
-	local exams=()
-	for exam_dir in "$EXAMS_DIR"/*/; do
-		if [ -d "$exam_dir" ] && [ -f "$exam_dir/exam.conf" ]; then
-			exams+=("$(basename "$exam_dir")")
-		fi
-	done
-	echo "${exams[@]}"
+	local exam_id name duration questions points passing
+	while IFS=$'\t' read -r exam_id name duration questions points passing; do
+		printf "  %-25s %s\n" "$exam_id" "$name"
+		printf "    Duration: %d min | Questions: %d | Points: %d | Pass: %d%%\n" \
+			"$duration" "$questions" "$points" "$passing"
+		echo ""
+	done < <(exam_index_rows)
 }
 
 # Interactive exam selection
 select_exam_interactive() {
-	local exams=($(get_available_exams))
-	local num_exams=${#exams[@]}
+	local rows=()
+	mapfile -t rows < <(exam_index_rows)
+	local num_exams=${#rows[@]}
 
 	if [ $num_exams -eq 0 ]; then
 		print_error "No exams found in $EXAMS_DIR"
@@ -117,12 +104,13 @@ select_exam_interactive() {
 	echo -e "${BLUE}╠═══════════════════════════════════════════════════════════════════╣${NC}"
 	echo -e "${BLUE}║${NC}"
 
-	local i=1
-	for exam_id in "${exams[@]}"; do
-		source "$EXAMS_DIR/$exam_id/exam.conf"
-		printf "${BLUE}║${NC}  ${CYAN}%d)${NC} %-20s - %s\n" $i "$exam_id" "$EXAM_NAME"
+	local i=1 exams=() row exam_id name duration questions points passing
+	for row in "${rows[@]}"; do
+		IFS=$'\t' read -r exam_id name duration questions points passing <<<"$row"
+		exams+=("$exam_id")
+		printf "${BLUE}║${NC}  ${CYAN}%d)${NC} %-20s - %s\n" $i "$exam_id" "$name"
 		printf "${BLUE}║${NC}     Duration: %d min | Questions: %d | Points: %d\n" \
-			"$EXAM_DURATION" "$TOTAL_QUESTIONS" "$TOTAL_POINTS"
+			"$duration" "$questions" "$points"
 		echo -e "${BLUE}║${NC}"
 		((i++))
 	done
@@ -145,43 +133,13 @@ select_exam_interactive() {
 	echo -e "${GREEN}Selected:${NC} $SELECTED_EXAM"
 }
 
-# Detect if another exam's resources exist in the cluster
+# Detect exams whose resources exist in the cluster
+# Prints "<exam_id> <percent>" per installed exam, best coverage first
 detect_existing_exam_resources() {
-	local target_exam=$1
-	local found_namespaces=()
-	local found_exam=""
-
-	# Check all available exams
-	for exam_dir in "$EXAMS_DIR"/*/; do
-		if [ -d "$exam_dir" ] && [ -f "$exam_dir/exam.conf" ]; then
-			local exam_id=$(basename "$exam_dir")
-
-			# Source exam config to get namespaces
-			source "$exam_dir/exam.conf"
-
-			# Check if any namespaces from this exam exist
-			local ns_count=0
-			for ns in "${EXAM_NAMESPACES[@]}"; do
-				if namespace_exists "$ns"; then
-					((++ns_count))
-					found_namespaces+=("$ns")
-				fi
-			done
-
-			# If we found namespaces and it's a different exam, record it
-			if [ $ns_count -gt 0 ]; then
-				found_exam="$exam_id"
-				break
-			fi
-		fi
+	local exam_id found total percent present
+	detect_installed_exams 2>/dev/null | while IFS=$'\t' read -r exam_id found total percent present; do
+		echo "$exam_id $percent"
 	done
-
-	if [ -n "$found_exam" ]; then
-		echo "$found_exam"
-		return 0
-	fi
-
-	return 1
 }
 
 # Offer cleanup if resources from another exam exist
@@ -197,18 +155,23 @@ check_and_offer_cleanup() {
 	echo ""
 	print_section "Checking for existing exam resources..."
 
-	local existing_exam
-	existing_exam=$(detect_existing_exam_resources "$target_exam") || true
+	local existing=() existing_exams=() exam_id percent
+	mapfile -t existing < <(detect_existing_exam_resources)
 
-	if [ -n "$existing_exam" ]; then
+	if [ ${#existing[@]} -gt 0 ]; then
 		echo ""
 		echo -e "${YELLOW}╔═══════════════════════════════════════════════════════════════════╗${NC}"
 		echo -e "${YELLOW}║${NC}                    EXISTING EXAM DETECTED                         ${YELLOW}║${NC}"
 		echo -e "${YELLOW}╠═══════════════════════════════════════════════════════════════════╣${NC}"
 		echo -e "${YELLOW}║${NC}"
-		echo -e "${YELLOW}║${NC}  Found resources from: ${CYAN}$existing_exam${NC}"
+		for exam_id in "${existing[@]}"; do
+			percent="${exam_id#* }"
+			exam_id="${exam_id%% *}"
+			existing_exams+=("$exam_id")
+			echo -e "${YELLOW}║${NC}  Found resources from: ${CYAN}$exam_id${NC} ($percent% of its namespaces)"
+		done
 		echo -e "${YELLOW}║${NC}"
-		if [ "$existing_exam" = "$target_exam" ]; then
+		if [ "${existing_exams[*]}" = "$target_exam" ]; then
 			echo -e "${YELLOW}║${NC}  This is the same exam you want to start."
 			echo -e "${YELLOW}║${NC}  You can continue with existing setup or cleanup first."
 		else
@@ -230,9 +193,11 @@ check_and_offer_cleanup() {
 			read -r -p "Enter your choice: " choice
 			case $choice in
 			1)
-				echo ""
-				echo -e "${CYAN}Running cleanup for $existing_exam...${NC}"
-				"$SCRIPT_DIR/ckad-cleanup.sh" -e "$existing_exam" -y
+				for exam_id in "${existing_exams[@]}"; do
+					echo ""
+					echo -e "${CYAN}Running cleanup for $exam_id...${NC}"
+					"$SCRIPT_DIR/ckad-cleanup.sh" -e "$exam_id" -y
+				done
 				echo ""
 				print_success "Cleanup completed!"
 				return 0
@@ -325,7 +290,7 @@ verify_prerequisites() {
 	fi
 
 	# Check cluster connection
-	if kubectl cluster-info &>/dev/null; then
+	if cluster_reachable; then
 		print_success "Kubernetes cluster accessible"
 	else
 		print_fail "Cannot connect to Kubernetes cluster"
@@ -0,0 +1,88 @@
+#!/bin/bash
+# ckad-images.sh - Offline image cache for exam workloads
+# Derives the images an exam uses, saves them as archives in a local cache and
+# side-loads them into the cluster, so exam workloads never wait on a pull
+
+set -e
+
+# Source library functions
+SCRIPT_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/lib" && pwd)"
+source "$SCRIPT_LIB_DIR/common.sh"
+source "$SCRIPT_LIB_DIR/setup-functions.sh"
+
+# Show help
+show_help() {
+	echo "Usage: $(basename "$0") COMMAND [OPTIONS]"
+	echo ""
+	echo "Manage the offline image cache of an exam ($IMAGE_CACHE_DIR)."
+	echo ""
+	echo "COMMANDS:"
+	echo "  list             List the images the exam uses and whether they are cached"
+	echo "  pull             Pull missing images and save them to the cache"
+	echo "  load             Side-load cached images into the cluster (kind, k3d, minikube,"
+	echo "                   Docker Desktop) and the local Docker daemon"
+	echo ""
+	echo "OPTIONS:"
+	echo "  -h, --help       Show this help message"
+	echo "  -e, --exam EXAM  Exam to manage (default: $DEFAULT_EXAM_ID)"
+	echo ""
+	echo "EXAMPLES:"
+	echo "  $(basename "$0") pull -e ckad-simulation2   # Cache images once, with network"
+	echo "  $(basename "$0") load -e ckad-simulation2   # Preload them into the cluster"
+}
+
+# List the exam's images with their cache state
+images_list() {
+	local image
+	print_section "Images used by $CURRENT_EXAM_ID"
+	for image in $(exam_images); do
+		if [ -f "$(image_archive "$image")" ]; then
+			printf "  %-45s %s\n" "$image" "cached"
+		else
+			printf "  %-45s %s\n" "$image" "not cached"
+		fi
+	done
+}
+
+# Parse arguments
+COMMAND=""
+SELECTED_EXAM="$DEFAULT_EXAM_ID"
+
+while [[ $# -gt 0 ]]; do
+	case $1 in
+	-h | --help)
+		show_help
+		exit 0
+		;;
+	-e | --exam)
+		SELECTED_EXAM="$2"
+		shift 2
+		;;
+	list | pull | load)
+		COMMAND="$1"
+		shift
+		;;
+	*)
+		print_error "Unknown option: $1"
+		show_help
+		exit 1
+		;;
+	esac
+done
+
+if [ -z "$COMMAND" ]; then
+	show_help
+	exit 1
+fi
+
+if ! exam_exists "$SELECTED_EXAM"; then
+	print_error "Exam not found: $SELECTED_EXAM"
+	exit 1
+fi
+load_exam "$SELECTED_EXAM"
+
+case $COMMAND in
+list) images_list ;;
+pull) images_pull ;;
+load) images_load ;;
+esac
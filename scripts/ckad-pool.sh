@@ -0,0 +1,327 @@
+#!/bin/bash
+# ckad-pool.sh - Warm pool of pre-provisioned exam environments
+# Keeps N kind clusters per exam fully set up, so starting an exam only has to
+# switch kubectl to a ready cluster instead of running the whole setup
+
+set -e
+
+# Source library functions
+SCRIPT_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/lib" && pwd)"
+source "$SCRIPT_LIB_DIR/common.sh"
+source "$SCRIPT_LIB_DIR/setup-functions.sh"
+
+# Pool state: one file per environment, named <cluster>.<state>
+# (provisioning, ready or claimed), plus <cluster>.kubeconfig, <cluster>.kind.yaml
+# and <cluster>.log.
+# A claim also saves the kubectl context it replaced in <cluster>.context.
+# The size given to fill is remembered in .size so background refills keep it.
+POOL_DIR="${CKAD_POOL_DIR:-$PROJECT_DIR/.cache/pool}"
+POOL_SIZE="${CKAD_POOL_SIZE:-1}"
+POOL_SIZE_ARG=""
+
+# Pool clusters resolve localhost:5000 to the registry container over the kind
+# network, so images pushed by the candidate can be pulled by exam workloads
+POOL_KIND_CONFIG='kind: Cluster
+apiVersion: kind.x-k8s.io/v1alpha4
+containerdConfigPatches:
+- |-
+  [plugins."io.containerd.grpc.v1.cri".registry.mirrors."localhost:5000"]
+    endpoint = ["http://registry:5000"]'
+POOL_KIND_NETWORK="kind"
+
+# Show help
+show_help() {
+	echo "Usage: $(basename "$0") COMMAND [OPTIONS]"
+	echo ""
+	echo "Manage a warm pool of pre-provisioned exam environments (kind clusters)."
+	echo ""
+	echo "COMMANDS:"
+	echo "  fill             Provision environments until the pool holds SIZE per exam"
+	echo "  claim            Switch kubectl to a ready environment and prepare exam files"
+	echo "  release          Delete claimed environments and restore the previous kubectl context"
+	echo "  status           Show pooled environments"
+	echo "  drain            Delete pooled environments (ready and claimed)"
+	echo ""
+	echo "OPTIONS:"
+	echo "  -h, --help       Show this help message"
+	echo "  -e, --exam EXAM  Exam to manage (default: $DEFAULT_EXAM_ID)"
+	echo "  -n, --size N     Environments to keep ready, remembered per exam (default: $POOL_SIZE)"
+	echo ""
+	echo "EXAMPLES:"
+	echo "  $(basename "$0") fill -e ckad-simulation2 -n 2   # Keep two warm environments"
+	echo "  $(basename "$0") claim -e ckad-simulation2       # Take one for an exam"
+	echo "  $(basename "$0") release -e ckad-simulation2     # Give it back after the exam"
+	echo "  $(basename "$0") drain -e ckad-simulation2       # Remove the pool"
+}
+
+# Print pooled cluster names of an exam in the given state
+# Usage: pool_envs <exam_id> <state>
+pool_envs() {
+	local file
+	for file in "$POOL_DIR/$1"/*."$2"; do
+		[ -f "$file" ] || continue
+		file=$(basename "$file")
+		echo "${file%.*}"
+	done
+}
+
+# Create one kind cluster and run the exam setup against it
+# Usage: pool_provision <exam_id> <cluster>
+pool_provision() {
+	local exam_id="$1"
+	local cluster="$2"
+	local dir="$POOL_DIR/$exam_id"
+	local kubeconfig="$dir/$cluster.kubeconfig"
+
+	touch "$dir/$cluster.provisioning"
+	echo "$POOL_KIND_CONFIG" >"$dir/$cluster.kind.yaml"
+	if kind create cluster --name "$cluster" --kubeconfig "$kubeconfig" \
+		--config "$dir/$cluster.kind.yaml" --wait 120s &&
+		KUBECONFIG="$kubeconfig" bash "$SCRIPT_DIR/ckad-setup.sh" -e "$exam_id" --cluster-only; then
+		mv "$dir/$cluster.provisioning" "$dir/$cluster.ready"
+	else
+		kind delete cluster --name "$cluster" &>/dev/null || true
+		rm -f "$dir/$cluster.provisioning" "$dir/$cluster.kind.yaml" "$kubeconfig"
+		return 1
+	fi
+}
+
+# Provision environments until SIZE are ready or being provisioned
+pool_fill() {
+	local exam_id="$1"
+	local dir="$POOL_DIR/$exam_id"
+	mkdir -p "$dir"
+
+	if [ -n "$POOL_SIZE_ARG" ]; then
+		echo "$POOL_SIZE_ARG" >"$dir/.size"
+	fi
+	if [ -f "$dir/.size" ]; then
+		POOL_SIZE=$(cat "$dir/.size")
+	fi
+
+	if ! command_exists kind; then
+		print_error "kind is not installed (required for the warm pool)"
+		return 1
+	fi
+
+	# One fill per exam at a time; a concurrent fill just leaves
+	if ! mkdir "$dir/.fill.lock" 2>/dev/null; then
+		print_skip "Pool fill already running for $exam_id"
+		return 0
+	fi
+	trap "rmdir '$dir/.fill.lock' 2>/dev/null" EXIT
+
+	local have
+	have=$(($(pool_envs "$exam_id" ready | wc -l) + $(pool_envs "$exam_id" provisioning | wc -l)))
+	local missing=$((POOL_SIZE - have))
+
+	print_section "Filling pool for $exam_id ($have of $POOL_SIZE warm)..."
+	if [ $missing -le 0 ]; then
+		print_skip "Pool already full"
+		return 0
+	fi
+
+	# Environments are independent, provision them side by side
+	local i cluster pids=() clusters=()
+	for i in $(seq 1 "$missing"); do
+		cluster="ckad-pool-${exam_id#ckad-}-$(date +%s)-$i"
+		pool_provision "$exam_id" "$cluster" >"$dir/$cluster.log" 2>&1 &
+		pids+=($!)
+		clusters+=("$cluster")
+	done
+
+	local failed=0
+	for i in "${!pids[@]}"; do
+		if wait "${pids[$i]}"; then
+			print_success "Warm environment ready: ${clusters[$i]}"
+		else
+			print_fail "Failed to provision ${clusters[$i]} (see $dir/${clusters[$i]}.log)"
+			((++failed))
+		fi
+	done
+	return $failed
+}
+
+# Take a ready environment: switch kubectl to it and prepare the local exam files
+pool_claim() {
+	local exam_id="$1"
+	local dir="$POOL_DIR/$exam_id"
+	local cluster claimed=""
+
+	# mv is atomic, so two claims can never take the same environment
+	for cluster in $(pool_envs "$exam_id" ready); do
+		if mv "$dir/$cluster.ready" "$dir/$cluster.claimed" 2>/dev/null; then
+			claimed="$cluster"
+			break
+		fi
+	done
+
+	if [ -z "$claimed" ]; then
+		print_error "No warm environment ready for $exam_id"
+		return 1
+	fi
+
+	# Point the default kubeconfig at the claimed cluster (sets the current context);
+	# the replaced context is saved so release can switch back to it
+	local previous
+	previous=$(kubectl config current-context 2>/dev/null || true)
+	echo "$previous" >"$dir/$claimed.context"
+	if ! kind export kubeconfig --name "$claimed" 2>/dev/null; then
+		mv "$dir/$claimed.claimed" "$dir/$claimed.ready"
+		rm -f "$dir/$claimed.context"
+		print_error "Failed to switch kubectl to $claimed"
+		return 1
+	fi
+	print_success "Claimed warm environment: $claimed"
+	print_success "kubectl context switched from ${previous:-(none)} to kind-$claimed"
+	echo "  Run 'ckad-dojo cleanup' or '$(basename "$0") release -e $exam_id' to switch back"
+
+	# Cluster side is done; only the per-machine parts of setup remain
+	load_exam "$exam_id"
+	setup_directories
+	setup_templates
+	setup_registry || true
+	pool_connect_registry
+}
+
+# Attach the local registry container to the kind network of the pool clusters
+pool_connect_registry() {
+	if ! docker_container_running "registry"; then
+		print_skip "Local registry not running: registry questions need it on pooled clusters"
+		return 0
+	fi
+	if docker network inspect "$POOL_KIND_NETWORK" -f '{{range .Containers}}{{.Name}} {{end}}' 2>/dev/null |
+		grep -qw registry; then
+		return 0
+	fi
+	if docker network connect "$POOL_KIND_NETWORK" registry 2>/dev/null; then
+		print_success "Local registry reachable from the cluster as localhost:5000"
+	else
+		print_skip "Could not connect the registry to the $POOL_KIND_NETWORK network: images pushed to localhost:5000 cannot be pulled by the cluster"
+	fi
+}
+
+# Delete one claimed environment, switching kubectl back to the context the
+# claim replaced if it is still on the claimed cluster
+# Usage: pool_release_env <exam_id> <cluster>
+pool_release_env() {
+	local exam_id="$1"
+	local cluster="$2"
+	local dir="$POOL_DIR/$exam_id"
+	local previous=""
+
+	[ -f "$dir/$cluster.context" ] && previous=$(cat "$dir/$cluster.context")
+	if [ "$(kubectl config current-context 2>/dev/null)" = "kind-$cluster" ]; then
+		if [ -n "$previous" ] && kubectl config use-context "$previous" &>/dev/null; then
+			print_success "kubectl context switched back to $previous"
+		else
+			kubectl config unset current-context &>/dev/null || true
+			print_success "kubectl context kind-$cluster unset"
+		fi
+	fi
+	# Also removes the kind-<cluster> entry from the default kubeconfig
+	kind delete cluster --name "$cluster" &>/dev/null || true
+	rm -f "$dir/$cluster".*
+	print_success "Deleted $cluster"
+}
+
+# Delete the claimed environments of one exam
+pool_release() {
+	local exam_id="$1"
+	local cluster found=0
+
+	print_section "Releasing claimed environments for $exam_id..."
+	for cluster in $(pool_envs "$exam_id" claimed); do
+		pool_release_env "$exam_id" "$cluster"
+		((++found))
+	done
+	if [ $found -eq 0 ]; then
+		print_skip "No claimed environments"
+	fi
+}
+
+# Show pooled environments of one exam
+pool_status() {
+	local exam_id="$1"
+	local state cluster found=0
+
+	print_section "Warm pool for $exam_id"
+	for state in ready provisioning claimed; do
+		for cluster in $(pool_envs "$exam_id" "$state"); do
+			printf "  %-45s %s\n" "$cluster" "$state"
+			((++found))
+		done
+	done
+	if [ $found -eq 0 ]; then
+		print_skip "No pooled environments"
+	fi
+}
+
+# Delete ready and claimed environments of one exam
+pool_drain() {
+	local exam_id="$1"
+	local dir="$POOL_DIR/$exam_id"
+	local cluster
+
+	print_section "Draining warm pool for $exam_id..."
+	for cluster in $(pool_envs "$exam_id" ready); do
+		kind delete cluster --name "$cluster" &>/dev/null || true
+		rm -f "$dir/$cluster".*
+		print_success "Deleted $cluster"
+	done
+	for cluster in $(pool_envs "$exam_id" claimed); do
+		pool_release_env "$exam_id" "$cluster"
+	done
+}
+
+# Parse arguments
+COMMAND=""
+SELECTED_EXAM="$DEFAULT_EXAM_ID"
+
+while [[ $# -gt 0 ]]; do
+	case $1 in
+	-h | --help)
+		show_help
+		exit 0
+		;;
+	-e | --exam)
+		SELECTED_EXAM="$2"
+		shift 2
+		;;
+	-n | --size)
+		if ! [[ "$2" =~ ^[0-9]+$ ]]; then
+			print_error "Pool size must be a non-negative integer: $2"
+			exit 1
+		fi
+		POOL_SIZE_ARG="$2"
+		shift 2
+		;;
+	fill | claim | release | status | drain)
+		COMMAND="$1"
+		shift
+		;;
+	*)
+		print_error "Unknown option: $1"
+		show_help
+		exit 1
+		;;
+	esac
+done
+
+if [ -z "$COMMAND" ]; then
+	show_help
+	exit 1
+fi
+
+if ! exam_exists "$SELECTED_EXAM"; then
+	print_error "Exam not found: $SELECTED_EXAM"
+	exit 1
+fi
+
+case $COMMAND in
+fill) pool_fill "$SELECTED_EXAM" ;;
+claim) pool_claim "$SELECTED_EXAM" ;;
+release) pool_release "$SELECTED_EXAM" ;;
+status) pool_status "$SELECTED_EXAM" ;;
+drain) pool_drain "$SELECTED_EXAM" ;;
+esac
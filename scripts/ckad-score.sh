@@ -7,6 +7,7 @@ set -e
 # Source library functions
 SCRIPT_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/lib" && pwd)"
 source "$SCRIPT_LIB_DIR/common.sh"
+source "$SCRIPT_LIB_DIR/snapshot.sh"
 
 # Show help
 show_help() {
@@ -17,15 +18,22 @@ show_help() {
 	echo "OPTIONS:"
 	echo "  -h, --help         Show this help message"
 	echo "  -e, --exam EXAM    Select exam to score (default: $DEFAULT_EXAM_ID)"
-	echo "  -q, --question N   Score a specific question (1-22, p1, p2)"
+	echo "  -q, --question N   Score specific questions (1-22, p1, p2; comma-separated)"
 	echo "  -s, --summary      Show summary only (no details)"
+	echo "  -j, --jobs N       Score N questions at a time (default: 1)"
+	echo "  --format FORMAT    Output format: text (default) or ndjson"
+	echo "  --snapshot         Read the cluster once and score against the snapshot"
 	echo "  --list             List available exams"
 	echo ""
 	echo "EXAMPLES:"
 	echo "  $(basename "$0")                      # Score all questions (default exam)"
 	echo "  $(basename "$0") -e ckad-simulation1  # Score specific exam"
 	echo "  $(basename "$0") -q 5                 # Score only question 5"
+	echo "  $(basename "$0") -q 2,7,p1 -j 3       # Score three questions in parallel"
 	echo "  $(basename "$0") -s                   # Show summary only"
+	echo "  $(basename "$0") -j 8                 # Score 8 questions in parallel"
+	echo "  $(basename "$0") --snapshot           # Score with one bulk read per namespace"
+	echo "  $(basename "$0") --format ndjson      # One JSON record per criterion and question"
 }
 
 # List available exams
@@ -33,21 +41,30 @@ list_exams() {
 	echo ""
 	echo "Available Exams:"
 	echo "────────────────────────────────────────────────────────────────"
-	for exam_dir in "$EXAMS_DIR"/*/; do
-		if [ -d "$exam_dir" ] && [ -f "$exam_dir/exam.conf" ]; then
-			source "$exam_dir/exam.conf"
-			local exam_id=$(basename "$exam_dir")
-			printf "  %-25s %s\n" "$exam_id" "$EXAM_NAME"
-			printf "    Questions: %d | Points: %d | Pass: %d%%\n" \
-				"$TOTAL_QUESTIONS" "$TOTAL_POINTS" "$PASSING_PERCENTAGE"
-		fi
-	done
+	local exam_id name duration questions points passing
+	while IFS=$'\t' read -r exam_id name duration questions points passing; do
+		printf "  %-25s %s\n" "$exam_id" "$name"
+		printf "    Questions: %d | Points: %d | Pass: %d%%\n" "$questions" "$points" "$passing"
+	done < <(exam_index_rows)
 	echo ""
 }
 
+# Exit with usage when an option is missing its value
+# Usage: require_value <option> <value>
+require_value() {
+	if [ -z "$2" ] || [[ "$2" == -* ]]; then
+		print_error "Option $1 requires a value"
+		show_help
+		exit 1
+	fi
+}
+
 # Parse arguments
 SPECIFIC_QUESTION=""
 SUMMARY_ONLY=false
+SNAPSHOT_MODE=false
+SCORE_JOBS=1
+OUTPUT_FORMAT="text"
 SELECTED_EXAM="$DEFAULT_EXAM_ID"
 
 while [[ $# -gt 0 ]]; do
@@ -57,10 +74,12 @@ while [[ $# -gt 0 ]]; do
 		exit 0
 		;;
 	-e | --exam)
+		require_value "$1" "${2:-}"
 		SELECTED_EXAM="$2"
 		shift 2
 		;;
 	-q | --question)
+		require_value "$1" "${2:-}"
 		SPECIFIC_QUESTION="$2"
 		shift 2
 		;;
@@ -68,6 +87,25 @@ while [[ $# -gt 0 ]]; do
 		SUMMARY_ONLY=true
 		shift
 		;;
+	-j | --jobs)
+		require_value "$1" "${2:-}"
+		if ! [[ "$2" =~ ^[1-9][0-9]*$ ]]; then
+			print_error "Job count must be a positive integer: $2"
+			show_help
+			exit 1
+		fi
+		SCORE_JOBS="$2"
+		shift 2
+		;;
+	--format)
+		require_value "$1" "${2:-}"
+		OUTPUT_FORMAT="$2"
+		shift 2
+		;;
+	--snapshot)
+		SNAPSHOT_MODE=true
+		shift
+		;;
 	--list)
 		list_exams
 		exit 0
@@ -80,6 +118,137 @@ while [[ $# -gt 0 ]]; do
 	esac
 done
 
+case "$OUTPUT_FORMAT" in
+text | ndjson) ;;
+*)
+	print_error "Unknown output format: $OUTPUT_FORMAT"
+	show_help
+	exit 1
+	;;
+esac
+
+# Directory holding pre-computed question output (parallel mode only)
+SCORE_RESULTS_DIR=""
+
+# Remove temporary scoring state on exit
+cleanup_scoring() {
+	snapshot_clear
+	if [ -n "$SCORE_RESULTS_DIR" ]; then
+		rm -rf "$SCORE_RESULTS_DIR"
+	fi
+}
+
+# Run one scoring function, falling back to 0/0 if it fails
+# Usage: run_score_function <function>
+run_score_function() {
+	"$1" 2>/dev/null || echo "0/0"
+}
+
+# Score the given functions concurrently, at most SCORE_JOBS at a time.
+# Each function's output is stored in SCORE_RESULTS_DIR/<function>.
+# Usage: score_in_parallel <function>...
+score_in_parallel() {
+	SCORE_RESULTS_DIR=$(mktemp -d "${TMPDIR:-/tmp}/ckad-score.XXXXXX")
+
+	local func
+	for func in "$@"; do
+		while [ "$(jobs -rp | wc -l)" -ge "$SCORE_JOBS" ]; do
+			wait -n || true
+		done
+		run_score_function "$func" >"$SCORE_RESULTS_DIR/$func" &
+	done
+	wait
+}
+
+# Print the output of a scoring function, using the parallel result if present
+# Usage: score_output <function>
+score_output() {
+	if [ -n "$SCORE_RESULTS_DIR" ] && [ -f "$SCORE_RESULTS_DIR/$1" ]; then
+		cat "$SCORE_RESULTS_DIR/$1"
+	else
+		run_score_function "$1"
+	fi
+}
+
+# Escape a string for use inside a JSON string literal
+json_escape() {
+	local value="$1"
+	value="${value//\\/\\\\}"
+	value="${value//\"/\\\"}"
+	value="${value//$'\t'/\\t}"
+	value="${value//$'\r'/}"
+	printf '%s' "$value"
+}
+
+# Print one question's result as NDJSON: a record per criterion, then the question
+# Usage: emit_question_ndjson <id> <preview> <scored> <max_points> <output>
+emit_question_ndjson() {
+	local id="$1" preview="$2" scored="$3" max_points="$4" output="$5"
+	local topic="" line
+
+	while IFS= read -r line; do
+		line="${line#"${line%%[![:space:]]*}"}"
+		case "$line" in
+		"Question "*"|"*)
+			if [ -z "$topic" ]; then
+				topic="${line#*|}"
+				topic="${topic# }"
+			fi
+			;;
+		"✓ "*)
+			printf '{"type":"criterion","question":"%s","passed":true,"description":"%s"}\n' \
+				"$id" "$(json_escape "${line#✓ }")"
+			;;
+		"✗ "*)
+			printf '{"type":"criterion","question":"%s","passed":false,"description":"%s"}\n' \
+				"$id" "$(json_escape "${line#✗ }")"
+			;;
+		esac
+	done <<<"$output"
+
+	if [ -z "$topic" ]; then
+		topic="Question ${id#P}"
+		[ "$preview" = true ] && topic="Preview $topic"
+	fi
+	printf '{"type":"question","question":"%s","topic":"%s","score":%d,"max_score":%d,"preview":%s}\n' \
+		"$id" "$(json_escape "$topic")" "$scored" "$max_points" "$preview"
+}
+
+# Extract "scored max" from the final "score/total" line of a question's output
+# Usage: parse_score_line <output>
+parse_score_line() {
+	local last_line scored max_points
+	last_line=$(echo "$1" | tail -1)
+	scored=$(echo "$last_line" | cut -d'/' -f1)
+	max_points=$(echo "$last_line" | cut -d'/' -f2)
+
+	# Handle cases where scoring fails
+	if [ -z "$scored" ] || ! [[ "$scored" =~ ^[0-9]+$ ]]; then
+		scored=0
+	fi
+	if [ -z "$max_points" ] || ! [[ "$max_points" =~ ^[0-9]+$ ]]; then
+		max_points=0
+	fi
+	echo "$scored $max_points"
+}
+
+# Score a single question (-q)
+# Usage: score_single_question <function> <id> <preview>
+score_single_question() {
+	if [ "$OUTPUT_FORMAT" = "ndjson" ]; then
+		local output scored max_points
+		output=$(score_output "$1")
+		read -r scored max_points <<<"$(parse_score_line "$output")"
+		emit_question_ndjson "$2" "$3" "$scored" "$max_points" "$output"
+	elif [ -n "$SCORE_RESULTS_DIR" ]; then
+		echo ""
+		score_output "$1"
+	else
+		echo ""
+		"$1"
+	fi
+}
+
 # Main scoring function
 main() {
 	local total_score=0
@@ -89,7 +258,7 @@ main() {
 	# Load exam configuration
 	if ! load_exam "$SELECTED_EXAM"; then
 		print_error "Failed to load exam: $SELECTED_EXAM"
-		echo "Use --list to see available exams."
+		echo "Use --list to see available exams." >&2
 		exit 1
 	fi
 
@@ -101,113 +270,153 @@ main() {
 		source "$SCRIPT_LIB_DIR/scoring-functions.sh"
 	fi
 
-	print_header "CKAD Exam Simulator - Scoring"
-	echo ""
-	echo -e "Exam:        ${CYAN}$EXAM_NAME${NC}"
-	echo -e "Exam ID:     ${CYAN}$CURRENT_EXAM_ID${NC}"
-	echo ""
+	if [ "$OUTPUT_FORMAT" = "ndjson" ]; then
+		# Structured output: plain ✓/✗ markers, no colour codes
+		RED="" GREEN="" YELLOW="" BLUE="" CYAN="" NC="" BOLD=""
+	else
+		print_header "CKAD Exam Simulator - Scoring"
+		echo ""
+		echo -e "Exam:        ${CYAN}$EXAM_NAME${NC}"
+		echo -e "Exam ID:     ${CYAN}$CURRENT_EXAM_ID${NC}"
+		echo ""
+	fi
 
 	# Check kubectl connection
-	if ! kubectl cluster-info &>/dev/null; then
+	if ! cluster_reachable; then
 		print_error "Cannot connect to Kubernetes cluster. Check your kubeconfig."
 		exit 1
 	fi
 
+	trap cleanup_scoring EXIT
+
+	# Snapshot mode: read exam namespaces once, answer kubectl get from memory
+	if [ "$SNAPSHOT_MODE" = true ]; then
+		if ! snapshot_take default "${EXAM_NAMESPACES[@]}"; then
+			print_error "Could not snapshot the cluster, scoring against the live cluster"
+		fi
+	fi
+
 	# Array to store results for table display
 	declare -a results
 
-	# Score specific question or all
+	# Score specific questions (-q 5, -q 2,7,p1)
 	if [ -n "$SPECIFIC_QUESTION" ]; then
-		# Check if it's a preview question
-		if [[ "$SPECIFIC_QUESTION" =~ ^[pP][0-9]+$ ]]; then
-			local p_num="${SPECIFIC_QUESTION//[pP]/}"
-			if declare -f "score_preview_q$p_num" >/dev/null; then
-				echo ""
-				"score_preview_q$p_num"
-			else
-				print_error "Preview question $SPECIFIC_QUESTION not found"
-				exit 1
-			fi
-		# Check if it's a regular question
-		elif [[ "$SPECIFIC_QUESTION" =~ ^[0-9]+$ ]]; then
-			if [ "$SPECIFIC_QUESTION" -ge 1 ] && [ "$SPECIFIC_QUESTION" -le "$TOTAL_QUESTIONS" ]; then
-				if declare -f "score_q$SPECIFIC_QUESTION" >/dev/null; then
-					echo ""
-					"score_q$SPECIFIC_QUESTION"
+		local question specific_functions=() specific_ids=() specific_previews=()
+		for question in ${SPECIFIC_QUESTION//,/ }; do
+			# Check if it's a preview question
+			if [[ "$question" =~ ^[pP][0-9]+$ ]]; then
+				local p_num="${question//[pP]/}"
+				if declare -f "score_preview_q$p_num" >/dev/null; then
+					specific_functions+=("score_preview_q$p_num")
+					specific_ids+=("P$p_num")
+					specific_previews+=(true)
+				else
+					print_error "Preview question $question not found"
+					exit 1
+				fi
+			# Check if it's a regular question
+			elif [[ "$question" =~ ^[0-9]+$ ]]; then
+				if [ "$question" -ge 1 ] && [ "$question" -le "$TOTAL_QUESTIONS" ]; then
+					if declare -f "score_q$question" >/dev/null; then
+						specific_functions+=("score_q$question")
+						specific_ids+=("$question")
+						specific_previews+=(false)
+					else
+						print_error "Scoring function for question $question not found"
+						exit 1
+					fi
 				else
-					print_error "Scoring function for question $SPECIFIC_QUESTION not found"
+					print_error "Question $question out of range (1-$TOTAL_QUESTIONS)"
 					exit 1
 				fi
 			else
-				print_error "Question $SPECIFIC_QUESTION out of range (1-$TOTAL_QUESTIONS)"
+				print_error "Invalid question format: $question"
 				exit 1
 			fi
-		else
-			print_error "Invalid question format: $SPECIFIC_QUESTION"
-			exit 1
+		done
+
+		if [ "$SCORE_JOBS" -gt 1 ] && [ ${#specific_functions[@]} -gt 1 ]; then
+			score_in_parallel "${specific_functions[@]}"
 		fi
+		local i
+		for i in "${!specific_functions[@]}"; do
+			score_single_question "${specific_functions[$i]}" "${specific_ids[$i]}" "${specific_previews[$i]}"
+		done
 		exit 0
 	fi
 
 	# Score all questions
-	echo ""
-	echo "Scoring all questions..."
-	echo ""
-	echo "═══════════════════════════════════════════════════════════════════"
+	if [ "$OUTPUT_FORMAT" = "text" ]; then
+		echo ""
+		echo "Scoring all questions..."
+		echo ""
+		echo "═══════════════════════════════════════════════════════════════════"
+	fi
 
 	# Dynamic question scoring - discover available score functions
 	local total_qs="${TOTAL_QUESTIONS:-22}"
+	local preview_qs="${PREVIEW_QUESTIONS:-1}"
 
-	for qnum in $(seq 1 "$total_qs"); do
-		if declare -f "score_q$qnum" >/dev/null; then
-			echo ""
-			score_result=$("score_q$qnum" 2>/dev/null || echo "0/0")
-			echo "$score_result"
-			scored=$(echo "$score_result" | tail -1 | cut -d'/' -f1)
-			max_points=$(echo "$score_result" | tail -1 | cut -d'/' -f2)
-
-			# Handle cases where scoring fails
-			if [ -z "$scored" ] || ! [[ "$scored" =~ ^[0-9]+$ ]]; then
-				scored=0
+	# Parallel mode: run every question up front, then print in order below
+	if [ "$SCORE_JOBS" -gt 1 ]; then
+		local score_functions=()
+		for qnum in $(seq 1 "$total_qs"); do
+			if declare -f "score_q$qnum" >/dev/null; then
+				score_functions+=("score_q$qnum")
 			fi
-			if [ -z "$max_points" ] || ! [[ "$max_points" =~ ^[0-9]+$ ]]; then
-				max_points=0
+		done
+		for pnum in $(seq 1 "$preview_qs"); do
+			if declare -f "score_preview_q$pnum" >/dev/null; then
+				score_functions+=("score_preview_q$pnum")
 			fi
+		done
+		score_in_parallel "${score_functions[@]}"
+	fi
+
+	for qnum in $(seq 1 "$total_qs"); do
+		if declare -f "score_q$qnum" >/dev/null; then
+			score_result=$(score_output "score_q$qnum")
+			read -r scored max_points <<<"$(parse_score_line "$score_result")"
 
 			total_score=$((total_score + scored))
 			total_possible=$((total_possible + max_points))
 
 			results+=("Q$qnum|$scored/$max_points|Question $qnum")
 
-			echo "───────────────────────────────────────────────────────────────────"
-		else
+			if [ "$OUTPUT_FORMAT" = "ndjson" ]; then
+				emit_question_ndjson "$qnum" false "$scored" "$max_points" "$score_result"
+			else
+				echo ""
+				echo "$score_result"
+				echo "───────────────────────────────────────────────────────────────────"
+			fi
+		elif [ "$OUTPUT_FORMAT" = "text" ]; then
 			print_fail "No scoring function for question $qnum"
 		fi
 	done
 
 	# Preview questions
-	local preview_qs="${PREVIEW_QUESTIONS:-1}"
 	if [ "$preview_qs" -gt 0 ]; then
-		echo ""
-		echo "═══════════════════════════════════════════════════════════════════"
-		echo "PREVIEW QUESTIONS"
-		echo "═══════════════════════════════════════════════════════════════════"
+		if [ "$OUTPUT_FORMAT" = "text" ]; then
+			echo ""
+			echo "═══════════════════════════════════════════════════════════════════"
+			echo "PREVIEW QUESTIONS"
+			echo "═══════════════════════════════════════════════════════════════════"
+		fi
 
 		for pnum in $(seq 1 "$preview_qs"); do
 			if declare -f "score_preview_q$pnum" >/dev/null; then
-				echo ""
-				preview_result=$("score_preview_q$pnum" 2>/dev/null || echo "0/0")
-				echo "$preview_result"
-				preview_scored=$(echo "$preview_result" | tail -1 | cut -d'/' -f1)
-				preview_max=$(echo "$preview_result" | tail -1 | cut -d'/' -f2)
-				if [ -z "$preview_scored" ] || ! [[ "$preview_scored" =~ ^[0-9]+$ ]]; then
-					preview_scored=0
-				fi
-				if [ -z "$preview_max" ] || ! [[ "$preview_max" =~ ^[0-9]+$ ]]; then
-					preview_max=0
-				fi
+				preview_result=$(score_output "score_preview_q$pnum")
+				read -r preview_scored preview_max <<<"$(parse_score_line "$preview_result")"
 				# Preview questions don't count towards total
 				results+=("P$pnum|$preview_scored/$preview_max|Preview Question $pnum")
+
+				if [ "$OUTPUT_FORMAT" = "ndjson" ]; then
+					emit_question_ndjson "P$pnum" true "$preview_scored" "$preview_max" "$preview_result"
+				else
+					echo ""
+					echo "$preview_result"
+				fi
 			fi
 		done
 	fi
@@ -221,6 +430,15 @@ main() {
 	# Summary
 	local end_time=$(date +%s)
 	local duration=$((end_time - start_time))
+	local pass_threshold=${PASSING_PERCENTAGE:-66}
+
+	if [ "$OUTPUT_FORMAT" = "ndjson" ]; then
+		local passed=false
+		[ $percentage -ge $pass_threshold ] && passed=true
+		printf '{"type":"summary","score":%d,"max_score":%d,"percentage":%d,"passing_percentage":%d,"passed":%s,"duration":%d}\n' \
+			"$total_score" "$total_possible" "$percentage" "$pass_threshold" "$passed" "$duration"
+		return 0
+	fi
 
 	echo ""
 	echo ""
@@ -244,8 +462,6 @@ main() {
 	echo ""
 
 	# Color-coded final score based on exam passing percentage
-	local pass_threshold=${PASSING_PERCENTAGE:-66}
-
 	if [ $percentage -ge $pass_threshold ]; then
 		echo -e "${GREEN}TOTAL SCORE: $total_score / $total_possible ($percentage%)${NC}"
 		echo ""
@@ -20,17 +20,20 @@ show_help() {
 	echo "  -e, --exam EXAM    Select exam to set up (default: $DEFAULT_EXAM_ID)"
 	echo "  -q, --quiet        Suppress non-essential output"
 	echo "  --skip-registry    Skip local Docker registry setup"
+	echo "  --cluster-only     Only set up the cluster (no exam directories, templates or registry)"
+	echo "  --force            Re-apply everything, ignoring what the last setup recorded"
 	echo "  --list             List available exams"
 	echo ""
 	echo "This script will:"
 	echo "  1. Create exam namespaces"
-	echo "  2. Deploy pre-existing resources for exam questions"
+	echo "  2. Deploy pre-existing resources for exam questions (one server-side apply)"
 	echo "  3. Create exam directory structure at ./exam/course/"
 	echo "  4. Copy template files to exam directories"
 	echo "  5. Start local Docker registry at localhost:5000"
 	echo "  6. Configure Helm releases"
 	echo ""
-	echo "The script is idempotent - safe to run multiple times."
+	echo "The script is idempotent - safe to run multiple times. A rerun only applies"
+	echo "manifests and templates that changed or drifted since the last setup."
 	echo ""
 	echo "EXAMPLES:"
 	echo "  $(basename "$0")                          # Setup default exam"
@@ -43,21 +46,18 @@ list_exams() {
 	echo ""
 	echo "Available Exams:"
 	echo "────────────────────────────────────────────────────────────────"
-	for exam_dir in "$EXAMS_DIR"/*/; do
-		if [ -d "$exam_dir" ] && [ -f "$exam_dir/exam.conf" ]; then
-			source "$exam_dir/exam.conf"
-			local exam_id=$(basename "$exam_dir")
-			printf "  %-25s %s\n" "$exam_id" "$EXAM_NAME"
-			printf "    Duration: %d min | Questions: %d | Points: %d\n" \
-				"$EXAM_DURATION" "$TOTAL_QUESTIONS" "$TOTAL_POINTS"
-		fi
-	done
+	local exam_id name duration questions points passing
+	while IFS=$'\t' read -r exam_id name duration questions points passing; do
+		printf "  %-25s %s\n" "$exam_id" "$name"
+		printf "    Duration: %d min | Questions: %d | Points: %d\n" "$duration" "$questions" "$points"
+	done < <(exam_index_rows)
 	echo ""
 }
 
 # Parse arguments
 QUIET=false
 SKIP_REGISTRY=false
+CLUSTER_ONLY=false
 SELECTED_EXAM="$DEFAULT_EXAM_ID"
 
 while [[ $# -gt 0 ]]; do
@@ -78,6 +78,15 @@ while [[ $# -gt 0 ]]; do
 		SKIP_REGISTRY=true
 		shift
 		;;
+	--cluster-only)
+		CLUSTER_ONLY=true
+		SKIP_REGISTRY=true
+		shift
+		;;
+	--force)
+		SETUP_FORCE=true
+		shift
+		;;
 	--list)
 		list_exams
 		exit 0
@@ -118,24 +127,25 @@ main() {
 	fi
 	print_success "All prerequisites satisfied"
 
-	# Step 1: Create namespaces
-	if ! setup_namespaces; then
-		((errors++))
+	# Preload cached images so the first rollouts and Helm --wait never wait on a pull
+	if ! images_load; then
+		print_fail "Some cached images could not be side-loaded (non-critical)"
 	fi
 
-	# Step 2: Deploy pre-existing resources
-	setup_resources
-	local resource_errors=$?
+	# Steps 1-2: Create namespaces and deploy pre-existing resources (one bundle)
+	local resource_errors=0
+	setup_resources || resource_errors=$?
 	if [ $resource_errors -gt 0 ]; then
 		print_fail "$resource_errors resource(s) failed to deploy"
 		((errors += resource_errors))
 	fi
 
-	# Step 3: Create exam directories
-	setup_directories
-
-	# Step 4: Copy template files
-	setup_templates
+	# Steps 3-4: Create exam directories and copy template files
+	# (left to whoever claims a pooled cluster with --cluster-only)
+	if [ "$CLUSTER_ONLY" = false ]; then
+		setup_directories
+		setup_templates
+	fi
 
 	# Step 5: Start local registry (unless skipped)
 	if [ "$SKIP_REGISTRY" = false ]; then
@@ -151,12 +161,17 @@ main() {
 		print_fail "Helm setup encountered errors (non-critical)"
 	fi
 
-	# Wait for resources to be ready
-	print_section "Waiting for resources to be ready..."
-	sleep 3
-
 	# Step 7: Post-setup configurations (multi-revision deployments, etc.)
-	setup_post_resources
+	# Nothing applied means the cluster already matches the last setup, post steps included
+	if [ "$SETUP_APPLIED_COUNT" -gt 0 ]; then
+		# Steps watch their own resources until ready, no fixed wait needed
+		if ! setup_post_resources; then
+			print_fail "Post-setup encountered errors (non-critical)"
+		fi
+		setup_ledger_refresh
+	else
+		print_section "Skipping post-setup configurations (no resources changed)"
+	fi
 
 	# Summary
 	local end_time=$(date +%s)
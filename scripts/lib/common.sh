@@ -25,6 +25,12 @@ MANIFESTS_DIR="$PROJECT_DIR/manifests/setup"
 TEMPLATES_DIR="$PROJECT_DIR/templates"
 EXAM_DIR="$PROJECT_DIR/exam/course"
 
+# Label setup puts on every object it creates (value: exam ID)
+EXAM_OWNER_LABEL="ckad-dojo/exam"
+
+# Compiled exam index (scripts/lib/exam_index.py); its summary rows sit next to it as .tsv
+EXAM_INDEX_FILE="${CKAD_EXAM_INDEX:-$PROJECT_DIR/.cache/exam-index.json}"
+
 # ============================================================================
 # EXAM CONFIGURATION FUNCTIONS
 # ============================================================================
@@ -79,6 +85,27 @@ exam_exists() {
 	[ -d "$EXAMS_DIR/$exam_id" ] && [ -f "$EXAMS_DIR/$exam_id/exam.conf" ]
 }
 
+# Print one summary row per exam from the compiled exam index (tab-separated):
+# "<exam_id> <name> <duration> <questions> <points> <passing>"
+# The rows are read directly; the index is only rebuilt when exams/ or an exam.conf is newer.
+exam_index_rows() {
+	local rows="${EXAM_INDEX_FILE%.json}.tsv"
+	if [ ! -f "$rows" ] || [ "$EXAMS_DIR" -nt "$rows" ] ||
+		[ -n "$(find "$EXAMS_DIR" -mindepth 2 -maxdepth 2 -name exam.conf -newer "$rows" -print -quit)" ]; then
+		CKAD_EXAM_INDEX="$EXAM_INDEX_FILE" python3 "$SCRIPT_DIR/lib/exam_index.py" "$EXAMS_DIR"
+		return
+	fi
+	cat "$rows"
+}
+
+# List exams installed in the cluster with one namespace listing
+# Usage: detect_installed_exams [namespace...]   (namespaces given = no cluster call)
+# Prints "<exam_id> <found> <total> <percent> <namespace,...>" per exam (tab-separated),
+# best coverage first; returns 1 when no exam is installed.
+detect_installed_exams() {
+	python3 "$SCRIPT_DIR/lib/exam_detect.py" "$EXAMS_DIR" "$@"
+}
+
 # Print functions
 print_header() {
 	echo -e "${BLUE}╔════════════════════════════════════════════════════════════════╗${NC}"
@@ -110,6 +137,20 @@ print_error() {
 	echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
+# Check that the API server of the current kubectl context answers
+# One request through scripts/lib/kube_client.py (no kubectl, no API discovery);
+# contexts it cannot handle (exec plugins, auth providers, ...) and
+# CKAD_KUBE_CLIENT=kubectl are checked with kubectl cluster-info instead.
+cluster_reachable() {
+	local rc=0
+	python3 "$SCRIPT_DIR/lib/kube_client.py" check 2>/dev/null || rc=$?
+	if [ $rc -eq 2 ]; then
+		kubectl cluster-info &>/dev/null
+		return
+	fi
+	return $rc
+}
+
 # Check if a command exists
 command_exists() {
 	command -v "$1" &>/dev/null
@@ -138,7 +179,7 @@ check_prerequisites() {
 	fi
 
 	# Check kubectl connection
-	if ! kubectl cluster-info &>/dev/null; then
+	if ! cluster_reachable; then
 		print_error "Cannot connect to Kubernetes cluster. Check your kubeconfig."
 		return 1
 	fi
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Installed-exam detector shared by ckad-exam.sh and the ckad-dojo CLI.
+
+Builds a namespace -> exam index from the EXAM_NAMESPACES of every exam in the
+compiled exam index (exam_index.py), lists the cluster's namespaces with a
+single API request (kube_client.py, or `kubectl get namespaces`) and reports
+every exam that has at least one of its namespaces installed.
+
+Usage:
+    exam_detect.py <exams_dir> [namespace...]
+
+With namespaces given, they are matched instead of asking the cluster.
+Prints one tab-separated line per installed exam, best coverage first:
+    <exam_id> <found> <total> <percent> <namespace,...>
+
+Exit codes: 0 = at least one exam installed, 1 = none installed,
+3 = namespaces could not be listed.
+"""
+
+import subprocess
+import sys
+
+import exam_index
+import kube_client
+
+EXIT_NONE = 1
+EXIT_CLUSTER = 3
+
+
+class ClusterError(Exception):
+    """Raised when the cluster's namespaces cannot be listed."""
+
+
+def build_index(exams_dir: str) -> tuple:
+    """Map each namespace to the exams declaring it, and each exam to its namespace count."""
+    index = {}
+    totals = {}
+    for exam_id, exam in exam_index.load(exams_dir)["exams"].items():
+        namespaces = exam["config"].get("EXAM_NAMESPACES") or []
+        totals[exam_id] = len(namespaces)
+        for namespace in namespaces:
+            index.setdefault(namespace, []).append(exam_id)
+    return index, totals
+
+
+def cluster_namespaces() -> list:
+    """List the cluster's namespaces in one API call (kubectl if the kubeconfig needs it)."""
+    try:
+        return kube_client.KubeClient.from_kubeconfig().namespaces()
+    except kube_client.ClusterError as e:
+        raise ClusterError(str(e)) from None
+    except (kube_client.Unsupported, OSError):
+        pass
+
+    try:
+        result = subprocess.run(
+            ["kubectl", "get", "namespaces", "-o", "name"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ClusterError(str(e)) from None
+    if result.returncode != 0:
+        raise ClusterError(result.stderr.strip())
+    return [line.replace("namespace/", "", 1) for line in result.stdout.split()]
+
+
+def detect(exams_dir: str, namespaces: list) -> list:
+    """Return (exam_id, found, total, percent, namespaces) for every installed exam."""
+    index, totals = build_index(exams_dir)
+    found = {}
+    for namespace in namespaces:
+        for exam_id in index.get(namespace, ()):
+            found.setdefault(exam_id, []).append(namespace)
+
+    installed = []
+    for exam_id, present in found.items():
+        total = totals[exam_id]
+        installed.append((exam_id, len(present), total, len(present) * 100 // total, present))
+    installed.sort(key=lambda exam: (-exam[3], exam[0]))
+    return installed
+
+
+def main() -> int:
+    """Entry point."""
+    if len(sys.argv) < 2:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    exams_dir = sys.argv[1]
+    namespaces = sys.argv[2:]
+    if not namespaces:
+        try:
+            namespaces = cluster_namespaces()
+        except ClusterError as e:
+            print(f"Cannot list namespaces: {e}", file=sys.stderr)
+            return EXIT_CLUSTER
+
+    installed = detect(exams_dir, namespaces)
+    for exam_id, found, total, percent, present in installed:
+        print(f"{exam_id}\t{found}\t{total}\t{percent}\t{','.join(present)}")
+    return 0 if installed else EXIT_NONE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Compiled exam index shared by the ckad-dojo CLI, the web server and the scripts.
+
+Compiles every exams/<exam>/exam.conf (all assignments, arrays as lists), the
+question metadata of its questions file (ID, topic, points, namespace,
+resources) and the inputs each question's scoring function reads (score_deps.py,
+or SCORE_DEPENDS in exam.conf) into one JSON file, .cache/exam-index.json
+(CKAD_EXAM_INDEX).
+The index records the mtime and size of the files it was built from and is
+rebuilt only when one of them, or the set of exams, changes.
+
+Next to it, exam-index.tsv holds one summary row per exam for readers that
+should not parse JSON (bash, shell completion):
+    <exam_id> <name> <duration> <questions> <points> <passing>
+
+Usage:
+    exam_index.py <exams_dir> [--rebuild]
+
+Brings the index up to date and prints the summary rows.
+"""
+
+import json
+import os
+import re
+import shlex
+import sys
+import tempfile
+
+import score_deps
+
+INDEX_VERSION = 3
+
+ASSIGNMENT_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
+QUESTION_PATTERN = re.compile(r"^## Question (\d+|P\d+) \| (.+?)$")
+METADATA_PATTERN = re.compile(r"^\|\s*\*\*(.+?)\*\*\s*\|(.*?)\|")
+
+# Last index loaded per index file, revalidated against the sources on each load
+_loaded = {}
+
+
+def index_path(exams_dir) -> str:
+    """Location of the index: CKAD_EXAM_INDEX, or .cache/ next to exams/."""
+    default = os.path.join(os.path.dirname(os.path.abspath(exams_dir)), ".cache", "exam-index.json")
+    return os.environ.get("CKAD_EXAM_INDEX", default)
+
+
+def rows_path(index_file: str) -> str:
+    """Location of the summary rows written with an index."""
+    return os.path.splitext(index_file)[0] + ".tsv"
+
+
+def read_exam_conf(config_file: str) -> dict:
+    """Read the assignments of an exam.conf: strings, and lists for arrays."""
+    with open(config_file, encoding="utf-8") as f:
+        lines = iter(f.read().splitlines())
+
+    config = {}
+    for line in lines:
+        match = ASSIGNMENT_PATTERN.match(line.strip())
+        if not match:
+            continue
+        key, value = match.groups()
+        if value.startswith("("):
+            parts = [value[1:].split("#", 1)[0].rstrip()]
+            while not parts[-1].endswith(")"):
+                parts.append(next(lines, ")").split("#", 1)[0].rstrip())
+            body = " ".join(parts)
+            config[key] = shlex.split(body[:body.rindex(")")])
+        else:
+            config[key] = " ".join(shlex.split(value, comments=True))
+    return config
+
+
+def read_questions(questions_file: str) -> list:
+    """Read the metadata table of every question (no question text)."""
+    questions = []
+    try:
+        with open(questions_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return questions
+
+    for line in lines:
+        match = QUESTION_PATTERN.match(line)
+        if match:
+            questions.append({
+                "id": match.group(1),
+                "topic": match.group(2),
+                "points": 0,
+                "namespace": "",
+                "resources": "",
+            })
+            continue
+        match = METADATA_PATTERN.match(line)
+        if not match or not questions:
+            continue
+        key = match.group(1).lower()
+        value = match.group(2).strip()
+        if key == "points":
+            points = re.match(r"\d+", value)
+            questions[-1]["points"] = int(points.group()) if points else 0
+        elif key == "namespace":
+            questions[-1]["namespace"] = value.strip("`")
+        elif key == "resources":
+            questions[-1]["resources"] = value
+    return questions
+
+
+def _int(value, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def summarize(exam_id: str, config: dict, questions: list) -> dict:
+    """Headline numbers of an exam, defaulted from its questions where unset."""
+    return {
+        "name": config.get("EXAM_NAME") or exam_id,
+        "duration": _int(config.get("EXAM_DURATION"), 120),
+        "questions": _int(config.get("TOTAL_QUESTIONS"), len(questions)),
+        "points": _int(config.get("TOTAL_POINTS"), sum(q["points"] for q in questions)),
+        "passing": _int(config.get("PASSING_PERCENTAGE"), 66),
+    }
+
+
+def _signature(path: str) -> list:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def build(exams_dir) -> dict:
+    """Compile every exam under exams_dir."""
+    exams_dir = os.fspath(exams_dir)
+    index = {"version": INDEX_VERSION, "sources": {}, "exams": {}}
+    try:
+        index["sources"]["."] = _signature(exams_dir)
+        names = sorted(os.listdir(exams_dir))
+    except OSError:
+        return index
+
+    for exam_id in names:
+        config_file = os.path.join(exams_dir, exam_id, "exam.conf")
+        if not os.path.isfile(config_file):
+            continue
+        config = read_exam_conf(config_file)
+        questions_name = config.get("QUESTIONS_FILE") or "questions.md"
+        questions_file = os.path.join(exams_dir, exam_id, questions_name)
+        questions = read_questions(questions_file)
+        scoring_name = config.get("SCORING_FUNCTIONS") or "scoring-functions.sh"
+        scoring_file = os.path.join(exams_dir, exam_id, scoring_name)
+
+        index["sources"][exam_id] = _signature(os.path.dirname(config_file))
+        index["sources"][f"{exam_id}/exam.conf"] = _signature(config_file)
+        if os.path.isfile(questions_file):
+            index["sources"][f"{exam_id}/{questions_name}"] = _signature(questions_file)
+        if os.path.isfile(scoring_file):
+            index["sources"][f"{exam_id}/{scoring_name}"] = _signature(scoring_file)
+        dependencies = score_deps.extract(scoring_file)
+        try:
+            dependencies.update(score_deps.declared(config.get("SCORE_DEPENDS") or []))
+        except (AttributeError, ValueError) as e:
+            print(f"{exam_id}/exam.conf: {e}", file=sys.stderr)
+        index["exams"][exam_id] = {
+            "config": config,
+            "summary": summarize(exam_id, config, questions),
+            "questions": questions,
+            "dependencies": dependencies,
+        }
+    return index
+
+
+def is_stale(index: dict, exams_dir) -> bool:
+    """True when a file the index was built from changed, appeared or vanished."""
+    if index.get("version") != INDEX_VERSION:
+        return True
+    for name, signature in index.get("sources", {}).items():
+        try:
+            if _signature(os.path.join(exams_dir, name)) != signature:
+                return True
+        except OSError:
+            return True
+    return not index.get("sources")
+
+
+def _write_atomic(path: str, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".exam-index.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        os.unlink(tmp)
+        raise
+
+
+def write(index: dict, index_file: str) -> None:
+    """Write the index and its summary rows."""
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    _write_atomic(index_file, json.dumps(index, ensure_ascii=False, indent=1))
+    _write_atomic(rows_path(index_file), format_rows(index))
+
+
+def format_rows(index: dict) -> str:
+    """One tab-separated summary row per exam."""
+    rows = []
+    for exam_id, exam in index["exams"].items():
+        s = exam["summary"]
+        name = s["name"].replace("\t", " ")
+        rows.append(f"{exam_id}\t{name}\t{s['duration']}\t{s['questions']}\t{s['points']}\t{s['passing']}\n")
+    return "".join(rows)
+
+
+def load(exams_dir, index_file: str = None, rebuild: bool = False) -> dict:
+    """Return the index of exams_dir, rebuilding it when its sources changed.
+
+    A rebuilt index that cannot be written (read-only checkout) is still returned.
+    """
+    exams_dir = os.fspath(exams_dir)
+    index_file = index_file or index_path(exams_dir)
+
+    index = None if rebuild else _loaded.get(index_file)
+    if index is not None and not is_stale(index, exams_dir):
+        return index
+
+    if not rebuild:
+        try:
+            with open(index_file, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+    if index is None or is_stale(index, exams_dir) or not os.path.exists(rows_path(index_file)):
+        index = build(exams_dir)
+        try:
+            write(index, index_file)
+        except OSError:
+            pass
+
+    _loaded[index_file] = index
+    return index
+
+
+def main() -> int:
+    """Entry point."""
+    args = sys.argv[1:]
+    rebuild = "--rebuild" in args
+    args = [arg for arg in args if arg != "--rebuild"]
+    if len(args) != 1:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    sys.stdout.write(format_rows(load(args[0], rebuild=rebuild)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Minimal Kubernetes API client for the ckad-dojo CLI and its Python helpers.
+
+Reads the current context straight from the kubeconfig (KUBECONFIG or
+~/.kube/config) and keeps one keep-alive HTTP(S) connection to the API server,
+so a command that checks the cluster and then lists namespaces pays for the
+kubeconfig parsing and the TLS handshake once, and for no kubectl process or
+API discovery at all.
+
+Client certificates, bearer tokens (inline or tokenFile) and basic auth are
+supported. Contexts that authenticate through an exec plugin or an auth
+provider, or that need a proxy or a TLS server name override, raise
+Unsupported: callers then fall back to kubectl. CKAD_KUBE_CLIENT=kubectl forces
+that fallback for every context (fake kubectl environments such as the scoring
+benchmark).
+
+Usage:
+    kube_client.py check        Exit 0 if the API server answers, 3 if not
+    kube_client.py namespaces   Print the cluster's namespaces
+
+Exit codes: 0 = ok, 2 = kubeconfig not usable here (use kubectl), 3 = cluster error.
+"""
+
+import base64
+import http.client
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import urllib.parse
+
+EXIT_UNSUPPORTED = 2
+EXIT_CLUSTER = 3
+
+DEFAULT_TIMEOUT = 10
+
+# Seconds a watch stays open before the server ends it and it is resumed
+WATCH_TIMEOUT = 300
+
+# API path of the resources exams use (watchable without discovery)
+RESOURCE_API = {
+    "pods": "/api/v1", "services": "/api/v1", "endpoints": "/api/v1",
+    "configmaps": "/api/v1", "secrets": "/api/v1", "serviceaccounts": "/api/v1",
+    "persistentvolumeclaims": "/api/v1", "persistentvolumes": "/api/v1",
+    "resourcequotas": "/api/v1", "limitranges": "/api/v1", "namespaces": "/api/v1",
+    "nodes": "/api/v1", "events": "/api/v1",
+    "deployments": "/apis/apps/v1", "replicasets": "/apis/apps/v1",
+    "statefulsets": "/apis/apps/v1", "daemonsets": "/apis/apps/v1",
+    "jobs": "/apis/batch/v1", "cronjobs": "/apis/batch/v1",
+    "ingresses": "/apis/networking.k8s.io/v1", "networkpolicies": "/apis/networking.k8s.io/v1",
+    "poddisruptionbudgets": "/apis/policy/v1",
+    "horizontalpodautoscalers": "/apis/autoscaling/v2",
+    "roles": "/apis/rbac.authorization.k8s.io/v1",
+    "rolebindings": "/apis/rbac.authorization.k8s.io/v1",
+    "clusterroles": "/apis/rbac.authorization.k8s.io/v1",
+    "clusterrolebindings": "/apis/rbac.authorization.k8s.io/v1",
+    "priorityclasses": "/apis/scheduling.k8s.io/v1",
+    "storageclasses": "/apis/storage.k8s.io/v1",
+}
+
+
+class Unsupported(Exception):
+    """Raised when the current context cannot be used without kubectl."""
+
+
+class ClusterError(Exception):
+    """Raised when the API server cannot be reached or refuses a request."""
+
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+
+
+# =============================================================================
+# Kubeconfig
+# =============================================================================
+
+
+def parse_scalar(text: str):
+    """Parse a YAML scalar of the kind kubeconfig files contain."""
+    if text.startswith('"'):
+        return json.loads(text)
+    if text.startswith("'"):
+        if not text.endswith("'") or len(text) < 2:
+            raise ValueError(f"unterminated string: {text}")
+        return text[1:-1].replace("''", "'")
+    if text == "{}":
+        return {}
+    if text == "[]":
+        return []
+    if text[:1] in "{[|>&*!%@`":
+        raise ValueError(f"unsupported YAML: {text}")
+    if " #" in text:
+        text = text.split(" #", 1)[0].rstrip()
+    return {"true": True, "false": False, "null": None, "~": None}.get(text, text)
+
+
+def parse_yaml(text: str):
+    """Parse the block-style YAML subset kubectl, kind, k3d and minikube write.
+
+    Raises ValueError on anything else (flow collections, block scalars,
+    anchors), so the caller can ask kubectl instead.
+    """
+    lines = []
+    for raw in text.splitlines():
+        stripped = raw.strip()
+        if not stripped or stripped.startswith("#") or stripped == "---":
+            continue
+        if "\t" in raw[:len(raw) - len(raw.lstrip())]:
+            raise ValueError("tab indentation")
+        lines.append([len(raw) - len(raw.lstrip()), stripped])
+
+    def block(i: int, indent: int):
+        if lines[i][1] == "-" or lines[i][1].startswith("- "):
+            return sequence(i, indent)
+        return mapping(i, indent)
+
+    def sequence(i: int, indent: int):
+        items = []
+        while i < len(lines) and lines[i][0] == indent and (lines[i][1] == "-" or lines[i][1].startswith("- ")):
+            rest = lines[i][1][1:].lstrip()
+            if not rest:
+                if i + 1 < len(lines) and lines[i + 1][0] > indent:
+                    item, i = block(i + 1, lines[i + 1][0])
+                else:
+                    item, i = None, i + 1
+            elif is_key(rest):
+                lines[i] = [indent + len(lines[i][1]) - len(rest), rest]
+                item, i = mapping(i, lines[i][0])
+            else:
+                item, i = parse_scalar(rest), i + 1
+            items.append(item)
+        return items, i
+
+    def mapping(i: int, indent: int):
+        result = {}
+        while i < len(lines) and lines[i][0] == indent:
+            content = lines[i][1]
+            if not is_key(content):
+                raise ValueError(f"expected a key: {content}")
+            key, _, value = content.partition(":")
+            key = parse_scalar(key.strip())
+            value = value.strip()
+            i += 1
+            if value:
+                result[key] = parse_scalar(value)
+            elif i < len(lines) and lines[i][0] > indent:
+                result[key], i = block(i, lines[i][0])
+            elif i < len(lines) and lines[i][0] == indent and lines[i][1].startswith("-"):
+                result[key], i = sequence(i, indent)
+            else:
+                result[key] = None
+        if i < len(lines) and lines[i][0] > indent:
+            raise ValueError(f"bad indentation: {lines[i][1]}")
+        return result, i
+
+    def is_key(content: str) -> bool:
+        key, sep, value = content.partition(":")
+        return bool(sep) and bool(key) and (not value or value[0] == " ") and key[0] not in "\"'{[-"
+
+    if not lines:
+        return {}
+    value, end = block(0, lines[0][0])
+    if end != len(lines):
+        raise ValueError(f"unexpected content: {lines[end][1]}")
+    return value
+
+
+def kubeconfig_paths() -> list:
+    """Kubeconfig files in precedence order, as kubectl reads them."""
+    if os.environ.get("KUBECONFIG"):
+        paths = [p for p in os.environ["KUBECONFIG"].split(os.pathsep) if p]
+    else:
+        paths = [os.path.join(os.path.expanduser("~"), ".kube", "config")]
+    return [p for p in paths if os.path.isfile(p)]
+
+
+def _named(entries, key: str, base_dir: str, merged: dict) -> None:
+    for entry in entries or []:
+        if isinstance(entry, dict) and entry.get("name") not in merged:
+            value = dict(entry.get(key) or {})
+            value["_base_dir"] = base_dir
+            merged[entry["name"]] = value
+
+
+def load_kubeconfig() -> tuple:
+    """Return the (cluster, user) of the current context.
+
+    Files kubectl would merge are merged the same way (first file wins).
+    A file outside the supported YAML subset is read through
+    `kubectl config view` instead.
+    """
+    clusters, users, contexts = {}, {}, {}
+    current = None
+    for path in kubeconfig_paths():
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        try:
+            config = json.loads(text) if text.lstrip().startswith("{") else parse_yaml(text)
+        except ValueError:
+            config = kubectl_config_view(path)
+        if not isinstance(config, dict):
+            continue
+        base_dir = os.path.dirname(os.path.abspath(path))
+        _named(config.get("clusters"), "cluster", base_dir, clusters)
+        _named(config.get("users"), "user", base_dir, users)
+        _named(config.get("contexts"), "context", base_dir, contexts)
+        current = current or config.get("current-context")
+
+    context = contexts.get(current)
+    if not context:
+        raise Unsupported(f"no usable current context ({current or 'not set'})")
+    cluster = clusters.get(context.get("cluster"))
+    if not cluster or not cluster.get("server"):
+        raise Unsupported(f"context {current} has no cluster server")
+    return cluster, users.get(context.get("user"), {})
+
+
+def kubectl_config_view(path: str) -> dict:
+    """Ask kubectl to read a kubeconfig file this module cannot parse."""
+    if not shutil.which("kubectl"):
+        raise Unsupported(f"cannot parse {path}")
+    result = subprocess.run(
+        ["kubectl", "config", "view", "--raw", "-o", "json", "--kubeconfig", path],
+        capture_output=True,
+        text=True,
+        timeout=DEFAULT_TIMEOUT
+    )
+    if result.returncode != 0:
+        raise Unsupported(f"cannot parse {path}")
+    return json.loads(result.stdout)
+
+
+def _resolve(entry: dict, key: str) -> str:
+    """Path of a file reference in a kubeconfig entry, relative to its file."""
+    return os.path.join(entry["_base_dir"], os.path.expanduser(entry[key]))
+
+
+def _pem(entry: dict, key: str) -> bytes:
+    """PEM bytes of <key>-data or the file named by <key>, or None."""
+    if entry.get(f"{key}-data"):
+        return base64.b64decode(entry[f"{key}-data"])
+    if entry.get(key):
+        with open(_resolve(entry, key), "rb") as f:
+            return f.read()
+    return None
+
+
+def ssl_context(cluster: dict, user: dict) -> ssl.SSLContext:
+    """TLS settings of a cluster and user, client certificate loaded."""
+    if cluster.get("insecure-skip-tls-verify"):
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        ca = _pem(cluster, "certificate-authority")
+        context = ssl.create_default_context(cadata=ca.decode() if ca else None)
+
+    cert = _pem(user, "client-certificate")
+    key = _pem(user, "client-key")
+    if cert and key:
+        # load_cert_chain only takes files; they live just long enough to be read
+        tmp_dir = tempfile.mkdtemp(prefix="ckad-kube-")
+        try:
+            cert_file = os.path.join(tmp_dir, "client.crt")
+            key_file = os.path.join(tmp_dir, "client.key")
+            for path, data in ((cert_file, cert), (key_file, key)):
+                with open(os.open(path, os.O_WRONLY | os.O_CREAT, 0o600), "wb") as f:
+                    f.write(data)
+            context.load_cert_chain(cert_file, key_file)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return context
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+class KubeClient:
+    """One keep-alive connection to the API server of the current context.
+
+    Requests are serialized on the connection; a connection the server
+    closed while idle is reopened once and the request retried.
+    """
+
+    def __init__(self, server: str, headers: dict = None, context: ssl.SSLContext = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+        url = urllib.parse.urlsplit(server)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise Unsupported(f"unsupported server URL: {server}")
+        self.server = server
+        self.base_path = url.path.rstrip("/")
+        self.headers = dict(headers or {})
+        self.headers.setdefault("Accept", "application/json")
+        self._lock = threading.Lock()
+        self._connection = None
+        if url.scheme == "https":
+            self._connect = lambda: http.client.HTTPSConnection(
+                url.hostname, url.port or 443, context=context, timeout=timeout)
+        else:
+            self._connect = lambda: http.client.HTTPConnection(url.hostname, url.port or 80, timeout=timeout)
+        self.connections = 0
+
+    @classmethod
+    def from_kubeconfig(cls, timeout: float = DEFAULT_TIMEOUT) -> "KubeClient":
+        """Client for the current context of the kubeconfig."""
+        if os.environ.get("CKAD_KUBE_CLIENT") == "kubectl":
+            raise Unsupported("CKAD_KUBE_CLIENT=kubectl")
+        cluster, user = load_kubeconfig()
+        for key in ("exec", "auth-provider"):
+            if user.get(key):
+                raise Unsupported(f"{key} authentication")
+        for key in ("proxy-url", "tls-server-name"):
+            if cluster.get(key):
+                raise Unsupported(key)
+
+        headers = {}
+        if user.get("token"):
+            headers["Authorization"] = f"Bearer {user['token']}"
+        elif user.get("tokenFile"):
+            with open(_resolve(user, "tokenFile"), encoding="utf-8") as f:
+                headers["Authorization"] = f"Bearer {f.read().strip()}"
+        elif user.get("username"):
+            credentials = f"{user['username']}:{user.get('password', '')}".encode()
+            headers["Authorization"] = "Basic " + base64.b64encode(credentials).decode()
+
+        context = None
+        if cluster["server"].startswith("https:"):
+            try:
+                context = ssl_context(cluster, user)
+            except (OSError, ValueError, ssl.SSLError) as e:
+                raise Unsupported(f"TLS settings: {e}") from None
+        return cls(cluster["server"], headers, context, timeout)
+
+    def request(self, method: str, path: str) -> tuple:
+        """Send a request on the shared connection, return (status, body)."""
+        with self._lock:
+            for attempt in (1, 2):
+                reused = self._connection is not None
+                if not reused:
+                    self._connection = self._connect()
+                    self.connections += 1
+                try:
+                    self._connection.request(method, self.base_path + path, headers=self.headers)
+                    response = self._connection.getresponse()
+                    return response.status, response.read()
+                except (http.client.HTTPException, OSError) as e:
+                    self.close_locked()
+                    if not reused or attempt == 2:
+                        raise ClusterError(f"{self.server}: {e}") from None
+        raise ClusterError(f"{self.server}: no response")
+
+    def get_json(self, path: str) -> dict:
+        """GET an API path and decode the JSON body."""
+        status, body = self.request("GET", path)
+        if status >= 400:
+            message = body.decode(errors="replace")
+            try:
+                message = json.loads(body).get("message", message)
+            except (ValueError, AttributeError):
+                pass
+            raise ClusterError(f"HTTP {status}: {message}", status)
+        return json.loads(body)
+
+    def reachable(self) -> bool:
+        """True if the API server answers (what `kubectl cluster-info` checks)."""
+        try:
+            self.get_json("/version")
+            return True
+        except (ClusterError, ValueError):
+            return False
+
+    def namespaces(self) -> list:
+        """Names of the cluster's namespaces, in one request."""
+        try:
+            items = self.get_json("/api/v1/namespaces").get("items", [])
+        except ValueError as e:
+            raise ClusterError(f"bad namespace list: {e}") from None
+        return [item["metadata"]["name"] for item in items]
+
+    def resource_version(self, resource: str) -> str:
+        """Current resourceVersion of a resource list, to watch from."""
+        data = self.get_json(f"{RESOURCE_API[resource]}/{resource}?limit=1")
+        return data.get("metadata", {}).get("resourceVersion", "")
+
+    def watch(self, resource: str, resource_version: str, timeout: int = WATCH_TIMEOUT):
+        """Yield watch events of a resource in all namespaces, from resource_version.
+
+        Streams on a connection of its own, so it does not hold up other
+        requests. Ends when the server closes the watch after `timeout`
+        seconds; raises ClusterError (status 410 when resource_version expired).
+        """
+        path = (f"{self.base_path}{RESOURCE_API[resource]}/{resource}?watch=1"
+                f"&allowWatchBookmarks=true&timeoutSeconds={timeout}"
+                f"&resourceVersion={urllib.parse.quote(resource_version)}")
+        connection = self._connect()
+        connection.timeout = timeout + DEFAULT_TIMEOUT
+        try:
+            connection.request("GET", path, headers=self.headers)
+            response = connection.getresponse()
+            if response.status >= 400:
+                raise ClusterError(f"HTTP {response.status} watching {resource}", response.status)
+            for line in response:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event.get("type") == "ERROR":
+                    status = event.get("object", {})
+                    raise ClusterError(status.get("message", "watch error"), status.get("code"))
+                yield event
+        except (http.client.HTTPException, OSError, ValueError) as e:
+            raise ClusterError(f"watch {resource}: {e}") from None
+        finally:
+            connection.close()
+
+    def close_locked(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def close(self) -> None:
+        """Close the connection; the next request opens a new one."""
+        with self._lock:
+            self.close_locked()
+
+
+def main() -> int:
+    """Entry point."""
+    if len(sys.argv) != 2 or sys.argv[1] not in ("check", "namespaces"):
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    try:
+        client = KubeClient.from_kubeconfig()
+    except (Unsupported, OSError) as e:
+        print(f"Kubeconfig not usable without kubectl: {e}", file=sys.stderr)
+        return EXIT_UNSUPPORTED
+
+    if sys.argv[1] == "check":
+        return 0 if client.reachable() else EXIT_CLUSTER
+    try:
+        print("\n".join(client.namespaces()))
+    except ClusterError as e:
+        print(f"Cannot list namespaces: {e}", file=sys.stderr)
+        return EXIT_CLUSTER
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
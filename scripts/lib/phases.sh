@@ -0,0 +1,135 @@
+#!/bin/bash
+# phases.sh - Run named phases as a small dependency graph
+# Phases whose dependencies have finished run concurrently; each phase's output
+# is printed in one piece when it finishes, followed by a timing report.
+#
+# Usage:
+#   phase_add <name> <function> [dependency...]
+#   phase_run_all        # returns the number of failed phases
+#   phase_report
+
+PHASE_NAMES=()
+declare -A PHASE_FUNCS=()
+declare -A PHASE_DEPS=()
+declare -A PHASE_STATUS=()
+declare -A PHASE_MS=()
+PHASE_TOTAL_MS=0
+
+# Milliseconds since the epoch
+_phase_now_ms() {
+	if [ -n "${EPOCHREALTIME:-}" ]; then
+		local now="${EPOCHREALTIME/[.,]/}"
+		echo $((now / 1000))
+	else
+		echo $(($(date +%s) * 1000))
+	fi
+}
+
+# Register a phase
+# Usage: phase_add <name> <function> [dependency...]
+# Dependencies only order phases: a phase still runs when one of them failed.
+phase_add() {
+	local name="$1"
+	local func="$2"
+	shift 2
+	PHASE_NAMES+=("$name")
+	PHASE_FUNCS["$name"]="$func"
+	PHASE_DEPS["$name"]="$*"
+	PHASE_STATUS["$name"]="pending"
+}
+
+# Check whether every dependency of a phase has finished
+_phase_ready() {
+	local dep
+	for dep in ${PHASE_DEPS[$1]}; do
+		case "${PHASE_STATUS[$dep]:-}" in
+		ok | failed | "") ;;
+		*) return 1 ;;
+		esac
+	done
+	return 0
+}
+
+# Start one phase in the background, recording output, exit code and duration
+_phase_start() {
+	local name="$1"
+	local dir="$2"
+	PHASE_STATUS["$name"]="running"
+	(
+		local start rc=0
+		start=$(_phase_now_ms)
+		"${PHASE_FUNCS[$name]}" >"$dir/$name.out" 2>&1 || rc=$?
+		echo "$rc $(($(_phase_now_ms) - start))" >"$dir/$name.rc.tmp"
+		mv "$dir/$name.rc.tmp" "$dir/$name.rc"
+	) &
+}
+
+# Run all registered phases, respecting dependencies
+phase_run_all() {
+	local dir
+	dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-phases.XXXXXX") || return 1
+
+	local started_ms failed=0 name running rc ms
+	started_ms=$(_phase_now_ms)
+
+	while true; do
+		running=0
+		for name in "${PHASE_NAMES[@]}"; do
+			if [ "${PHASE_STATUS[$name]}" = "pending" ] && _phase_ready "$name"; then
+				_phase_start "$name" "$dir"
+			fi
+			[ "${PHASE_STATUS[$name]}" = "running" ] && ((++running))
+		done
+
+		# Nothing running and nothing startable: done (or a dependency cycle)
+		[ $running -eq 0 ] && break
+
+		wait -n 2>/dev/null || true
+
+		for name in "${PHASE_NAMES[@]}"; do
+			if [ "${PHASE_STATUS[$name]}" = "running" ] && [ -f "$dir/$name.rc" ]; then
+				read -r rc ms <"$dir/$name.rc"
+				PHASE_MS["$name"]=$ms
+				if [ "$rc" -eq 0 ]; then
+					PHASE_STATUS["$name"]="ok"
+				else
+					PHASE_STATUS["$name"]="failed"
+					((++failed))
+				fi
+				cat "$dir/$name.out"
+			fi
+		done
+	done
+
+	for name in "${PHASE_NAMES[@]}"; do
+		if [ "${PHASE_STATUS[$name]}" = "pending" ]; then
+			PHASE_STATUS["$name"]="skipped"
+			print_fail "Phase $name not run (dependency cycle)"
+			((++failed))
+		fi
+	done
+
+	PHASE_TOTAL_MS=$(($(_phase_now_ms) - started_ms))
+	rm -rf "$dir"
+	return $failed
+}
+
+# Format milliseconds as seconds with one decimal
+_phase_seconds() {
+	printf "%d.%ds" $(($1 / 1000)) $((($1 % 1000) / 100))
+}
+
+# Print the duration and outcome of every phase, then the wall time
+phase_report() {
+	local name sum=0
+	print_section "Phase timings"
+	for name in "${PHASE_NAMES[@]}"; do
+		local ms="${PHASE_MS[$name]:-0}"
+		sum=$((sum + ms))
+		local status=""
+		[ "${PHASE_STATUS[$name]}" != "ok" ] && status="  (${PHASE_STATUS[$name]})"
+		printf "  %-22s %8s%s\n" "$name" "$(_phase_seconds "$ms")" "$status"
+	done
+	printf "  %-22s %8s  (sequential: %s)\n" "wall time" "$(_phase_seconds "$PHASE_TOTAL_MS")" \
+		"$(_phase_seconds "$sum")"
+}
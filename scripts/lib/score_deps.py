@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Question -> input dependency map extracted from an exam's scoring-functions.sh.
+
+Reads the body of every score_qN / score_preview_qN function and records what
+it looks at:
+    resources  (resource, namespace, name) read with kubectl get/describe/exec/
+               logs/rollout or helm; namespace None = any namespace ("" for
+               cluster-scoped resources), name None = any object
+    files      paths under exam/course read through $EXAM_DIR (or ./exam/course)
+    untracked  inputs no watch can see (docker, kubectl exec/auth output)
+
+An exam can declare the inputs of a question in exam.conf instead, replacing
+the extracted ones (SCORE_DEPENDS, see declared()).
+
+Usage:
+    score_deps.py <scoring-functions.sh>
+
+Prints the map as JSON, keyed by question ID ("1", "P1", ...).
+"""
+
+import json
+import re
+import sys
+
+FUNCTION_PATTERN = re.compile(r"^score_(preview_)?q(\d+)\(\)\s*\{", re.MULTILINE)
+# A command position: line start, $( or backtick, after a pipe, ;, && or ||, or a keyword
+COMMAND_PATTERN = re.compile(r"(?:^|\$\(|`|[|;&!]|\b(?:if|then|do|else|while))\s*(kubectl|helm|docker)\s+([^|;&)`]*)")
+QUOTED_TEXT_PATTERN = re.compile(r"\b(echo|check_criterion|print_\w+)\s+\"[^\"]*\"")
+FILE_PATTERN = re.compile(r"(?:\$\{?EXAM_DIR\}?|\bexam/course)/([^\"'\s)`]+)")
+
+# kubectl names and short names -> resource
+RESOURCE_ALIASES = {
+    "po": "pods", "pod": "pods",
+    "deploy": "deployments", "deployment": "deployments",
+    "rs": "replicasets", "replicaset": "replicasets",
+    "sts": "statefulsets", "statefulset": "statefulsets",
+    "ds": "daemonsets", "daemonset": "daemonsets",
+    "job": "jobs", "cj": "cronjobs", "cronjob": "cronjobs",
+    "svc": "services", "service": "services",
+    "ep": "endpoints",
+    "ing": "ingresses", "ingress": "ingresses",
+    "netpol": "networkpolicies", "networkpolicy": "networkpolicies",
+    "cm": "configmaps", "configmap": "configmaps",
+    "secret": "secrets",
+    "sa": "serviceaccounts", "serviceaccount": "serviceaccounts",
+    "pvc": "persistentvolumeclaims", "persistentvolumeclaim": "persistentvolumeclaims",
+    "pv": "persistentvolumes", "persistentvolume": "persistentvolumes",
+    "sc": "storageclasses", "storageclass": "storageclasses",
+    "pdb": "poddisruptionbudgets", "poddisruptionbudget": "poddisruptionbudgets",
+    "hpa": "horizontalpodautoscalers", "horizontalpodautoscaler": "horizontalpodautoscalers",
+    "quota": "resourcequotas", "resourcequota": "resourcequotas",
+    "limits": "limitranges", "limitrange": "limitranges",
+    "role": "roles", "rolebinding": "rolebindings",
+    "clusterrole": "clusterroles", "clusterrolebinding": "clusterrolebindings",
+    "pc": "priorityclasses", "priorityclass": "priorityclasses",
+    "ns": "namespaces", "namespace": "namespaces",
+    "no": "nodes", "node": "nodes",
+    "ev": "events", "event": "events",
+}
+
+CLUSTER_SCOPED = {
+    "namespaces", "nodes", "persistentvolumes", "storageclasses",
+    "clusterroles", "clusterrolebindings", "priorityclasses",
+}
+
+# What `kubectl auth can-i` answers from
+RBAC_RESOURCES = ("roles", "rolebindings", "clusterroles", "clusterrolebindings", "serviceaccounts")
+
+
+def resource_name(kind: str) -> str:
+    """Canonical plural resource name of a kubectl kind argument."""
+    kind = kind.lower().split(".", 1)[0]
+    return RESOURCE_ALIASES.get(kind, kind)
+
+
+def literal(token: str):
+    """A token's value, or None when it depends on a shell variable."""
+    token = token.strip("\"'")
+    return None if not token or "$" in token or "*" in token else token
+
+
+def parse_command(tool: str, words: list) -> tuple:
+    """Return (resources, untracked) of one kubectl/helm/docker invocation."""
+    if tool == "docker":
+        return [], ["docker"]
+
+    namespace = "default"
+    positional = []
+    i = 0
+    while i < len(words):
+        word = words[i]
+        if word in ("-n", "--namespace"):
+            namespace = literal(words[i + 1]) if i + 1 < len(words) else None
+            i += 2
+            continue
+        if word.startswith("--namespace="):
+            namespace = literal(word.split("=", 1)[1])
+        elif word in ("-A", "--all-namespaces", "--all-namespaces=true"):
+            namespace = None
+        elif word == "--":
+            break
+        elif word.startswith("-"):
+            # Options with a separate value
+            if word in ("-o", "-l", "-c", "--selector", "--output", "--field-selector", "--sort-by"):
+                i += 1
+        else:
+            positional.append(word)
+        i += 1
+
+    if tool == "helm":
+        # Helm keeps releases as secrets in the release namespace
+        return [("secrets", namespace, None)], []
+
+    verb, args = (positional[0], positional[1:]) if positional else ("", [])
+    if verb in ("get", "describe"):
+        if not args:
+            return [], []
+        names = [literal(arg) for arg in args[1:]] or [None]
+        if "/" in args[0]:
+            kind, name = args[0].split("/", 1)
+            kinds, names = [kind], [literal(name)]
+        else:
+            kinds = args[0].split(",")
+        return [(resource_name(kind), namespace, name) for kind in kinds for name in names], []
+    if verb in ("exec", "logs"):
+        return [("pods", namespace, literal(args[0]) if args else None)], [f"kubectl {verb}"]
+    if verb == "rollout" and len(args) >= 2:
+        if "/" in args[1]:
+            kind, name = args[1].split("/", 1)
+        else:
+            kind, name = args[1], args[2] if len(args) > 2 else ""
+        return [(resource_name(kind), namespace, literal(name))], []
+    if verb == "auth":
+        return [(resource, None, None) for resource in RBAC_RESOURCES], []
+    return [], []
+
+
+def as_map(resources, files, untracked) -> dict:
+    """Dependency entry of one question, in a stable order."""
+    return {
+        "resources": [
+            {"resource": r, "namespace": ns, "name": name}
+            for r, ns, name in sorted(resources, key=lambda d: (d[0], d[1] or "", d[2] or ""))
+        ],
+        "files": sorted(files),
+        "untracked": sorted(untracked),
+    }
+
+
+def question_dependencies(body: str) -> dict:
+    """Dependencies of one scoring function body."""
+    resources, files, untracked = set(), set(), set()
+    for line in body.splitlines():
+        line = line.strip()
+        if line.startswith("#"):
+            continue
+        line = QUOTED_TEXT_PATTERN.sub(r"\1", line)
+        for match in COMMAND_PATTERN.finditer(line):
+            words = match.group(2).replace("2>", " 2>").split()
+            words = [w for w in words if not w.startswith(("2>", ">", "<"))]
+            found, unseen = parse_command(match.group(1), words)
+            untracked.update(unseen)
+            for resource, namespace, name in found:
+                if resource in CLUSTER_SCOPED:
+                    namespace = ""
+                resources.add((resource, namespace, name))
+        for match in FILE_PATTERN.finditer(line):
+            path = match.group(1).split("$", 1)[0].rstrip("/")
+            if path and ".." not in path.split("/"):
+                files.add(path)
+
+    # A read of every object of a kind covers reads of single objects
+    wildcards = {(r, ns) for r, ns, name in resources if name is None}
+    resources = {(r, ns, name) for r, ns, name in resources
+                 if name is None or (r, ns) not in wildcards}
+    return as_map(resources, files, untracked)
+
+
+def declared(entries: list) -> dict:
+    """Parse exam.conf SCORE_DEPENDS entries: "<question> <input>...".
+
+    Inputs are <resource>/<namespace>[/<name>] (<resource>[/<name>] for
+    cluster-scoped resources), file:<path> or untracked:<source>; "*" stands
+    for any namespace or name. Raises ValueError on a malformed entry.
+    """
+    dependencies = {}
+    for entry in entries:
+        question, *inputs = entry.split()
+        if not re.fullmatch(r"[pP]?\d+", question) or not inputs:
+            raise ValueError(f"bad SCORE_DEPENDS entry: {entry!r}")
+        resources, files, untracked = set(), set(), set()
+        for item in inputs:
+            if item.startswith("file:"):
+                files.add(item[5:].strip("/"))
+            elif item.startswith("untracked:"):
+                untracked.add(item[10:])
+            else:
+                parts = item.split("/")
+                resource = resource_name(parts[0])
+                if resource not in CLUSTER_SCOPED:
+                    if len(parts) < 2:
+                        raise ValueError(f"{item!r} needs a namespace")
+                    namespace = parts[1]
+                    parts = parts[1:]
+                else:
+                    namespace = ""
+                if len(parts) > 2:
+                    raise ValueError(f"bad input {item!r}")
+                name = parts[1] if len(parts) == 2 else "*"
+                resources.add((resource, None if namespace == "*" else namespace,
+                               None if name == "*" else name))
+        dependencies[question.upper()] = as_map(resources, files, untracked)
+    return dependencies
+
+
+def extract(scoring_file: str) -> dict:
+    """Map every question of a scoring-functions.sh to its dependencies."""
+    try:
+        with open(scoring_file, encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return {}
+
+    dependencies = {}
+    matches = list(FUNCTION_PATTERN.finditer(text))
+    for match in matches:
+        end = re.compile(r"^\}", re.MULTILINE).search(text, match.end())
+        body = text[match.end():end.start() if end else len(text)]
+        question_id = ("P" if match.group(1) else "") + match.group(2)
+        dependencies[question_id] = question_dependencies(body)
+    return dependencies
+
+
+def main() -> int:
+    """Entry point."""
+    if len(sys.argv) != 2:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    print(json.dumps(extract(sys.argv[1]), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
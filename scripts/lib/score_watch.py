@@ -0,0 +1,342 @@
+"""
+Change feeds for `ckad-dojo score --watch`.
+
+ClusterWatcher follows the Kubernetes watch API for every resource the exam's
+scoring functions read (one stream per resource, all namespaces), FileWatcher
+follows exam/course with inotify (polling where inotify is not available).
+Both put changes on a queue; affected_questions() maps them to the questions
+whose dependencies (score_deps.py) they touch, and ChangeTracker keeps the set
+of questions changed since they were last scored.
+
+Changes are tuples:
+    ("resource", <resource>, <namespace>, <name>)   namespace/name None = any
+    ("file", <path relative to exam/course>)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+
+import kube_client
+
+# Seconds between scans when files are polled
+POLL_INTERVAL = 1.0
+
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+FILE_EVENTS = IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def path_overlaps(changed: str, dependency: str) -> bool:
+    """True if a changed path is, contains or lies inside a dependency path."""
+    return (changed == dependency or dependency.startswith(changed + "/")
+            or changed.startswith(dependency + "/"))
+
+
+def affected_questions(dependencies: dict, changes) -> set:
+    """Questions whose scoring reads any of the changed objects or files."""
+    affected = set()
+    for question, deps in dependencies.items():
+        for change in changes:
+            if change[0] == "file":
+                hit = any(path_overlaps(change[1], path) for path in deps["files"])
+            else:
+                _, resource, namespace, name = change
+                hit = any(
+                    dep["resource"] == resource
+                    and (namespace is None or dep["namespace"] is None or dep["namespace"] == namespace)
+                    and (name is None or dep["name"] is None or dep["name"] == name)
+                    for dep in deps["resources"]
+                )
+            if hit:
+                affected.add(question)
+                break
+    return affected
+
+
+def watched_resources(dependencies: dict) -> tuple:
+    """(resources the watch API can follow, questions with inputs it cannot see)."""
+    resources = set()
+    blind = set()
+    for question, deps in dependencies.items():
+        if deps["untracked"]:
+            blind.add(question)
+        for dep in deps["resources"]:
+            if dep["resource"] in kube_client.RESOURCE_API:
+                resources.add(dep["resource"])
+            else:
+                blind.add(question)
+    return sorted(resources), blind
+
+
+# =============================================================================
+# Cluster
+# =============================================================================
+
+
+class ClusterWatcher:
+    """One watch stream per resource, resumed from the last resourceVersion.
+
+    errors holds the resources whose watch is failing, with the last error.
+    """
+
+    def __init__(self, client, resources: list, changes):
+        self.client = client
+        self.resources = resources
+        self.changes = changes
+        self.errors = {}
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        for resource in self.resources:
+            threading.Thread(target=self._follow, args=(resource,), daemon=True,
+                             name=f"watch-{resource}").start()
+
+    def stop(self) -> None:
+        """Stop following; streams end at their next event or server timeout."""
+        self._stopped.set()
+
+    def _follow(self, resource: str) -> None:
+        resource_version = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self.client.resource_version(resource)
+                    if self.errors.pop(resource, None) is not None:
+                        # Back after a failure: events may have been missed meanwhile
+                        self.changes.put(("resource", resource, None, None))
+                for event in self.client.watch(resource, resource_version):
+                    if self._stopped.is_set():
+                        return
+                    metadata = event.get("object", {}).get("metadata", {})
+                    resource_version = metadata.get("resourceVersion", resource_version)
+                    if event.get("type") == "BOOKMARK":
+                        continue
+                    self.changes.put(("resource", resource, metadata.get("namespace", ""),
+                                      metadata.get("name")))
+            except kube_client.ClusterError as e:
+                resource_version = None
+                if e.status == 410:
+                    # resourceVersion expired: everything of this resource may have changed
+                    self.changes.put(("resource", resource, None, None))
+                else:
+                    # Broken until a list succeeds again (403, 404, cluster down, ...)
+                    self.errors[resource] = str(e)
+                    self._stopped.wait(2)
+
+
+# =============================================================================
+# Files
+# =============================================================================
+
+
+class FileWatcher:
+    """Reports files created, written, moved or deleted under a directory."""
+
+    def __init__(self, root: str, changes):
+        self.root = root
+        self.changes = changes
+        self.mode = "polling"
+        self._libc = None
+        self._fd = -1
+        self._watches = {}
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        if sys.platform.startswith("linux") and self._init_inotify():
+            self.mode = "inotify"
+            target = self._follow_inotify
+        else:
+            target = self._follow_polling
+        threading.Thread(target=target, daemon=True, name="watch-files").start()
+
+    def stop(self) -> None:
+        """Stop following; the watching thread ends within POLL_INTERVAL."""
+        self._stopped.set()
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    # inotify --------------------------------------------------------------
+
+    def _init_inotify(self) -> bool:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        if fd < 0:
+            return False
+        self._libc, self._fd = libc, fd
+        os.makedirs(self.root, exist_ok=True)
+        self._add_tree(self.root)
+        return True
+
+    def _add_tree(self, top: str) -> None:
+        for directory, _, _ in os.walk(top):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), FILE_EVENTS)
+            if wd >= 0:
+                self._watches[wd] = directory
+
+    def _follow_inotify(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                if self._fd in select.select([self._fd], [], [], POLL_INTERVAL)[0]:
+                    self._read_inotify()
+        finally:
+            os.close(self._fd)
+
+    def _read_inotify(self) -> None:
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name) if name else directory
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_tree(path)
+            self.changes.put(("file", self._relative(path)))
+
+    # polling --------------------------------------------------------------
+
+    def _scan(self) -> dict:
+        state = {}
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                state[self._relative(path)] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def _follow_polling(self) -> None:
+        previous = self._scan()
+        while not self._stopped.wait(POLL_INTERVAL):
+            current = self._scan()
+            for path in set(previous) | set(current):
+                if previous.get(path) != current.get(path):
+                    self.changes.put(("file", path))
+            previous = current
+
+
+# =============================================================================
+# Tracker
+# =============================================================================
+
+
+class ChangeTracker:
+    """Questions whose inputs changed since they were last scored.
+
+    Blind questions - inputs no watch can see (untracked inputs, every question
+    reading the cluster when there is no API client, or reading a resource
+    whose watch is failing) - are reported by take() and changed() as well.
+    """
+
+    def __init__(self, dependencies: dict, root: str, client=None):
+        self.dependencies = dependencies
+        self.changes = queue.Queue()
+        self.resources, self._unwatchable = watched_resources(dependencies)
+        self.cluster = ClusterWatcher(client, self.resources, self.changes) if client else None
+        if not client:
+            self._unwatchable |= {q for q, deps in dependencies.items() if deps["resources"]}
+        self.files = FileWatcher(root, self.changes)
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def start(self) -> None:
+        if self.cluster:
+            self.cluster.start()
+        self.files.start()
+        threading.Thread(target=self._collect, daemon=True, name="watch-collect").start()
+
+    def stop(self) -> None:
+        """Stop every watch; changes still arriving are ignored."""
+        if self.cluster:
+            self.cluster.stop()
+        self.files.stop()
+        self.changes.put(None)
+
+    def _collect(self) -> None:
+        while True:
+            change = self.changes.get()
+            if change is None:
+                return
+            affected = affected_questions(self.dependencies, [change])
+            if affected:
+                with self._lock:
+                    self._dirty |= affected
+                self._wakeup.set()
+
+    def broken(self) -> dict:
+        """Resources whose watch is failing, with the last error."""
+        return dict(self.cluster.errors) if self.cluster else {}
+
+    def blind(self) -> set:
+        """Questions whose inputs cannot be watched right now."""
+        broken = self.broken()
+        return self._unwatchable | {
+            question for question, deps in self.dependencies.items()
+            if any(dep["resource"] in broken for dep in deps["resources"])
+        }
+
+    def status(self) -> dict:
+        """What is watched, for display."""
+        return {
+            "cluster": "watch" if self.cluster else "none",
+            "resources": self.resources if self.cluster else [],
+            "files": self.files.mode,
+            "broken": self.broken(),
+            "blind": sorted(self.blind()),
+        }
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for a change; True if one arrived."""
+        return self._wakeup.wait(timeout)
+
+    def changed(self) -> set:
+        """Questions to re-score."""
+        with self._lock:
+            return self._dirty | self.blind()
+
+    def take(self, blind: bool = True) -> set:
+        """Questions to re-score (blind ones unless blind=False), forgetting their changes.
+
+        Re-add them with mark_changed() if scoring them fails.
+        """
+        with self._lock:
+            questions = self._dirty | (self.blind() if blind else set())
+            self._dirty.clear()
+            self._wakeup.clear()
+            return questions
+
+    def mark_scored(self, questions) -> None:
+        with self._lock:
+            self._dirty -= set(questions)
+
+    def mark_changed(self, questions) -> None:
+        with self._lock:
+            self._dirty |= set(questions) & set(self.dependencies)
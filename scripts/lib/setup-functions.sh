@@ -6,10 +6,378 @@
 SCRIPT_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_LIB_DIR/common.sh"
 
+# ============================================================================
+# SETUP LEDGER
+# Records what setup applied (content hash + observed object version) so a
+# rerun only touches manifests and templates that changed or drifted.
+# ============================================================================
+
+SETUP_LEDGER_DIR="${CKAD_LEDGER_DIR:-$PROJECT_DIR/.cache/ledger}"
+
+# Ignore the ledger and apply everything (ckad-setup.sh --force)
+SETUP_FORCE="${SETUP_FORCE:-false}"
+
+# Number of objects the last setup_resources call applied (0 = nothing changed)
+SETUP_APPLIED_COUNT=0
+
+# kubectl output template: "<Kind>/<namespace>/<name> <generation>:<resourceVersion>"
+SETUP_VERSION_TEMPLATE='{.kind}/{.metadata.namespace}/{.metadata.name} {.metadata.generation}:{.metadata.resourceVersion}{"\n"}'
+
+# Print the manifest ledger path for the current kube context and exam
+setup_ledger_file() {
+	local context
+	context=$(kubectl config current-context 2>/dev/null) || context="default"
+	echo "$SETUP_LEDGER_DIR/${context//\//_}/${CURRENT_EXAM_ID:-$DEFAULT_EXAM_ID}.manifests"
+}
+
+# Print "<hash> <file>" for each file, with whichever SHA-256 tool is available
+_hash_files() {
+	if command_exists sha256sum; then
+		sha256sum "$@"
+	else
+		shasum -a 256 "$@"
+	fi
+}
+
+# Ledger key of an object: <Kind>/<namespace>/<name>, cluster-scoped and
+# unqualified objects both use "default" so manifests and API output agree
+_ledger_key() {
+	echo "$1/${3:-default}/$2"
+}
+
+# Compare two observed versions: generation when the kind has one (status
+# updates do not bump it), resourceVersion otherwise
+_version_matches() {
+	local old="$1" new="$2"
+	[ -n "$old" ] && [ -n "$new" ] || return 1
+	if [ -n "${new%%:*}" ]; then
+		[ "${old%%:*}" = "${new%%:*}" ]
+	else
+		[ "${old#*:}" = "${new#*:}" ]
+	fi
+}
+
+# Print the live version of every object in a manifest bundle, in one read
+_live_versions() {
+	kubectl get -f "$1" --ignore-not-found \
+		-o jsonpath="{range .items[*]}$SETUP_VERSION_TEMPLATE{end}" 2>/dev/null
+}
+
+# Read "<key> <version>" lines into the named associative array
+# Usage: _read_versions <array_name> <<<"$output"
+_read_versions() {
+	local -n versions_ref="$1"
+	local ref version kind_ns name
+	while read -r ref version; do
+		[ -z "$ref" ] && continue
+		# "<Kind>/<namespace>/<name>" with an empty namespace for cluster-scoped objects
+		kind_ns="${ref%/*}"
+		name="${ref##*/}"
+		versions_ref["$(_ledger_key "${kind_ns%%/*}" "$name" "${kind_ns#*/}")"]="$version"
+	done
+}
+
+# ============================================================================
+# IMAGE CACHE
+# Saves the images an exam runs as archives in a local cache and side-loads them
+# into the cluster and the local Docker daemon, so nothing is pulled at exam time.
+# ============================================================================
+
+IMAGE_CACHE_DIR="${CKAD_IMAGE_CACHE:-$PROJECT_DIR/.cache/images}"
+
+# Number of images pulled or side-loaded at the same time
+IMAGE_JOBS="${IMAGE_JOBS:-4}"
+
+# Image of the local registry started by setup_registry
+REGISTRY_IMAGE="registry:2"
+
+# Manifest media types asked for when checking whether the registry holds an image
+REGISTRY_MANIFEST_TYPES="application/vnd.docker.distribution.manifest.v2+json, application/vnd.docker.distribution.manifest.list.v2+json, application/vnd.oci.image.manifest.v1+json, application/vnd.oci.image.index.v1+json"
+
+# Print every image the current exam uses, one per line
+# Sources: manifests, templates (Dockerfile FROM lines included), questions and
+# solutions, the Helm chart rendered with the exam's values, and the registry.
+# Untagged references are printed with :latest.
+exam_images() {
+	local exam_dir="$CURRENT_EXAM_DIR"
+	{
+		echo "$REGISTRY_IMAGE"
+		grep -rhoE "(image:|--image[= ])[[:space:]]*[\"']?[A-Za-z0-9][A-Za-z0-9./:@_-]*" \
+			"$exam_dir/manifests" "$exam_dir/templates" "$exam_dir"/*.md 2>/dev/null |
+			sed -E "s/^(image:|--image[= ])[[:space:]]*[\"']?//"
+		find "$exam_dir/templates" -name Dockerfile -exec awk \
+			'toupper($1) == "FROM" { for (i = 2; i <= NF; i++) if ($i !~ /^--/) { print $i; break } }' {} + 2>/dev/null
+		_helm_images
+	} | grep -vx "scratch" | sed -E '/(:[^/]*|@.*)$/! s/$/:latest/' | sort -u
+}
+
+# Print the images of the exam's Helm releases, rendered with the setup values
+# and with every values file handed to the candidate
+# Reads only the cached chart: listing images never touches the network.
+_helm_images() {
+	if [ ${#HELM_RELEASES[@]} -eq 0 ] || ! command_exists helm; then
+		return 0
+	fi
+	local chart values
+	if ! chart=$(helm_chart_in_cache); then
+		print_skip "Helm chart not cached, its images are not listed (setup caches it)" >&2
+		return 0
+	fi
+	{
+		helm template images "$chart" --set service.type=ClusterIP --set replicaCount=1
+		for values in "$CURRENT_EXAM_DIR"/templates/*values*.yaml; do
+			[ -f "$values" ] && helm template images "$chart" -f "$values"
+		done
+	} 2>/dev/null | sed -nE "s/^[[:space:]]*image:[[:space:]]*[\"']?([^\"' ]+).*/\1/p"
+}
+
+# Print the path of an image in the local registry (nginx:1.20 -> library/nginx:1.20)
+registry_image_path() {
+	local image
+	image=$(image_full_name "$1")
+	echo "${image#*/}"
+}
+
+# Push the current exam's cached images into the local registry, so they can be
+# pulled as localhost:5000/<path> without network; images already there are kept
+images_seed_registry() {
+	print_section "Seeding local registry from the image cache..."
+
+	# A freshly started registry takes a moment to answer
+	local i
+	for i in $(seq 1 20); do
+		curl -sf -o /dev/null http://localhost:5000/v2/ && break
+		sleep 0.5
+	done
+	if ! curl -sf -o /dev/null http://localhost:5000/v2/; then
+		print_skip "Local registry not answering"
+		return 0
+	fi
+
+	local images=() image path present=0 uncached=0 failed=0
+	mapfile -t images < <(exam_images)
+	for image in "${images[@]}"; do
+		# Registry images are the candidate's to build, digests cannot be re-tagged
+		[[ "$image" == localhost:5000/* || "$image" == *@* ]] && continue
+		if [ ! -f "$(image_archive "$image")" ]; then
+			((++uncached))
+			continue
+		fi
+		path=$(registry_image_path "$image")
+		if curl -sf -o /dev/null -I "http://localhost:5000/v2/${path%:*}/manifests/${path##*:}" \
+			-H "Accept: $REGISTRY_MANIFEST_TYPES"; then
+			((++present))
+			continue
+		fi
+		if ! docker image inspect "$image" &>/dev/null; then
+			docker load -i "$(image_archive "$image")" &>/dev/null || true
+		fi
+		if docker tag "$image" "localhost:5000/$path" &>/dev/null &&
+			docker push "localhost:5000/$path" &>/dev/null; then
+			print_success "Seeded localhost:5000/$path"
+		else
+			print_fail "Failed to seed localhost:5000/$path"
+			((++failed))
+		fi
+		# Drop the local tag again, the registry keeps the image
+		docker rmi "localhost:5000/$path" &>/dev/null || true
+	done
+
+	if [ $present -gt 0 ]; then
+		print_skip "$present image(s) already in the registry"
+	fi
+	if [ $uncached -gt 0 ]; then
+		print_skip "$uncached image(s) not cached, 'ckad-dojo images pull' caches them"
+	fi
+	return $failed
+}
+
+# Print the cache archive path of an image
+image_archive() {
+	echo "$IMAGE_CACHE_DIR/$(tr '/:@' '___' <<<"$1").tar"
+}
+
+# Print an image reference the way nodes report it (docker.io/library/nginx:latest)
+image_full_name() {
+	local image="$1"
+	local first="${image%%/*}"
+	if [ "$first" = "$image" ]; then
+		image="docker.io/library/$image"
+	elif [[ "$first" != *.* && "$first" != *:* && "$first" != localhost ]]; then
+		image="docker.io/$image"
+	fi
+	[[ "${image##*/}" == *[:@]* ]] || image="$image:latest"
+	echo "$image"
+}
+
+# Pull the current exam's images and save each to the cache (cached ones are kept)
+images_pull() {
+	print_section "Caching images for $CURRENT_EXAM_ID in $IMAGE_CACHE_DIR..."
+
+	if ! command_exists docker; then
+		print_fail "Docker is not installed"
+		return 1
+	fi
+	mkdir -p "$IMAGE_CACHE_DIR"
+
+	local images=() results_dir image i
+	mapfile -t images < <(exam_images)
+	results_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-images.XXXXXX") || return 1
+
+	for i in "${!images[@]}"; do
+		image="${images[$i]}"
+		if [ -f "$(image_archive "$image")" ]; then
+			echo "cached" >"$results_dir/$i"
+			continue
+		fi
+		while [ "$(jobs -rp | wc -l)" -ge "$IMAGE_JOBS" ]; do
+			wait -n || true
+		done
+		(
+			archive=$(image_archive "$image")
+			if docker pull "$image" &>/dev/null && docker save -o "$archive.tmp" "$image" &>/dev/null &&
+				mv "$archive.tmp" "$archive"; then
+				echo "pulled"
+			else
+				rm -f "$archive.tmp"
+				echo "failed"
+			fi
+		) >"$results_dir/$i" &
+	done
+	wait
+
+	local failed=0
+	for i in "${!images[@]}"; do
+		case "$(cat "$results_dir/$i" 2>/dev/null)" in
+		pulled) print_success "Cached ${images[$i]}" ;;
+		cached) print_skip "${images[$i]} already cached" ;;
+		*)
+			print_fail "Failed to pull ${images[$i]}"
+			((++failed))
+			;;
+		esac
+	done
+	rm -rf "$results_dir"
+	return $failed
+}
+
+# Print how images reach the current cluster: kind:<cluster>, k3d:<cluster>,
+# minikube, or docker (nodes share the local Docker daemon)
+# Returns 1 when the cluster cannot be side-loaded
+cluster_image_target() {
+	local context
+	context=$(kubectl config current-context 2>/dev/null) || return 1
+	case "$context" in
+	kind-*) echo "kind:${context#kind-}" ;;
+	k3d-*) echo "k3d:${context#k3d-}" ;;
+	minikube) echo "minikube" ;;
+	docker-desktop | rancher-desktop | orbstack) echo "docker" ;;
+	*) return 1 ;;
+	esac
+}
+
+# Side-load one image archive
+# Usage: load_image_archive <target> <archive>
+load_image_archive() {
+	case "$1" in
+	kind:*) kind load image-archive "$2" --name "${1#kind:}" ;;
+	k3d:*) k3d image import "$2" --cluster "${1#k3d:}" ;;
+	minikube) minikube image load "$2" ;;
+	docker) docker load -i "$2" ;;
+	esac
+}
+
+# Side-load the current exam's cached images into the cluster nodes that lack them,
+# and into the local Docker daemon (registry, Dockerfile base images)
+images_load() {
+	print_section "Side-loading cached images..."
+
+	local images=() image archive cached=()
+	mapfile -t images < <(exam_images)
+	for image in "${images[@]}"; do
+		[ -f "$(image_archive "$image")" ] && cached+=("$image")
+	done
+	if [ ${#cached[@]} -eq 0 ]; then
+		print_skip "No cached images, 'ckad-dojo images pull' creates the cache"
+		return 0
+	fi
+
+	# Local Docker daemon: only images it does not have yet
+	if command_exists docker; then
+		for image in "${cached[@]}"; do
+			if ! docker image inspect "$image" &>/dev/null; then
+				docker load -i "$(image_archive "$image")" &>/dev/null || true
+			fi
+		done
+	fi
+
+	local target
+	if ! target=$(cluster_image_target); then
+		print_skip "Cluster cannot be side-loaded, its nodes pull images themselves"
+		return 0
+	fi
+
+	# One read of the images every node already has
+	local present
+	present=$(kubectl get nodes -o jsonpath='{range .items[*].status.images[*]}{range .names[*]}{@}{"\n"}{end}{end}' 2>/dev/null)
+
+	local pending=() results_dir i
+	for image in "${cached[@]}"; do
+		if ! grep -qxF "$(image_full_name "$image")" <<<"$present"; then
+			pending+=("$image")
+		fi
+	done
+	results_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-images.XXXXXX") || return 1
+
+	for i in "${!pending[@]}"; do
+		while [ "$(jobs -rp | wc -l)" -ge "$IMAGE_JOBS" ]; do
+			wait -n || true
+		done
+		(
+			if load_image_archive "$target" "$(image_archive "${pending[$i]}")" &>/dev/null; then
+				echo "loaded"
+			else
+				echo "failed"
+			fi
+		) >"$results_dir/$i" &
+	done
+	wait
+
+	local failed=0
+	for i in "${!pending[@]}"; do
+		if [ "$(cat "$results_dir/$i" 2>/dev/null)" = "loaded" ]; then
+			print_success "Side-loaded ${pending[$i]} (${target%%:*})"
+		else
+			print_fail "Failed to side-load ${pending[$i]}"
+			((++failed))
+		fi
+	done
+	rm -rf "$results_dir"
+
+	local on_nodes=$((${#cached[@]} - ${#pending[@]}))
+	local uncached=$((${#images[@]} - ${#cached[@]}))
+	if [ $on_nodes -gt 0 ]; then
+		print_skip "$on_nodes image(s) already on the cluster nodes"
+	fi
+	if [ $uncached -gt 0 ]; then
+		print_skip "$uncached image(s) not cached, nodes will pull them"
+	fi
+	return $failed
+}
+
 # ============================================================================
 # SETUP FUNCTIONS
 # ============================================================================
 
+# Field manager recorded on every object applied by setup
+SETUP_FIELD_MANAGER="ckad-dojo"
+
+# API server errors that mean an immutable field changed and only replace --force helps:
+# "<field>: Invalid value: ...: field is immutable", "pod updates may not change fields
+# other than ..." and "spec: Forbidden: updates to statefulset spec for fields other than
+# ... are forbidden". Other Forbidden errors (RBAC, quota, admission) are real failures.
+SETUP_IMMUTABLE_PATTERN='field is immutable|may not change fields|spec: Forbidden: updates to .* spec for fields other than .* are forbidden'
+
 # Create all exam namespaces
 setup_namespaces() {
 	print_section "Creating namespaces..."
@@ -18,7 +386,8 @@ setup_namespaces() {
 	local manifests_dir="${CURRENT_MANIFESTS_DIR:-$MANIFESTS_DIR}"
 
 	if [ -f "$manifests_dir/namespaces.yaml" ]; then
-		if kubectl apply -f "$manifests_dir/namespaces.yaml" 2>/dev/null; then
+		if kubectl apply --server-side --field-manager="$SETUP_FIELD_MANAGER" --force-conflicts \
+			-f "$manifests_dir/namespaces.yaml" 2>/dev/null; then
 			print_success "Namespaces created/verified"
 		else
 			print_fail "Failed to create namespaces"
@@ -30,43 +399,261 @@ setup_namespaces() {
 	fi
 }
 
-# Deploy pre-existing resources for exam questions
+# Split the setup manifests into one file per YAML document
+# Usage: write_manifest_documents <manifests_dir> <out_dir> [exam_id]  (prints the document count)
+# namespaces.yaml comes first so namespaces exist before the objects inside them.
+# With an exam ID, every object gets the EXAM_OWNER_LABEL=<exam_id> label.
+write_manifest_documents() {
+	local manifests_dir="$1"
+	local out_dir="$2"
+	local owner="${3:-}"
+	local manifests=() manifest
+
+	[ -f "$manifests_dir/namespaces.yaml" ] && manifests+=("$manifests_dir/namespaces.yaml")
+	for manifest in "$manifests_dir"/*.yaml; do
+		[ -f "$manifest" ] || continue
+		[ "$(basename "$manifest")" = "namespaces.yaml" ] && continue
+		manifests+=("$manifest")
+	done
+
+	if [ ${#manifests[@]} -eq 0 ]; then
+		echo 0
+		return 0
+	fi
+
+	awk -v out="$out_dir" -v owner="$owner" -v owner_label="$EXAM_OWNER_LABEL" '
+		function add_label() {
+			if (owner != "" && in_metadata && !labelled) {
+				doc = doc "  labels:\n    " owner_label ": \"" owner "\"\n"
+			}
+			in_metadata = 0
+		}
+		function flush(file) {
+			add_label()
+			if (has_content) {
+				count++
+				file = sprintf("%s/%04d.yaml", out, count)
+				printf "%s", doc > file
+				close(file)
+			}
+			doc = ""
+			has_content = 0
+			labelled = 0
+		}
+		FNR == 1 { flush() }
+		/^---/ { flush(); next }
+		/^[^[:space:]#]/ && in_metadata { add_label() }
+		{
+			doc = doc $0 "\n"
+			if ($0 !~ /^[[:space:]]*(#|$)/) has_content = 1
+		}
+		/^metadata:/ { in_metadata = 1 }
+		/^  labels:/ && in_metadata && owner != "" {
+			doc = doc "    " owner_label ": \"" owner "\"\n"
+			labelled = 1
+		}
+		END { flush(); print count + 0 }
+	' "${manifests[@]}"
+}
+
+# Identify the object in a single-document manifest
+# Usage: manifest_object_ref <file>  -> prints "<Kind> <name> [namespace]"
+manifest_object_ref() {
+	awk '
+		function value(line) {
+			sub(/^[^:]*:[[:space:]]*/, "", line)
+			sub(/[[:space:]]+#.*$/, "", line)
+			gsub(/["\047]/, "", line)
+			return line
+		}
+		/^[^[:space:]#]/ { in_metadata = 0 }
+		/^kind:/ { kind = value($0) }
+		/^metadata:/ { in_metadata = 1; next }
+		in_metadata && /^  name:/ { name = value($0) }
+		in_metadata && /^  namespace:/ { namespace = value($0) }
+		END { print kind, name, namespace }
+	' "$1"
+}
+
+# Apply one manifest document on its own
+# Falls back to replace --force only when the object has immutable fields that changed.
+# Sets APPLIED_VERSION to the version the API server returned.
+# Usage: _apply_manifest_object <file> <label>
+_apply_manifest_object() {
+	local file="$1"
+	local label="$2"
+	local error_file output
+	error_file=$(mktemp "${TMPDIR:-/tmp}/ckad-apply.XXXXXX") || return 1
+	APPLIED_VERSION=""
+
+	if output=$(kubectl apply --server-side --field-manager="$SETUP_FIELD_MANAGER" --force-conflicts \
+		-f "$file" -o jsonpath="$SETUP_VERSION_TEMPLATE" 2>"$error_file"); then
+		output="${output##*$'\n'}"
+		APPLIED_VERSION="${output#* }"
+		print_success "Applied $label"
+		rm -f "$error_file"
+		return 0
+	fi
+
+	local error
+	error=$(grep -v '^$' "$error_file" | tail -1)
+	rm -f "$error_file"
+
+	if [[ "$error" =~ $SETUP_IMMUTABLE_PATTERN ]]; then
+		if output=$(kubectl replace --force -f "$file" -o jsonpath="$SETUP_VERSION_TEMPLATE" 2>/dev/null); then
+			# replace --force reports the deletion first, the new object is on the last line
+			output="${output##*$'\n'}"
+			APPLIED_VERSION="${output#* }"
+			print_success "Replaced $label (immutable fields changed)"
+			return 0
+		fi
+	fi
+
+	print_fail "Failed to apply $label: $error"
+	return 1
+}
+
+# Deploy namespaces and pre-existing resources for exam questions
+# All setup manifests go to the API server as one multi-document bundle in a single
+# server-side apply; objects the bundle could not apply are retried one at a time.
+# Objects whose manifest and live version match the ledger are skipped.
+# Returns the number of objects that failed.
 setup_resources() {
-	print_section "Deploying pre-existing resources..."
+	print_section "Deploying namespaces and pre-existing resources..."
 
 	local errors=0
+	SETUP_APPLIED_COUNT=0
 	# Use exam-specific path if available, fallback to legacy
 	local manifests_dir="${CURRENT_MANIFESTS_DIR:-$MANIFESTS_DIR}"
 
-	# Apply all YAML files in the manifests/setup directory
-	if [ -d "$manifests_dir" ]; then
-		for manifest in "$manifests_dir"/*.yaml; do
-			if [ -f "$manifest" ]; then
-				local filename
-				filename=$(basename "$manifest")
-				# Skip namespaces.yaml as it's handled separately
-				if [ "$filename" = "namespaces.yaml" ]; then
-					continue
-				fi
+	if [ ! -d "$manifests_dir" ]; then
+		print_skip "No manifests directory found at $manifests_dir"
+		return 0
+	fi
 
-				# Try apply first, if it fails due to immutable fields, use replace --force
-				if kubectl apply -f "$manifest" 2>/dev/null; then
-					print_success "Applied $filename"
-				elif kubectl replace --force -f "$manifest" 2>/dev/null; then
-					print_success "Replaced $filename (force)"
-				else
-					print_fail "Failed to apply $filename"
-					((++errors))
-				fi
+	local work_dir
+	work_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-setup.XXXXXX") || return 1
+	mkdir -p "$work_dir/docs"
+
+	local count
+	count=$(write_manifest_documents "$manifests_dir" "$work_dir/docs" "${CURRENT_EXAM_ID:-$DEFAULT_EXAM_ID}")
+	if [ "$count" -eq 0 ]; then
+		rm -rf "$work_dir"
+		print_skip "No manifests found in $manifests_dir"
+		return 0
+	fi
+
+	# Describe every document: ledger key, label and content hash
+	local -A doc_key=() doc_label=() doc_hash=()
+	local doc hash kind name namespace
+	for doc in "$work_dir"/docs/*.yaml; do
+		read -r kind name namespace <<<"$(manifest_object_ref "$doc")"
+		doc_key["$doc"]=$(_ledger_key "$kind" "$name" "$namespace")
+		doc_label["$doc"]="$kind ${namespace:+$namespace/}$name"
+	done
+	while read -r hash doc; do
+		doc_hash["$doc"]="$hash"
+	done < <(_hash_files "$work_dir"/docs/*.yaml)
+
+	# Previous run: "<key> <hash> <version>" per object
+	local ledger_file
+	ledger_file=$(setup_ledger_file)
+	local -A ledger_hash=() ledger_version=()
+	local key version
+	if [ "$SETUP_FORCE" = false ] && [ -f "$ledger_file" ]; then
+		while read -r key hash version; do
+			ledger_hash["$key"]="$hash"
+			ledger_version["$key"]="$version"
+		done <"$ledger_file"
+	fi
+
+	# Live versions of the ledgered objects, in one read
+	for doc in "$work_dir"/docs/*.yaml; do
+		echo "---"
+		cat "$doc"
+	done >"$work_dir/all.yaml"
+	local -A live_version=()
+	if [ ${#ledger_hash[@]} -gt 0 ]; then
+		_read_versions live_version < <(_live_versions "$work_dir/all.yaml")
+	fi
+
+	# Unchanged = same manifest hash and the live object still has the recorded version
+	local pending=() unchanged=0
+	local -A new_version=()
+	for doc in "$work_dir"/docs/*.yaml; do
+		key="${doc_key[$doc]}"
+		if [ "${ledger_hash[$key]:-}" = "${doc_hash[$doc]}" ] &&
+			_version_matches "${ledger_version[$key]:-}" "${live_version[$key]:-}"; then
+			new_version["$key"]="${live_version[$key]}"
+			((++unchanged))
+		else
+			pending+=("$doc")
+		fi
+	done
+
+	if [ $unchanged -gt 0 ]; then
+		print_skip "$unchanged object(s) unchanged since last setup"
+	fi
+
+	if [ ${#pending[@]} -gt 0 ]; then
+		# One server-side apply for everything that changed
+		for doc in "${pending[@]}"; do
+			echo "---"
+			cat "$doc"
+		done >"$work_dir/bundle.yaml"
+
+		local -A applied_version=()
+		_read_versions applied_version < <(kubectl apply --server-side \
+			--field-manager="$SETUP_FIELD_MANAGER" --force-conflicts \
+			-f "$work_dir/bundle.yaml" -o jsonpath="$SETUP_VERSION_TEMPLATE" 2>/dev/null)
+
+		for doc in "${pending[@]}"; do
+			key="${doc_key[$doc]}"
+			if [ -n "${applied_version[$key]:-}" ]; then
+				print_success "Applied ${doc_label[$doc]}"
+				new_version["$key"]="${applied_version[$key]}"
+			elif _apply_manifest_object "$doc" "${doc_label[$doc]}"; then
+				new_version["$key"]="$APPLIED_VERSION"
+			else
+				((++errors))
+				continue
 			fi
+			((++SETUP_APPLIED_COUNT))
 		done
-	else
-		print_skip "No manifests directory found at $manifests_dir"
 	fi
 
+	# Record what is now in the cluster (failed objects are left out, so they are retried)
+	mkdir -p "$(dirname "$ledger_file")"
+	for doc in "$work_dir"/docs/*.yaml; do
+		key="${doc_key[$doc]}"
+		[ -n "${new_version[$key]:-}" ] || continue
+		echo "$key ${doc_hash[$doc]} ${new_version[$key]}"
+	done >"$ledger_file.tmp"
+	mv "$ledger_file.tmp" "$ledger_file"
+	mv "$work_dir/all.yaml" "${ledger_file%.manifests}.bundle.yaml"
+
+	rm -rf "$work_dir"
 	return $errors
 }
 
+# Re-read the live versions of every ledgered object, after post-setup steps
+# changed some of them on purpose (e.g. broken rollout revisions)
+setup_ledger_refresh() {
+	local ledger_file
+	ledger_file=$(setup_ledger_file)
+	local bundle="${ledger_file%.manifests}.bundle.yaml"
+	[ -f "$ledger_file" ] && [ -f "$bundle" ] || return 0
+
+	local -A live_version=()
+	_read_versions live_version < <(_live_versions "$bundle")
+
+	local key hash version
+	while read -r key hash version; do
+		echo "$key $hash ${live_version[$key]:-$version}"
+	done <"$ledger_file" >"$ledger_file.tmp"
+	mv "$ledger_file.tmp" "$ledger_file"
+}
+
 # Create exam directory structure
 setup_directories() {
 	print_section "Creating exam directories..."
@@ -102,12 +689,36 @@ setup_directories() {
 	print_success "Created exam/course directories for $total_questions questions + $preview_questions preview"
 }
 
+# Print the template ledger path for the current exam
+template_ledger_file() {
+	echo "$SETUP_LEDGER_DIR/templates/${CURRENT_EXAM_ID:-$DEFAULT_EXAM_ID}"
+}
+
+# Copy one template file unless the ledger shows this exact source was already
+# copied there (so a rerun keeps the candidate's edits to unchanged templates)
+# Usage: _copy_template <source> <target>  (returns 1 when skipped)
+# Reads template_hashes/template_ledger and fills new_template_ledger of setup_templates
+_copy_template() {
+	local source="$1"
+	local target="$2"
+	local hash="${template_hashes[$source]}"
+
+	if [ -e "$target" ] && [ "${template_ledger[$target]:-}" = "$hash" ]; then
+		new_template_ledger["$target"]="$hash"
+		return 1
+	fi
+
+	mkdir -p "$(dirname "$target")"
+	cp "$source" "$target" && new_template_ledger["$target"]="$hash"
+}
+
 # Copy template files to exam directories
 setup_templates() {
 	print_section "Copying template files..."
 
 	local errors=0
 	local copied=0
+	local unchanged=0
 	# Use exam-specific path if available, fallback to legacy
 	local templates_dir="${CURRENT_TEMPLATES_DIR:-$TEMPLATES_DIR}"
 
@@ -116,6 +727,24 @@ setup_templates() {
 		return 0
 	fi
 
+	# Hash every template once, and load what the previous run copied
+	local -A template_hashes=() template_ledger=() new_template_ledger=()
+	local hash file target files=()
+	mapfile -d '' files < <(find "$templates_dir" -type f -print0)
+	if [ ${#files[@]} -gt 0 ]; then
+		while read -r hash file; do
+			template_hashes["$file"]="$hash"
+		done < <(_hash_files "${files[@]}")
+	fi
+
+	local ledger_file
+	ledger_file=$(template_ledger_file)
+	if [ "$SETUP_FORCE" = false ] && [ -f "$ledger_file" ]; then
+		while IFS=$'\t' read -r target hash; do
+			template_ledger["$target"]="$hash"
+		done <"$ledger_file"
+	fi
+
 	# Copy all template files (q##-*.* format - yaml, html, sh, etc.)
 	for template in "$templates_dir"/q[0-9]*-*.*; do
 		if [ -f "$template" ]; then
@@ -129,9 +758,12 @@ setup_templates() {
 			target_name=$(echo "$filename" | sed 's/q[0-9]*-//')
 
 			if [ -d "$EXAM_DIR/$q_num" ]; then
-				cp "$template" "$EXAM_DIR/$q_num/$target_name"
-				print_success "Q$q_num: $target_name template"
-				((++copied))
+				if _copy_template "$template" "$EXAM_DIR/$q_num/$target_name"; then
+					print_success "Q$q_num: $target_name template"
+					((++copied))
+				else
+					((++unchanged))
+				fi
 			fi
 		fi
 	done
@@ -149,9 +781,12 @@ setup_templates() {
 			target_name=$(echo "$filename" | sed 's/q-p[0-9]*-//')
 
 			if [ -d "$EXAM_DIR/$p_num" ]; then
-				cp "$template" "$EXAM_DIR/$p_num/$target_name"
-				print_success "Preview $p_num: $target_name template"
-				((++copied))
+				if _copy_template "$template" "$EXAM_DIR/$p_num/$target_name"; then
+					print_success "Preview $p_num: $target_name template"
+					((++copied))
+				else
+					((++unchanged))
+				fi
 			fi
 		fi
 	done
@@ -166,14 +801,31 @@ setup_templates() {
 			q_num=$(echo "$dirname" | sed 's/q0*\([0-9]*\)-.*/\1/')
 
 			if [ -d "$EXAM_DIR/$q_num/image" ]; then
-				cp -r "$image_dir"* "$EXAM_DIR/$q_num/image/"
-				print_success "Q$q_num: image files (Dockerfile, etc.)"
-				((++copied))
+				local image_copied=0
+				while IFS= read -r -d '' file; do
+					if _copy_template "$file" "$EXAM_DIR/$q_num/image/${file#"$image_dir"}"; then
+						image_copied=1
+					fi
+				done < <(find "$image_dir" -type f -print0)
+				if [ $image_copied -eq 1 ]; then
+					print_success "Q$q_num: image files (Dockerfile, etc.)"
+					((++copied))
+				else
+					((++unchanged))
+				fi
 			fi
 		fi
 	done
 
-	if [ $copied -eq 0 ]; then
+	# Record what was copied where
+	mkdir -p "$(dirname "$ledger_file")"
+	for target in "${!new_template_ledger[@]}"; do
+		printf '%s\t%s\n' "$target" "${new_template_ledger[$target]}"
+	done >"$ledger_file"
+
+	if [ $unchanged -gt 0 ]; then
+		print_skip "$unchanged template(s) unchanged since last setup, edits kept"
+	elif [ $copied -eq 0 ]; then
 		print_skip "No templates to copy"
 	fi
 
@@ -186,19 +838,76 @@ setup_registry() {
 
 	if docker_container_running "registry"; then
 		print_skip "Registry already running"
-		return 0
+	else
+		# Remove stopped registry container if exists
+		docker rm -f registry 2>/dev/null
+
+		# Start registry, from the image cache when the image is not local yet
+		if ! docker image inspect "$REGISTRY_IMAGE" &>/dev/null && [ -f "$(image_archive "$REGISTRY_IMAGE")" ]; then
+			docker load -i "$(image_archive "$REGISTRY_IMAGE")" &>/dev/null || true
+		fi
+		if docker run -d -p 5000:5000 --restart=always --name registry "$REGISTRY_IMAGE" 2>/dev/null; then
+			print_success "Local registry started at localhost:5000"
+		else
+			print_fail "Failed to start local registry"
+			return 1
+		fi
 	fi
 
-	# Remove stopped registry container if exists
-	docker rm -f registry 2>/dev/null
+	images_seed_registry || true
+}
+
+# Helm chart used for exam releases, and the local cache it is installed from.
+# Put a chart archive (e.g. nginx-18.2.4.tgz) in the cache to set up without network.
+HELM_CHART_REPO_URL="https://charts.bitnami.com/bitnami"
+HELM_CHART_REPO_NAME="bitnami"
+HELM_CHART_NAME="nginx"
+HELM_CHART_CACHE_DIR="${CKAD_HELM_CHART_CACHE:-$PROJECT_DIR/.cache/charts}"
+
+# Number of Helm releases installed at the same time
+HELM_INSTALL_JOBS="${HELM_INSTALL_JOBS:-4}"
+
+# Print the path of the newest cached chart archive; fails when the cache is empty
+# Usage: helm_chart_in_cache
+helm_chart_in_cache() {
+	local chart
+	chart=$(ls -1 "$HELM_CHART_CACHE_DIR/$HELM_CHART_NAME"-*.tgz 2>/dev/null | sort -V | tail -1)
+	[ -n "$chart" ] || return 1
+	echo "$chart"
+}
 
-	# Start registry
-	if docker run -d -p 5000:5000 --restart=always --name registry registry:2 2>/dev/null; then
-		print_success "Local registry started at localhost:5000"
+# Print the path of the cached chart archive, pulling it once if the cache is empty
+# Usage: helm_cached_chart
+helm_cached_chart() {
+	if ! helm_chart_in_cache; then
+		mkdir -p "$HELM_CHART_CACHE_DIR"
+		helm pull "$HELM_CHART_NAME" --repo "$HELM_CHART_REPO_URL" \
+			--destination "$HELM_CHART_CACHE_DIR" &>/dev/null || return 1
+		helm_chart_in_cache
+	fi
+}
+
+# Add the chart repository for the candidate (questions use bitnami/nginx)
+# Best effort: setup itself installs from the cache, so offline is not an error
+# Usage: helm_candidate_repo
+helm_candidate_repo() {
+	if helm repo list 2>/dev/null | awk 'NR > 1 {print $1}' | grep -qx "$HELM_CHART_REPO_NAME"; then
+		print_skip "Helm repo $HELM_CHART_REPO_NAME already configured"
+	elif helm repo add "$HELM_CHART_REPO_NAME" "$HELM_CHART_REPO_URL" &>/dev/null; then
+		print_success "Helm repo $HELM_CHART_REPO_NAME added"
 	else
-		print_fail "Failed to start local registry"
-		return 1
+		print_skip "Helm repo $HELM_CHART_REPO_NAME not reachable, add it for Helm questions: helm repo add $HELM_CHART_REPO_NAME $HELM_CHART_REPO_URL"
 	fi
+	return 0
+}
+
+# Install one exam Helm release from a chart archive
+# Usage: helm_install_release <release> <namespace> <chart> <timeout>
+helm_install_release() {
+	helm install "$1" "$3" -n "$2" \
+		--set service.type=ClusterIP \
+		--set replicaCount=1 \
+		--wait --timeout "$4"
 }
 
 # Setup Helm environment
@@ -220,10 +929,14 @@ setup_helm() {
 	# Get helm namespace from config (default to first exam namespace)
 	local helm_ns="${HELM_NAMESPACE:-${EXAM_NAMESPACES[0]}}"
 
-	# Add bitnami repo for Helm charts
-	helm repo add bitnami https://charts.bitnami.com/bitnami 2>/dev/null
-	helm repo update 2>/dev/null
-	print_success "Helm repo configured"
+	# Charts come from the local cache, the network is only used to fill it
+	local chart
+	if ! chart=$(helm_cached_chart); then
+		print_fail "Helm chart $HELM_CHART_NAME not cached and could not be pulled"
+		return 1
+	fi
+	print_success "Helm chart ready: $(basename "$chart")"
+	helm_candidate_repo
 
 	# Wait for helm namespace to be ready
 	local wait_count=0
@@ -237,126 +950,131 @@ setup_helm() {
 		return 1
 	fi
 
-	# Install all Helm releases defined in config
+	# Install the missing releases concurrently, at most HELM_INSTALL_JOBS at a time
+	local existing
+	existing=$(helm list -n "$helm_ns" -a -q 2>/dev/null)
+
+	local results_dir
+	results_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-helm.XXXXXX") || return 1
+
+	local release
 	for release in "${HELM_RELEASES[@]}"; do
-		if ! helm status "$release" -n "$helm_ns" &>/dev/null; then
-			if helm install "$release" bitnami/nginx -n "$helm_ns" \
-				--set service.type=ClusterIP \
-				--set replicaCount=1 \
-				--wait --timeout 120s 2>/dev/null; then
-				print_success "Installed Helm release: $release"
+		if grep -qx "$release" <<<"$existing"; then
+			echo "exists" >"$results_dir/$release"
+			continue
+		fi
+		while [ "$(jobs -rp | wc -l)" -ge "$HELM_INSTALL_JOBS" ]; do
+			wait -n || true
+		done
+		(
+			if helm_install_release "$release" "$helm_ns" "$chart" 120s &>/dev/null; then
+				echo "installed"
 			else
-				print_fail "Failed to install $release"
+				echo "failed"
 			fi
-		else
-			print_skip "$release already exists"
-		fi
+		) >"$results_dir/$release" &
 	done
+	wait
 
+	# Report in config order
+	for release in "${HELM_RELEASES[@]}"; do
+		case "$(cat "$results_dir/$release" 2>/dev/null)" in
+		installed) print_success "Installed Helm release: $release" ;;
+		exists) print_skip "$release already exists" ;;
+		*) print_fail "Failed to install $release" ;;
+		esac
+	done
+
+	rm -rf "$results_dir"
 	return 0
 }
 
-# Post-setup for specific questions requiring multi-step initialization
-setup_post_resources() {
-	print_section "Applying post-setup configurations..."
+# Create a broken revision of a deployment for a rollback question
+# Usage: post_setup_broken_rollout "<namespace>/<deployment> <container>=<image> <question>"
+post_setup_broken_rollout() {
+	local target image_spec question
+	read -r target image_spec question <<<"$1"
+	local ns="${target%%/*}"
+	local deployment="${target#*/}"
+
+	# rollout status watches the deployment and returns as soon as revision 1 is available
+	if ! kubectl rollout status deployment "$deployment" -n "$ns" --timeout=60s &>/dev/null; then
+		print_fail "$question: Deployment $target did not become available"
+		return 1
+	fi
 
-	local errors=0
+	if kubectl set image deployment/"$deployment" "$image_spec" -n "$ns" --record=false &>/dev/null; then
+		print_success "$question: Created broken deployment revision (${image_spec#*=})"
+	else
+		print_fail "$question: Failed to create broken revision"
+		return 1
+	fi
+}
 
-	# ============================================================================
-	# CKAD-SIMULATION1: Q8 - Create broken revision for rollback exercise
-	# ============================================================================
-	if kubectl get deployment api-new-c32 -n neptune &>/dev/null; then
-		# Wait for deployment to be available
-		kubectl rollout status deployment api-new-c32 -n neptune --timeout=60s 2>/dev/null
+# Install a Helm release that never becomes ready (left pending-install or failed)
+# Usage: post_setup_broken_helm_release <release>
+post_setup_broken_helm_release() {
+	local release="$1"
+	local helm_ns="${HELM_NAMESPACE:-${EXAM_NAMESPACES[0]}}"
 
-		# Update with broken image to create revision 2
-		if kubectl set image deployment/api-new-c32 nginx=ngnix:1.25.5-alpine -n neptune --record=false 2>/dev/null; then
-			print_success "Q8: Created broken deployment revision (ngnix typo)"
-		else
-			print_fail "Q8: Failed to create broken revision"
-			((errors++))
-		fi
+	if helm status "$release" -n "$helm_ns" &>/dev/null; then
+		print_skip "$release already exists"
+		return 0
 	fi
 
-	# ============================================================================
-	# CKAD-SIMULATION2: Q21 - Create broken revision for rollback exercise
-	# ============================================================================
-	if kubectl get deployment rollback-app -n hydra &>/dev/null; then
-		# Wait for deployment to be available
-		kubectl rollout status deployment rollback-app -n hydra --timeout=60s 2>/dev/null
-
-		# Update with broken image to create revision 2
-		if kubectl set image deployment/rollback-app nginx=nginx:broken -n hydra --record=false 2>/dev/null; then
-			print_success "Q21: Created broken deployment revision (nginx:broken)"
-		else
-			print_fail "Q21: Failed to create broken revision"
-			((errors++))
-		fi
+	local chart
+	if ! chart=$(helm_cached_chart); then
+		print_fail "Helm chart $HELM_CHART_NAME not cached and could not be pulled"
+		return 1
 	fi
 
-	# ============================================================================
-	# CKAD-SIMULATION3: Q8 - Create broken revision for rollback exercise
-	# ============================================================================
-	if kubectl get deployment battle-app -n ares &>/dev/null; then
-		# Wait for deployment to be available
-		kubectl rollout status deployment battle-app -n ares --timeout=60s 2>/dev/null
+	# The chart cannot be ready within 1s, so --wait gives up and leaves the release broken
+	helm_install_release "$release" "$helm_ns" "$chart" 1s &>/dev/null || true
 
-		# Update with broken image to create revision 2
-		if kubectl set image deployment/battle-app battle-container=nginx:broken-image -n ares --record=false 2>/dev/null; then
-			print_success "Q8: Created broken deployment revision (nginx:broken-image)"
-		else
-			print_fail "Q8: Failed to create broken revision"
-			((errors++))
-		fi
-	fi
+	local state
+	state=$(helm status "$release" -n "$helm_ns" 2>/dev/null | awk '/^STATUS:/ {print $2}')
+	case "$state" in
+	pending-install | failed) print_success "Created broken Helm release $release ($state)" ;;
+	"")
+		print_fail "Failed to create broken Helm release $release"
+		return 1
+		;;
+	*) print_skip "Broken Helm release $release is $state, not pending-install or failed" ;;
+	esac
+}
 
-	# ============================================================================
-	# CKAD-SIMULATION4: Q9 - Create broken revision for rollback exercise
-	# ============================================================================
-	if kubectl get deployment voyage-app -n njord &>/dev/null; then
-		# Wait for deployment to be available
-		kubectl rollout status deployment voyage-app -n njord --timeout=60s 2>/dev/null
+# Post-setup for questions requiring multi-step initialization
+# Runs the current exam's POST_SETUP_* steps concurrently, reported in declaration order
+setup_post_resources() {
+	print_section "Applying post-setup configurations..."
 
-		# Update with broken image to create revision 2
-		if kubectl set image deployment/voyage-app voyage-container=nginx:broken-voyage -n njord --record=false 2>/dev/null; then
-			print_success "Q9: Created broken deployment revision (nginx:broken-voyage)"
-		else
-			print_fail "Q9: Failed to create broken revision"
-			((errors++))
-		fi
+	local results_dir
+	results_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-post.XXXXXX") || return 1
+
+	local count=0 spec
+	for spec in "${POST_SETUP_BROKEN_ROLLOUTS[@]}"; do
+		(post_setup_broken_rollout "$spec" || touch "$results_dir/$count.failed") >"$results_dir/$count" 2>&1 &
+		((++count))
+	done
+	if [ -n "${POST_SETUP_BROKEN_HELM_RELEASE:-}" ]; then
+		(post_setup_broken_helm_release "$POST_SETUP_BROKEN_HELM_RELEASE" ||
+			touch "$results_dir/$count.failed") >"$results_dir/$count" 2>&1 &
+		((++count))
 	fi
+	wait
 
-	# ============================================================================
-	# BOTH EXAMS: Create broken Helm release for Q4/Q13
-	# ============================================================================
-	local helm_ns="${HELM_NAMESPACE:-}"
-	if [ -n "$helm_ns" ] && namespace_exists "$helm_ns"; then
-		# Create a broken Helm release that stays in pending-install state
-		if ! helm status broken-release -n "$helm_ns" &>/dev/null; then
-			# Method: Use --wait with very short timeout (1s)
-			# The chart won't be ready in 1s, leaving release in pending-install state
-			helm install broken-release bitnami/nginx -n "$helm_ns" \
-				--set service.type=ClusterIP \
-				--set replicaCount=1 \
-				--wait --timeout 1s &>/dev/null || true
-
-			# Wait a moment for Helm to record the state
-			sleep 2
-
-			# Verify the release is in pending-install state
-			if helm list -n "$helm_ns" -a 2>/dev/null | grep -q "broken-release.*pending-install"; then
-				print_success "Q4/Q13: Created broken Helm release (pending-install)"
-			elif helm list -n "$helm_ns" -a 2>/dev/null | grep -q "broken-release.*failed"; then
-				# Failed state is also acceptable for the exercise
-				print_success "Q4/Q13: Created broken Helm release (failed)"
-			elif helm list -n "$helm_ns" -a 2>/dev/null | grep -q "broken-release"; then
-				print_success "Q4/Q13: Created broken Helm release"
-			else
-				print_skip "Q4/Q13: Broken Helm release may not be in expected state"
-			fi
+	local errors=0 i
+	for ((i = 0; i < count; i++)); do
+		cat "$results_dir/$i"
+		if [ -f "$results_dir/$i.failed" ]; then
+			((++errors))
 		fi
-	fi
+	done
+	rm -rf "$results_dir"
 
+	if [ $count -eq 0 ]; then
+		print_skip "No post-setup steps for this exam"
+	fi
 	return $errors
 }
 
@@ -374,102 +1092,100 @@ cleanup_namespaces() {
 		return 1
 	fi
 
+	# One read to find the namespaces still present, one delete for all of them
+	local present
+	present=$(remaining_namespaces "${EXAM_NAMESPACES[@]}")
+
+	local targets=() ns
 	for ns in "${EXAM_NAMESPACES[@]}"; do
-		if namespace_exists "$ns"; then
-			kubectl delete namespace "$ns" --wait=false 2>/dev/null
-			print_success "Deleting $ns (background)"
+		if grep -qx "$ns" <<<"$present"; then
+			targets+=("$ns")
 		else
 			print_skip "$ns (not found)"
 		fi
 	done
-}
-
-# Clean up exam-related resources in default namespace
-cleanup_default_namespace() {
-	print_section "Cleaning up default namespace exam resources..."
-
-	local deleted=0
 
-	# Delete user-created pods in default namespace (exclude system pods)
-	local pods
-	pods=$(kubectl get pods -n default -o name 2>/dev/null | grep -v "^pod/kube-\|^pod/coredns\|^pod/etcd\|^pod/local-path" || true)
-	if [ -n "$pods" ]; then
-		for pod in $pods; do
-			kubectl delete "$pod" -n default --grace-period=0 --force 2>/dev/null
-			print_success "Deleted $pod"
-			((++deleted))
+	if [ ${#targets[@]} -gt 0 ]; then
+		kubectl delete namespace "${targets[@]}" --wait=false 2>/dev/null
+		for ns in "${targets[@]}"; do
+			print_success "Deleting $ns (background)"
 		done
 	fi
+}
 
-	# Delete user-created deployments in default namespace
-	local deployments
-	deployments=$(kubectl get deployments -n default -o name 2>/dev/null)
-	if [ -n "$deployments" ]; then
-		for deploy in $deployments; do
-			kubectl delete "$deploy" -n default 2>/dev/null
-			print_success "Deleted $deploy"
-			((++deleted))
-		done
-	fi
+# Kinds cleaned up in the default namespace
+CLEANUP_DEFAULT_KINDS="pods,deployments,services,secrets,configmaps,persistentvolumeclaims,ingresses"
+
+# Objects in the default namespace that cleanup leaves alone, as <kind>/<name> glob patterns.
+# Objects carrying EXAM_OWNER_LABEL are always deleted.
+CLEANUP_KEEP_DEFAULT=(
+	"pod/kube-*"
+	"pod/coredns*"
+	"pod/etcd*"
+	"pod/local-path*"
+	"service/kubernetes"
+	"secret/*default-token*"
+	"secret/*sh.helm.release*"
+	"configmap/*kube-root-ca.crt*"
+)
+
+# Check an object against the default-namespace allow-list
+# Usage: cleanup_keeps_object <kind[.group]/name>
+cleanup_keeps_object() {
+	local ref="$1"
+	local kind="${ref%%/*}"
+	local pattern
+	ref="${kind%%.*}/${ref#*/}"
+
+	for pattern in "${CLEANUP_KEEP_DEFAULT[@]}"; do
+		[[ "$ref" == $pattern ]] && return 0
+	done
+	return 1
+}
 
-	# Delete user-created services (exclude kubernetes service)
-	local services
-	services=$(kubectl get services -n default -o name 2>/dev/null | grep -v "^service/kubernetes$" || true)
-	if [ -n "$services" ]; then
-		for svc in $services; do
-			kubectl delete "$svc" -n default 2>/dev/null
-			print_success "Deleted $svc"
-			((++deleted))
-		done
-	fi
+# Clean up exam-related resources in default namespace
+# One read of every cleaned kind, one read of exam-owned objects, one batched delete.
+cleanup_default_namespace() {
+	print_section "Cleaning up default namespace exam resources..."
 
-	# Delete user-created secrets (exclude default-token and helm releases)
-	local secrets
-	secrets=$(kubectl get secrets -n default -o name 2>/dev/null | grep -v "default-token\|sh.helm.release" || true)
-	if [ -n "$secrets" ]; then
-		for secret in $secrets; do
-			kubectl delete "$secret" -n default 2>/dev/null
-			print_success "Deleted $secret"
-			((++deleted))
-		done
-	fi
+	local objects owned
+	objects=$(kubectl get "$CLEANUP_DEFAULT_KINDS" -n default -o name 2>/dev/null)
+	owned=$(kubectl get "$CLEANUP_DEFAULT_KINDS" -n default -l "$EXAM_OWNER_LABEL" -o name 2>/dev/null)
 
-	# Delete user-created configmaps (exclude kube-root-ca.crt)
-	local configmaps
-	configmaps=$(kubectl get configmaps -n default -o name 2>/dev/null | grep -v "kube-root-ca.crt" || true)
-	if [ -n "$configmaps" ]; then
-		for cm in $configmaps; do
-			kubectl delete "$cm" -n default 2>/dev/null
-			print_success "Deleted $cm"
-			((++deleted))
-		done
-	fi
+	local targets=() object
+	while read -r object; do
+		[ -z "$object" ] && continue
+		if cleanup_keeps_object "$object" && ! grep -qxF "$object" <<<"$owned"; then
+			continue
+		fi
+		targets+=("$object")
+	done <<<"$objects"
 
-	# Delete user-created PVCs in default namespace
-	local pvcs
-	pvcs=$(kubectl get pvc -n default -o name 2>/dev/null)
-	if [ -n "$pvcs" ]; then
-		for pvc in $pvcs; do
-			kubectl delete "$pvc" -n default 2>/dev/null
-			print_success "Deleted $pvc"
-			((++deleted))
-		done
+	if [ ${#targets[@]} -eq 0 ]; then
+		print_skip "No exam resources found in default namespace"
+		return 0
 	fi
 
-	# Delete user-created Ingress resources in default namespace
-	local ingresses
-	ingresses=$(kubectl get ingress -n default -o name 2>/dev/null)
-	if [ -n "$ingresses" ]; then
-		for ingress in $ingresses; do
-			kubectl delete "$ingress" -n default 2>/dev/null
-			print_success "Deleted $ingress"
-			((++deleted))
-		done
+	# Only pods are force-deleted (nothing else waits on them); other kinds go
+	# through normal deletion so finalizers and garbage collection still run
+	local pods=() others=()
+	for object in "${targets[@]}"; do
+		if [[ "$object" == pod/* ]]; then
+			pods+=("$object")
+		else
+			others+=("$object")
+		fi
+	done
+	if [ ${#pods[@]} -gt 0 ]; then
+		kubectl delete "${pods[@]}" -n default --grace-period=0 --force --wait=false \
+			--ignore-not-found &>/dev/null
 	fi
-
-	if [ $deleted -eq 0 ]; then
-		print_skip "No exam resources found in default namespace"
+	if [ ${#others[@]} -gt 0 ]; then
+		kubectl delete "${others[@]}" -n default --wait=false --ignore-not-found &>/dev/null
 	fi
+	for object in "${targets[@]}"; do
+		print_success "Deleted $object"
+	done
 }
 
 # Uninstall Helm releases
@@ -478,18 +1194,18 @@ cleanup_helm() {
 
 	local found_releases=0
 
-	# Search for helm releases in all exam namespaces
-	for ns in "${EXAM_NAMESPACES[@]}"; do
-		if namespace_exists "$ns"; then
-			local releases
-			releases=$(helm list -n "$ns" -q 2>/dev/null)
-			if [ -n "$releases" ]; then
-				for release in $releases; do
-					helm uninstall "$release" -n "$ns" 2>/dev/null
-					print_success "Uninstalled Helm release: $release (namespace: $ns)"
-					((++found_releases))
-				done
-			fi
+	# Search for helm releases in the exam namespaces that still exist
+	local present ns
+	present=$(remaining_namespaces "${EXAM_NAMESPACES[@]}")
+	for ns in $present; do
+		local releases
+		releases=$(helm list -n "$ns" -q 2>/dev/null)
+		if [ -n "$releases" ]; then
+			for release in $releases; do
+				helm uninstall "$release" -n "$ns" 2>/dev/null
+				print_success "Uninstalled Helm release: $release (namespace: $ns)"
+				((++found_releases))
+			done
 		fi
 	done
 
@@ -696,7 +1412,16 @@ cleanup_storage_classes() {
 	fi
 }
 
+# Print the exam namespaces that still exist, one per line, using a single kubectl call
+# Usage: remaining_namespaces <namespace>...
+remaining_namespaces() {
+	[ $# -eq 0 ] && return 0
+	kubectl get namespace "$@" --ignore-not-found -o name 2>/dev/null | sed 's|^namespace/||'
+}
+
 # Wait for namespace deletion to complete
+# One `kubectl wait --for=delete` covers every namespace; it reports each one
+# as it disappears and returns as soon as the last one is gone.
 wait_for_namespace_deletion() {
 	print_section "Waiting for namespace deletion..."
 
@@ -707,25 +1432,31 @@ wait_for_namespace_deletion() {
 	fi
 
 	local timeout=60
-	local elapsed=0
-
-	while [ $elapsed -lt $timeout ]; do
-		local remaining=0
-		for ns in "${EXAM_NAMESPACES[@]}"; do
-			if namespace_exists "$ns"; then
-				((++remaining))
-			fi
-		done
+	local pending=()
+	mapfile -t pending < <(remaining_namespaces "${EXAM_NAMESPACES[@]}")
+
+	if [ ${#pending[@]} -gt 0 ]; then
+		local line
+		kubectl wait --for=delete "${pending[@]/#/namespace/}" --timeout="${timeout}s" 2>/dev/null |
+			while read -r line; do
+				line="${line%% *}"
+				print_success "Deleted ${line#namespace/}"
+			done
+
+		# A namespace that vanished before the wait started makes kubectl wait fail,
+		# so the outcome is decided by what is left, not by its exit code
+		mapfile -t pending < <(remaining_namespaces "${pending[@]}")
+	fi
 
-		if [ $remaining -eq 0 ]; then
-			print_success "All namespaces deleted"
-			return 0
-		fi
+	if [ ${#pending[@]} -eq 0 ]; then
+		print_success "All namespaces deleted"
+		return 0
+	fi
 
-		sleep 2
-		((elapsed += 2))
+	local ns
+	for ns in "${pending[@]}"; do
+		print_fail "$ns still terminating"
 	done
-
 	print_fail "Timeout waiting for namespace deletion"
 	return 1
 }
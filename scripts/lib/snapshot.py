@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Cluster snapshot helper for ckad-score.sh.
+
+Splits bulk `kubectl get -o json` lists into one file per object and answers
+`kubectl get` queries (JSONPath templates, label selectors) against those files,
+so scoring needs one API round-trip per namespace instead of one per criterion.
+
+Usage:
+    snapshot.py build <snapshot_dir> <list.json>...
+    snapshot.py get <snapshot_dir> <scope> <Kind[,Kind...]> <name> <selector> <output>
+
+Exit codes for `get`: 0 = printed result, 1 = object not found,
+3 = query not supported offline (caller should ask the API server).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+EXIT_NOT_FOUND = 1
+EXIT_UNSUPPORTED = 3
+
+CLUSTER_SCOPE = "_cluster"
+
+
+class Unsupported(Exception):
+    """Raised when a query cannot be answered from the snapshot."""
+
+
+# =============================================================================
+# Snapshot build
+# =============================================================================
+
+
+def format_object(obj) -> str:
+    """Format an object the way `kubectl get -o json` does."""
+    return json.dumps(obj, indent=4, sort_keys=True, ensure_ascii=False) + "\n"
+
+
+def build(snapshot_dir: Path, list_files: list) -> int:
+    """Write every item of the given kubectl List files to <scope>/<Kind>/<name>.json."""
+    count = 0
+    for list_file in list_files:
+        data = json.loads(Path(list_file).read_text(encoding="utf-8") or "{}")
+        for item in data.get("items", []):
+            metadata = item.get("metadata", {})
+            name = metadata.get("name")
+            kind = item.get("kind")
+            if not name or not kind:
+                continue
+            scope = metadata.get("namespace") or CLUSTER_SCOPE
+            target = snapshot_dir / scope / kind / f"{name}.json"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(format_object(item), encoding="utf-8")
+            count += 1
+    return count
+
+
+# =============================================================================
+# Label selectors
+# =============================================================================
+
+
+def parse_selector(selector: str) -> list:
+    """Parse an equality-based label selector into (key, op, value) terms."""
+    terms = []
+    for term in filter(None, (t.strip() for t in selector.split(","))):
+        if " " in term or "(" in term:
+            raise Unsupported(f"set-based selector: {term}")
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            terms.append((key, "!=", value))
+        elif "==" in term:
+            key, value = term.split("==", 1)
+            terms.append((key, "=", value))
+        elif "=" in term:
+            key, value = term.split("=", 1)
+            terms.append((key, "=", value))
+        elif term.startswith("!"):
+            terms.append((term[1:], "!", None))
+        else:
+            terms.append((term, "exists", None))
+    return terms
+
+
+def selector_matches(terms: list, labels: dict) -> bool:
+    """Check labels against parsed selector terms."""
+    for key, op, value in terms:
+        if op == "=" and labels.get(key) != value:
+            return False
+        if op == "!=" and labels.get(key) == value:
+            return False
+        if op == "!" and key in labels:
+            return False
+        if op == "exists" and key not in labels:
+            return False
+    return True
+
+
+# =============================================================================
+# JSONPath (kubectl flavour)
+# =============================================================================
+
+
+def parse_literal(text: str):
+    """Parse a filter literal: quoted string, number or boolean."""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]
+    if text in ("true", "false"):
+        return text == "true"
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        raise Unsupported(f"filter literal: {text}") from None
+
+
+def parse_path(path: str) -> list:
+    """Split a JSONPath expression like .spec.containers[0].name into steps."""
+    steps = []
+    i = 0
+    if path.startswith("$"):
+        i = 1
+    while i < len(path):
+        char = path[i]
+        if path.startswith("..", i):
+            raise Unsupported("recursive descent")
+        if char == ".":
+            i += 1
+            name = []
+            while i < len(path) and path[i] not in ".[":
+                if path[i] == "\\" and i + 1 < len(path):
+                    i += 1
+                name.append(path[i])
+                i += 1
+            name = "".join(name)
+            if name == "*":
+                steps.append(("wildcard", None))
+            elif name:
+                steps.append(("field", name))
+        elif char == "[":
+            end = path.find("]", i)
+            if end == -1:
+                raise Unsupported(f"unterminated bracket in {path}")
+            inner = path[i + 1:end]
+            if inner.startswith("?("):
+                end = path.find(")]", i)
+                if end == -1:
+                    raise Unsupported(f"unterminated filter in {path}")
+                steps.append(("filter", parse_filter(path[i + 3:end])))
+                end += 1
+            elif inner == "*":
+                steps.append(("wildcard", None))
+            elif len(inner) >= 2 and inner[0] == inner[-1] and inner[0] in "\"'":
+                steps.append(("field", inner[1:-1]))
+            else:
+                try:
+                    steps.append(("index", int(inner)))
+                except ValueError:
+                    raise Unsupported(f"subscript: [{inner}]") from None
+            i = end + 1
+        else:
+            raise Unsupported(f"unexpected '{char}' in {path}")
+    return steps
+
+
+def parse_filter(expression: str) -> tuple:
+    """Parse the inside of [?(...)] into (relative_steps, op, literal)."""
+    for op in ("==", "!="):
+        if op in expression:
+            left, right = expression.split(op, 1)
+            left = left.strip()
+            if not left.startswith("@"):
+                raise Unsupported(f"filter: {expression}")
+            return parse_path(left[1:]), op, parse_literal(right)
+    expression = expression.strip()
+    if expression.startswith("@"):
+        return parse_path(expression[1:]), "exists", None
+    raise Unsupported(f"filter: {expression}")
+
+
+def literal_equals(value, literal) -> bool:
+    """Compare a JSON value with a filter literal."""
+    if isinstance(value, bool) or isinstance(literal, bool):
+        return value is literal
+    if isinstance(value, (int, float)) and isinstance(literal, (int, float)):
+        return value == literal
+    return str(value) == str(literal)
+
+
+def evaluate(steps: list, values: list) -> list:
+    """Apply path steps to a list of values, dropping missing keys."""
+    for kind, arg in steps:
+        results = []
+        for value in values:
+            if kind == "field":
+                if isinstance(value, dict) and arg in value:
+                    results.append(value[arg])
+            elif kind == "index":
+                if isinstance(value, list) and -len(value) <= arg < len(value):
+                    results.append(value[arg])
+            elif kind == "wildcard":
+                if isinstance(value, dict):
+                    results.extend(value[key] for key in sorted(value))
+                elif isinstance(value, list):
+                    results.extend(value)
+            elif kind == "filter":
+                if not isinstance(value, list):
+                    continue
+                sub_steps, op, literal = arg
+                for element in value:
+                    found = evaluate(sub_steps, [element])
+                    if op == "exists":
+                        matched = bool(found)
+                    elif op == "==":
+                        matched = any(literal_equals(f, literal) for f in found)
+                    else:
+                        matched = bool(found) and not any(literal_equals(f, literal) for f in found)
+                    if matched:
+                        results.append(element)
+        values = results
+    return values
+
+
+def format_value(value) -> str:
+    """Print a JSONPath result the way kubectl does."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)):
+        return str(value)
+    text = json.dumps(value, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+    return text.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+
+
+def unescape(text: str) -> str:
+    """Process backslash escapes in template string literals."""
+    return text.replace("\\n", "\n").replace("\\t", "\t").replace("\\r", "\r")
+
+
+def parse_template(template: str) -> list:
+    """Parse a JSONPath template into text, expression and range nodes."""
+    root = []
+    stack = [root]
+    i = 0
+    while i < len(template):
+        start = template.find("{", i)
+        if start == -1:
+            stack[-1].append(("text", template[i:]))
+            break
+        if start > i:
+            stack[-1].append(("text", template[i:start]))
+        end = template.find("}", start)
+        if end == -1:
+            raise Unsupported("unterminated template")
+        expression = template[start + 1:end].strip()
+        if len(expression) >= 2 and expression[0] == '"' and expression[-1] == '"':
+            stack[-1].append(("text", unescape(expression[1:-1])))
+        elif expression.startswith("range "):
+            node = ("range", parse_path(expression[6:].strip()), [])
+            stack[-1].append(node)
+            stack.append(node[2])
+        elif expression == "end":
+            if len(stack) == 1:
+                raise Unsupported("unmatched {end}")
+            stack.pop()
+        elif expression.startswith((".", "$", "@")):
+            path = expression[1:] if expression.startswith("@") else expression
+            stack[-1].append(("path", parse_path(path)))
+        else:
+            raise Unsupported(f"template expression: {expression}")
+        i = end + 1
+    if len(stack) != 1:
+        raise Unsupported("unterminated {range}")
+    return root
+
+
+def render(nodes: list, data) -> str:
+    """Render parsed template nodes against a JSON document."""
+    out = []
+    for node in nodes:
+        if node[0] == "text":
+            out.append(node[1])
+        elif node[0] == "path":
+            out.append(" ".join(format_value(v) for v in evaluate(node[1], [data])))
+        else:
+            for element in evaluate(node[1], [data]):
+                out.append(render(node[2], element))
+    return "".join(out)
+
+
+def jsonpath(template: str, data) -> str:
+    """Evaluate a kubectl -o jsonpath template."""
+    return render(parse_template(template), data)
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+
+def get(snapshot_dir: Path, scope: str, kind: str, name: str, selector: str, output: str) -> int:
+    """Answer a kubectl get query from the snapshot.
+
+    `kind` may list several kinds separated by commas (lists only).
+    """
+    kinds = kind.split(",")
+
+    if name:
+        if selector or len(kinds) > 1:
+            raise Unsupported("name with selector or several kinds")
+        obj_file = snapshot_dir / scope / kind / f"{name}.json"
+        if not obj_file.is_file():
+            return EXIT_NOT_FOUND
+        data = json.loads(obj_file.read_text(encoding="utf-8"))
+    else:
+        terms = parse_selector(selector)
+        items = []
+        for kind_dir in (snapshot_dir / scope / k for k in kinds):
+            if not kind_dir.is_dir():
+                continue
+            kind_items = []
+            for obj_file in kind_dir.glob("*.json"):
+                item = json.loads(obj_file.read_text(encoding="utf-8"))
+                labels = item.get("metadata", {}).get("labels") or {}
+                if selector_matches(terms, labels):
+                    kind_items.append(item)
+            # kubectl lists each kind by namespace, then name
+            kind_items.sort(key=lambda item: (
+                item["metadata"].get("namespace", ""), item["metadata"]["name"]
+            ))
+            items.extend(kind_items)
+        data = {
+            "apiVersion": "v1",
+            "items": items,
+            "kind": "List",
+            "metadata": {"resourceVersion": ""},
+        }
+
+    if output == "json":
+        sys.stdout.write(format_object(data))
+    elif output.startswith("jsonpath="):
+        sys.stdout.write(jsonpath(output[len("jsonpath="):], data))
+    else:
+        raise Unsupported(f"output format: {output}")
+    return 0
+
+
+def main() -> int:
+    """Entry point."""
+    if len(sys.argv) >= 3 and sys.argv[1] == "build":
+        count = build(Path(sys.argv[2]), sys.argv[3:])
+        print(count)
+        return 0
+
+    if len(sys.argv) == 8 and sys.argv[1] == "get":
+        _, _, snapshot_dir, scope, kind, name, selector, output = sys.argv
+        try:
+            return get(Path(snapshot_dir), scope, kind, name, selector, output)
+        except Unsupported:
+            return EXIT_UNSUPPORTED
+
+    print(__doc__.strip(), file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/bin/bash
+# snapshot.sh - Snapshot-based scoring for CKAD Exam Simulator
+# Reads the exam namespaces once and answers `kubectl get` from the snapshot,
+# so scoring functions run unchanged without one API call per criterion
+
+SNAPSHOT_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SNAPSHOT_HELPER="$SNAPSHOT_LIB_DIR/snapshot.py"
+
+# Snapshot directory (empty = snapshot disabled, kubectl hits the API server)
+SNAPSHOT_DIR=""
+
+# Resource kinds captured per namespace and cluster-wide
+SNAPSHOT_NAMESPACED_KINDS="pods,deployments,replicasets,statefulsets,daemonsets,jobs,cronjobs,services,endpoints,ingresses,networkpolicies,configmaps,secrets,serviceaccounts,persistentvolumeclaims,poddisruptionbudgets,horizontalpodautoscalers,limitranges,resourcequotas,roles,rolebindings"
+SNAPSHOT_CLUSTER_KINDS="namespaces,persistentvolumes,storageclasses,priorityclasses,clusterroles,clusterrolebindings"
+
+# Return code meaning "not answerable from the snapshot, ask the API server"
+SNAPSHOT_UNSUPPORTED=3
+
+# Take a snapshot of the given namespaces plus cluster-scoped kinds
+# Usage: snapshot_take <namespace>...
+# A namespace whose read fails is left out, so its queries go to the API server.
+snapshot_take() {
+	local namespaces=("$@")
+	local snapshot_dir
+	snapshot_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-snapshot.XXXXXX") || return 1
+	local raw_dir="$snapshot_dir/.raw"
+	mkdir -p "$raw_dir"
+
+	# One bulk read per namespace, all in flight at the same time
+	local pids=() scopes=() ns
+	for ns in "${namespaces[@]}"; do
+		command kubectl get "$SNAPSHOT_NAMESPACED_KINDS" -n "$ns" -o json >"$raw_dir/$ns.json" 2>/dev/null &
+		pids+=($!)
+		scopes+=("$ns")
+	done
+	command kubectl get "$SNAPSHOT_CLUSTER_KINDS" -o json >"$raw_dir/_cluster.json" 2>/dev/null &
+	pids+=($!)
+	scopes+=("_cluster")
+
+	local i captured=0
+	for i in "${!pids[@]}"; do
+		if wait "${pids[$i]}"; then
+			mkdir -p "$snapshot_dir/${scopes[$i]}"
+			((++captured))
+		else
+			rm -f "$raw_dir/${scopes[$i]}.json"
+		fi
+	done
+
+	if [ $captured -eq 0 ] ||
+		! python3 "$SNAPSHOT_HELPER" build "$snapshot_dir" "$raw_dir"/*.json >/dev/null; then
+		rm -rf "$snapshot_dir"
+		return 1
+	fi
+
+	rm -rf "$raw_dir"
+	SNAPSHOT_DIR="$snapshot_dir"
+	export SNAPSHOT_DIR
+	return 0
+}
+
+# Discard the current snapshot
+snapshot_clear() {
+	if [ -n "$SNAPSHOT_DIR" ] && [ -d "$SNAPSHOT_DIR" ]; then
+		rm -rf "$SNAPSHOT_DIR"
+	fi
+	SNAPSHOT_DIR=""
+}
+
+# Map a kubectl resource name or short name to its Kind and scope
+# Usage: _snapshot_kind <resource>  -> prints "<Kind> <namespaced|cluster>"
+_snapshot_kind() {
+	local resource="${1,,}"
+	resource="${resource%%.*}"
+
+	case "$resource" in
+	po | pod | pods) echo "Pod namespaced" ;;
+	deploy | deployment | deployments) echo "Deployment namespaced" ;;
+	rs | replicaset | replicasets) echo "ReplicaSet namespaced" ;;
+	sts | statefulset | statefulsets) echo "StatefulSet namespaced" ;;
+	ds | daemonset | daemonsets) echo "DaemonSet namespaced" ;;
+	job | jobs) echo "Job namespaced" ;;
+	cj | cronjob | cronjobs) echo "CronJob namespaced" ;;
+	svc | service | services) echo "Service namespaced" ;;
+	ep | endpoints) echo "Endpoints namespaced" ;;
+	ing | ingress | ingresses) echo "Ingress namespaced" ;;
+	netpol | networkpolicy | networkpolicies) echo "NetworkPolicy namespaced" ;;
+	cm | configmap | configmaps) echo "ConfigMap namespaced" ;;
+	secret | secrets) echo "Secret namespaced" ;;
+	sa | serviceaccount | serviceaccounts) echo "ServiceAccount namespaced" ;;
+	pvc | persistentvolumeclaim | persistentvolumeclaims) echo "PersistentVolumeClaim namespaced" ;;
+	pdb | poddisruptionbudget | poddisruptionbudgets) echo "PodDisruptionBudget namespaced" ;;
+	hpa | horizontalpodautoscaler | horizontalpodautoscalers) echo "HorizontalPodAutoscaler namespaced" ;;
+	limits | limitrange | limitranges) echo "LimitRange namespaced" ;;
+	quota | resourcequota | resourcequotas) echo "ResourceQuota namespaced" ;;
+	role | roles) echo "Role namespaced" ;;
+	rolebinding | rolebindings) echo "RoleBinding namespaced" ;;
+	ns | namespace | namespaces) echo "Namespace cluster" ;;
+	pv | persistentvolume | persistentvolumes) echo "PersistentVolume cluster" ;;
+	sc | storageclass | storageclasses) echo "StorageClass cluster" ;;
+	pc | priorityclass | priorityclasses) echo "PriorityClass cluster" ;;
+	clusterrole | clusterroles) echo "ClusterRole cluster" ;;
+	clusterrolebinding | clusterrolebindings) echo "ClusterRoleBinding cluster" ;;
+	*) return 1 ;;
+	esac
+}
+
+# Answer a `kubectl get` from the snapshot
+# Returns SNAPSHOT_UNSUPPORTED when the query needs the API server
+_snapshot_kubectl_get() {
+	local resource="" name="" namespace="default" output="" selector=""
+
+	while [ $# -gt 0 ]; do
+		case "$1" in
+		-n | --namespace)
+			namespace="$2"
+			shift 2
+			;;
+		--namespace=*)
+			namespace="${1#*=}"
+			shift
+			;;
+		-o | --output)
+			output="$2"
+			shift 2
+			;;
+		--output=*)
+			output="${1#*=}"
+			shift
+			;;
+		-o*)
+			output="${1#-o}"
+			output="${output#=}"
+			shift
+			;;
+		-l | --selector)
+			selector="$2"
+			shift 2
+			;;
+		--selector=*)
+			selector="${1#*=}"
+			shift
+			;;
+		-*)
+			return $SNAPSHOT_UNSUPPORTED
+			;;
+		*)
+			if [ -z "$resource" ]; then
+				resource="$1"
+			elif [ -z "$name" ]; then
+				name="$1"
+			else
+				return $SNAPSHOT_UNSUPPORTED
+			fi
+			shift
+			;;
+		esac
+	done
+
+	# Support the TYPE/NAME form
+	if [ -z "$name" ] && [[ "$resource" == */* ]]; then
+		name="${resource#*/}"
+		resource="${resource%%/*}"
+	fi
+
+	if [ -z "$resource" ] || [[ "$resource" == *,* ]]; then
+		return $SNAPSHOT_UNSUPPORTED
+	fi
+
+	local kind_info kind scope
+	kind_info=$(_snapshot_kind "$resource") || return $SNAPSHOT_UNSUPPORTED
+	read -r kind scope <<<"$kind_info"
+	if [ "$scope" = "cluster" ]; then
+		scope="_cluster"
+	else
+		scope="$namespace"
+	fi
+
+	# Namespace (or cluster scope) was not captured
+	if [ ! -d "$SNAPSHOT_DIR/$scope" ]; then
+		return $SNAPSHOT_UNSUPPORTED
+	fi
+
+	# Fast paths for single objects: existence checks and -o json need no process
+	if [ -n "$name" ] && [ -z "$selector" ]; then
+		local obj_file="$SNAPSHOT_DIR/$scope/$kind/$name.json"
+		if [ ! -f "$obj_file" ]; then
+			echo "Error from server (NotFound): ${resource%%.*} \"$name\" not found" >&2
+			return 1
+		fi
+		case "$output" in
+		"")
+			printf "NAME\n%s\n" "$name"
+			return 0
+			;;
+		json)
+			cat "$obj_file"
+			return 0
+			;;
+		esac
+	fi
+
+	case "$output" in
+	json | jsonpath=*) ;;
+	*) return $SNAPSHOT_UNSUPPORTED ;;
+	esac
+
+	local rc=0
+	python3 "$SNAPSHOT_HELPER" get "$SNAPSHOT_DIR" "$scope" "$kind" "$name" "$selector" "$output" || rc=$?
+	if [ $rc -eq 1 ]; then
+		echo "Error from server (NotFound): ${resource%%.*} \"$name\" not found" >&2
+	fi
+	return $rc
+}
+
+# kubectl wrapper: `get` is served from the snapshot when one is active,
+# everything else (and anything the snapshot cannot answer) goes to kubectl
+kubectl() {
+	if [ -n "$SNAPSHOT_DIR" ] && [ "$1" = "get" ]; then
+		local rc=0
+		_snapshot_kubectl_get "${@:2}" || rc=$?
+		if [ $rc -ne $SNAPSHOT_UNSUPPORTED ]; then
+			return $rc
+		fi
+	fi
+	command kubectl "$@"
+}
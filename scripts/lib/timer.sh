@@ -23,6 +23,37 @@ timer_init() {
 	mkdir -p "$TIMER_STATE_DIR"
 }
 
+# Write the state file atomically (temp file + rename), always the same six keys
+# Usage: _timer_write_state <start_time> <end_time> <duration> <warning> <exam_name> <status>
+_timer_write_state() {
+	local tmp_file
+	tmp_file=$(mktemp "$TIMER_STATE_DIR/timer.state.XXXXXX") || return 1
+	printf 'START_TIME=%s\nEND_TIME=%s\nDURATION=%s\nWARNING=%s\nEXAM_NAME=%s\nSTATUS=%s\n' \
+		"$@" >"$tmp_file"
+	mv -f "$tmp_file" "$TIMER_STATE_FILE"
+}
+
+# Load START_TIME, END_TIME, DURATION, WARNING, EXAM_NAME and STATUS
+# from the state file (parsed, not sourced, so names with spaces are safe)
+_timer_read_state() {
+	[ -f "$TIMER_STATE_FILE" ] || return 1
+
+	local key value
+	while IFS='=' read -r key value; do
+		case "$key" in
+		START_TIME | END_TIME | DURATION | WARNING | EXAM_NAME | STATUS)
+			printf -v "$key" '%s' "$value"
+			;;
+		esac
+	done <"$TIMER_STATE_FILE"
+}
+
+# Rewrite the state file with a new STATUS
+_timer_set_status() {
+	_timer_read_state || return 1
+	_timer_write_state "$START_TIME" "$END_TIME" "$DURATION" "$WARNING" "$EXAM_NAME" "$1"
+}
+
 # Format seconds to HH:MM:SS
 format_time() {
 	local total_seconds=$1
@@ -69,35 +100,25 @@ timer_start() {
 	local start_time=$(date +%s)
 	local end_time=$((start_time + total_seconds))
 
-	# Save state
-	echo "START_TIME=$start_time" >"$TIMER_STATE_FILE"
-	echo "END_TIME=$end_time" >>"$TIMER_STATE_FILE"
-	echo "DURATION=$duration_minutes" >>"$TIMER_STATE_FILE"
-	echo "WARNING=$warning_minutes" >>"$TIMER_STATE_FILE"
-	echo "EXAM_NAME=$exam_name" >>"$TIMER_STATE_FILE"
-	echo "STATUS=running" >>"$TIMER_STATE_FILE"
+	# Save state: the deadline is stored once, readers compute the remaining time
+	_timer_write_state "$start_time" "$end_time" "$duration_minutes" "$warning_minutes" \
+		"$exam_name" running
 
-	# Start background timer process
+	# Start background timer process: sleeps until the deadline, then expires
 	(
-		trap 'exit 0' TERM INT
-
-		while true; do
-			local current_time=$(date +%s)
-			local remaining=$((end_time - current_time))
+		sleep_pid=""
+		trap 'kill $sleep_pid 2>/dev/null; exit 0' TERM INT
 
-			if [ $remaining -le 0 ]; then
-				# Time's up!
-				echo "STATUS=expired" >>"$TIMER_STATE_FILE"
-				_timer_display_expired "$exam_name"
-				exit 0
-			fi
-
-			# Update state
-			sed -i "s/^STATUS=.*/STATUS=running/" "$TIMER_STATE_FILE" 2>/dev/null
-			echo "REMAINING=$remaining" >>"$TIMER_STATE_FILE"
-
-			sleep 1
+		while [ "$(date +%s)" -lt "$end_time" ]; do
+			sleep $((end_time - $(date +%s))) &
+			sleep_pid=$!
+			wait $sleep_pid
 		done
+
+		# Time's up!
+		_timer_set_status expired
+		_timer_display_expired "$exam_name"
+		exit 0
 	) &
 
 	local timer_pid=$!
@@ -134,7 +155,7 @@ timer_stop() {
 	fi
 
 	if [ -f "$TIMER_STATE_FILE" ]; then
-		sed -i "s/^STATUS=.*/STATUS=stopped/" "$TIMER_STATE_FILE" 2>/dev/null
+		_timer_set_status stopped
 	fi
 }
 
@@ -151,8 +172,7 @@ timer_is_running() {
 
 # Get remaining time in seconds
 timer_remaining() {
-	if [ -f "$TIMER_STATE_FILE" ]; then
-		source "$TIMER_STATE_FILE"
+	if _timer_read_state; then
 		local current_time=$(date +%s)
 		local remaining=$((END_TIME - current_time))
 		if [ $remaining -lt 0 ]; then
@@ -172,8 +192,7 @@ timer_status() {
 		return
 	fi
 
-	if [ -f "$TIMER_STATE_FILE" ]; then
-		source "$TIMER_STATE_FILE"
+	if _timer_read_state; then
 		echo "${STATUS:-unknown}"
 	else
 		echo "unknown"
@@ -187,7 +206,7 @@ timer_display() {
 		return
 	fi
 
-	source "$TIMER_STATE_FILE" 2>/dev/null
+	_timer_read_state
 
 	local remaining=$(timer_remaining)
 	local warning_seconds=$((WARNING * 60))
@@ -217,7 +236,7 @@ timer_watch() {
 		return 1
 	fi
 
-	source "$TIMER_STATE_FILE" 2>/dev/null
+	_timer_read_state
 
 	echo ""
 	echo -e "${TIMER_CYAN}${TIMER_BOLD}Watching timer for: $EXAM_NAME${TIMER_NC}"
@@ -269,13 +288,11 @@ timer_reset() {
 
 # Show timer info
 timer_info() {
-	if [ ! -f "$TIMER_STATE_FILE" ]; then
+	if ! _timer_read_state; then
 		echo "No timer state found"
 		return 1
 	fi
 
-	source "$TIMER_STATE_FILE"
-
 	echo ""
 	echo -e "${TIMER_BLUE}╔═══════════════════════════════════════════════════════════════╗${TIMER_NC}"
 	echo -e "${TIMER_BLUE}║                      TIMER INFO                               ║${TIMER_NC}"
@@ -300,3 +317,4 @@ timer_info() {
 export -f timer_init timer_start timer_stop timer_is_running
 export -f timer_remaining timer_status timer_display timer_compact
 export -f timer_watch timer_reset timer_info format_time
+export -f _timer_write_state _timer_read_state _timer_set_status
@@ -0,0 +1,117 @@
+#!/bin/bash
+# bench-cli.sh - CLI startup benchmark for CKAD Exam Simulator
+# Measures what ckad_dojo.py adds on top of the Python interpreter's own startup
+# for tab completion (exam IDs, other words) and a plain command, and reports
+# the module import time.
+
+set -e
+
+BENCH_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$BENCH_DIR/../.." && pwd)"
+source "$PROJECT_DIR/scripts/lib/common.sh"
+
+CLI="$PROJECT_DIR/ckad_dojo.py"
+
+# Show help
+show_help() {
+	echo "Usage: $(basename "$0") [OPTIONS]"
+	echo ""
+	echo "Benchmark ckad-dojo startup (run under the Python that runs the CLI)."
+	echo ""
+	echo "OPTIONS:"
+	echo "  -h, --help           Show this help message"
+	echo "  -n, --runs N         Runs per measurement, the median is reported (default: 10)"
+	echo "  --max-ms MS          Fail if exam ID completion adds more than MS (default: 50)"
+	echo ""
+	echo "EXAMPLES:"
+	echo "  $(basename "$0")                  # Report startup costs"
+	echo "  uv run $(basename "$0") -n 20     # With the project's environment"
+}
+
+# Microseconds since the epoch
+now_us() {
+	local now="${EPOCHREALTIME/[.,]/}"
+	echo "$now"
+}
+
+# Median wall time of a command in milliseconds
+# Usage: median_ms <command>...
+median_ms() {
+	local times=() start i
+	for i in $(seq 1 "$RUNS"); do
+		start=$(now_us)
+		"$@" >/dev/null 2>&1 8>/dev/null 9>/dev/null || true
+		times+=($((($(now_us) - start) / 1000)))
+	done
+	printf "%s\n" "${times[@]}" | sort -n | sed -n "$(((RUNS + 1) / 2))p"
+}
+
+# Run the CLI as the shell does on <TAB>
+# Usage: complete_line <command line>
+complete_line() {
+	COMP_LINE="$1" COMP_POINT="${#1}" _ARGCOMPLETE=1 python3 "$CLI"
+}
+
+# Parse arguments
+RUNS=10
+MAX_MS=50
+
+while [[ $# -gt 0 ]]; do
+	case $1 in
+	-h | --help)
+		show_help
+		exit 0
+		;;
+	-n | --runs)
+		RUNS="$2"
+		shift 2
+		;;
+	--max-ms)
+		MAX_MS="$2"
+		shift 2
+		;;
+	*)
+		print_error "Unknown option: $1"
+		show_help
+		exit 1
+		;;
+	esac
+done
+
+if [ -z "${EPOCHREALTIME:-}" ]; then
+	print_error "bash 5 or newer is required (EPOCHREALTIME)"
+	exit 1
+fi
+
+# Warm the bytecode and exam ID caches so every run measures the steady state
+unset PYTHONDONTWRITEBYTECODE
+python3 -m compileall -q "$CLI" >/dev/null
+complete_line "ckad-dojo setup -e " 8>/dev/null 9>/dev/null || true
+
+print_header "CKAD Exam Simulator - CLI Startup"
+
+BASELINE=$(median_ms python3 -c pass)
+EXAM_ID_MS=$(median_ms complete_line "ckad-dojo setup -e ckad-")
+COMMAND_MS=$(median_ms complete_line "ckad-dojo ")
+HELP_MS=$(median_ms python3 "$CLI" --help)
+
+echo ""
+printf "%-38s %10s %10s\n" "Measurement (median of $RUNS)" "Wall (ms)" "CLI (ms)"
+printf "%-38s %10s %10s\n" "--------------------------------------" "---------" "--------"
+printf "%-38s %10d %10s\n" "python3 -c pass" "$BASELINE" "-"
+printf "%-38s %10d %10d\n" "complete 'setup -e ckad-<TAB>'" "$EXAM_ID_MS" $((EXAM_ID_MS - BASELINE))
+printf "%-38s %10d %10d\n" "complete 'ckad-dojo <TAB>'" "$COMMAND_MS" $((COMMAND_MS - BASELINE))
+printf "%-38s %10d %10d\n" "ckad-dojo --help" "$HELP_MS" $((HELP_MS - BASELINE))
+
+# Modules imported on the way, as reported by python -X importtime
+IMPORT_US=$(cd "$PROJECT_DIR" && python3 -X importtime -c "import ckad_dojo" 2>&1 |
+	sed -n 's/^import time: *[0-9]* | *\([0-9]*\) | ckad_dojo$/\1/p')
+echo ""
+echo "import ckad_dojo: ${IMPORT_US:-?} us (including its module-level imports)"
+
+echo ""
+if [ $((EXAM_ID_MS - BASELINE)) -gt "$MAX_MS" ]; then
+	print_fail "Exam ID completion adds $((EXAM_ID_MS - BASELINE)) ms (budget: $MAX_MS ms)"
+	exit 1
+fi
+print_success "Exam ID completion within budget ($((EXAM_ID_MS - BASELINE)) ms of $MAX_MS ms)"
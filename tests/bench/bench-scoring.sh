@@ -0,0 +1,224 @@
+#!/bin/bash
+# bench-scoring.sh - Scoring benchmark for CKAD Exam Simulator
+# Runs each exam's scoring functions end to end against a fake kubectl that
+# serves recorded cluster JSON, and reports wall time, kubectl invocations
+# and per-question latency.
+
+set -e
+
+BENCH_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$BENCH_DIR/../.." && pwd)"
+source "$PROJECT_DIR/scripts/lib/common.sh"
+source "$PROJECT_DIR/scripts/lib/snapshot.sh"
+
+SCORE_SCRIPT="$PROJECT_DIR/scripts/ckad-score.sh"
+
+# Show help
+show_help() {
+	echo "Usage: $(basename "$0") [OPTIONS] [-- SCORE_OPTIONS]"
+	echo ""
+	echo "Benchmark exam scoring against a fake kubectl."
+	echo ""
+	echo "OPTIONS:"
+	echo "  -h, --help           Show this help message"
+	echo "  -e, --exam EXAM      Exam to benchmark (repeatable, default: all exams)"
+	echo "  -f, --fixtures DIR   Recorded cluster JSON (default: empty exam namespaces)"
+	echo "  -l, --latency SECS   Simulated API latency per kubectl call (default: 0)"
+	echo "  --max-calls N        Fail if an exam needs more than N kubectl calls"
+	echo "  --record DIR         Record the current cluster into DIR and exit"
+	echo ""
+	echo "Options after -- are passed to ckad-score.sh for the end-to-end run."
+	echo ""
+	echo "EXAMPLES:"
+	echo "  $(basename "$0")                                # All exams, no latency"
+	echo "  $(basename "$0") -e ckad-simulation2 -l 0.05    # 50ms per API call"
+	echo "  $(basename "$0") -l 0.05 -- -j 8 --snapshot     # Benchmark parallel snapshot scoring"
+	echo "  $(basename "$0") --record fixtures/solved       # Record a solved cluster"
+}
+
+# Record the live cluster as fixture files (one List per scope)
+record_fixtures() {
+	local dir="$1"
+	mkdir -p "$dir"
+	kubectl get "$SNAPSHOT_NAMESPACED_KINDS" --all-namespaces -o json >"$dir/namespaced.json"
+	kubectl get "$SNAPSHOT_CLUSTER_KINDS" -o json >"$dir/cluster.json"
+	print_success "Recorded cluster into $dir"
+}
+
+# Build the fake cluster snapshot for an exam
+# Usage: build_fake_cluster <snapshot_dir> <exam_id>
+build_fake_cluster() {
+	local snapshot_dir="$1" exam_id="$2"
+	local namespaces=(default)
+	namespaces+=($(source "$EXAMS_DIR/$exam_id/exam.conf" && echo "${EXAM_NAMESPACES[@]}"))
+
+	local lists=()
+	if [ -n "$FIXTURES_DIR" ]; then
+		lists=("$FIXTURES_DIR"/*.json)
+	else
+		# No recording: an untouched exam, i.e. just its namespaces
+		local ns_list="$snapshot_dir/.namespaces.json"
+		{
+			echo '{"apiVersion": "v1", "kind": "List", "items": ['
+			local ns sep=""
+			for ns in "${namespaces[@]}"; do
+				printf '%s{"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "%s"}, "status": {"phase": "Active"}}\n' "$sep" "$ns"
+				sep=","
+			done
+			echo ']}'
+		} >"$ns_list"
+		lists=("$ns_list")
+	fi
+
+	python3 "$SNAPSHOT_HELPER" build "$snapshot_dir" "${lists[@]}" >/dev/null
+
+	# Exam namespaces and cluster scope always answer (empty rather than unsupported)
+	local ns
+	for ns in "${namespaces[@]}" _cluster; do
+		mkdir -p "$snapshot_dir/$ns"
+	done
+}
+
+# Milliseconds since the epoch
+now_ms() {
+	echo $(($(date +%s%N) / 1000000))
+}
+
+# Count lines of a file (0 if missing)
+count_lines() {
+	if [ -f "$1" ]; then
+		wc -l <"$1" | tr -d ' '
+	else
+		echo 0
+	fi
+}
+
+# Benchmark one exam
+# Usage: bench_exam <exam_id>
+bench_exam() {
+	local exam_id="$1"
+	local work_dir
+	work_dir=$(mktemp -d "${TMPDIR:-/tmp}/ckad-bench.XXXXXX")
+
+	export FAKE_KUBECTL_SNAPSHOT="$work_dir/cluster"
+	export FAKE_KUBECTL_LATENCY="$LATENCY"
+	export FAKE_KUBECTL_LOG="$work_dir/calls.log"
+	export FAKE_KUBECTL_MISSES="$work_dir/misses.log"
+	# Cluster checks must reach the fake kubectl, not the real kubeconfig
+	export CKAD_KUBE_CLIENT=kubectl
+	mkdir -p "$FAKE_KUBECTL_SNAPSHOT"
+	build_fake_cluster "$FAKE_KUBECTL_SNAPSHOT" "$exam_id"
+
+	local total_questions preview_questions
+	total_questions=$(source "$EXAMS_DIR/$exam_id/exam.conf" && echo "${TOTAL_QUESTIONS:-0}")
+	preview_questions=$(source "$EXAMS_DIR/$exam_id/exam.conf" && echo "${PREVIEW_QUESTIONS:-0}")
+
+	echo ""
+	echo -e "${CYAN}$exam_id${NC} (latency: ${LATENCY}s per call)"
+	echo ""
+	printf "%-8s %8s %10s %8s\n" "Question" "Calls" "Time (ms)" "Score"
+	printf "%-8s %8s %10s %8s\n" "--------" "-----" "---------" "-----"
+
+	# Per question: one scoring run each, calls counted from the log
+	local question label calls_before calls start elapsed record score
+	for question in $(seq 1 "$total_questions") $(seq -f "p%g" 1 "$preview_questions"); do
+		calls_before=$(count_lines "$FAKE_KUBECTL_LOG")
+		start=$(now_ms)
+		record=$(PATH="$BENCH_DIR:$PATH" "$SCORE_SCRIPT" -e "$exam_id" -q "$question" --format ndjson 2>/dev/null |
+			grep '"type":"question"' || true)
+		elapsed=$(($(now_ms) - start))
+		# cluster-info is the script's own connectivity check, not the question's
+		calls=$(tail -n +$((calls_before + 1)) "$FAKE_KUBECTL_LOG" 2>/dev/null | grep -vc '^cluster-info' || true)
+		score=$(echo "$record" | sed -n 's/.*"score":\([0-9]*\),"max_score":\([0-9]*\).*/\1\/\2/p')
+		label="Q$question"
+		[[ "$question" == p* ]] && label="P${question#p}"
+		printf "%-8s %8d %10d %8s\n" "$label" "$calls" "$elapsed" "${score:--}"
+	done
+
+	# End to end: the way a candidate runs it
+	: >"$FAKE_KUBECTL_LOG"
+	start=$(now_ms)
+	PATH="$BENCH_DIR:$PATH" "$SCORE_SCRIPT" -e "$exam_id" --format ndjson "${SCORE_ARGS[@]}" >/dev/null 2>&1 || true
+	elapsed=$(($(now_ms) - start))
+	calls=$(count_lines "$FAKE_KUBECTL_LOG")
+
+	local misses
+	misses=$(sort -u "$FAKE_KUBECTL_MISSES" 2>/dev/null | wc -l | tr -d ' ')
+
+	echo ""
+	echo -e "End to end: ${BOLD}${elapsed} ms${NC}, ${BOLD}${calls}${NC} kubectl calls" \
+		"(${misses} distinct calls not answerable from fixtures)"
+
+	rm -rf "$work_dir"
+
+	if [ -n "$MAX_CALLS" ] && [ "$calls" -gt "$MAX_CALLS" ]; then
+		print_fail "$exam_id needs $calls kubectl calls (limit: $MAX_CALLS)"
+		return 1
+	fi
+}
+
+# Parse arguments
+EXAMS=()
+FIXTURES_DIR=""
+LATENCY=0
+MAX_CALLS=""
+SCORE_ARGS=()
+
+while [[ $# -gt 0 ]]; do
+	case $1 in
+	-h | --help)
+		show_help
+		exit 0
+		;;
+	-e | --exam)
+		EXAMS+=("$2")
+		shift 2
+		;;
+	-f | --fixtures)
+		FIXTURES_DIR="$(cd "$2" && pwd)"
+		shift 2
+		;;
+	-l | --latency)
+		LATENCY="$2"
+		shift 2
+		;;
+	--max-calls)
+		MAX_CALLS="$2"
+		shift 2
+		;;
+	--record)
+		record_fixtures "$2"
+		exit 0
+		;;
+	--)
+		shift
+		SCORE_ARGS=("$@")
+		break
+		;;
+	*)
+		print_error "Unknown option: $1"
+		show_help
+		exit 1
+		;;
+	esac
+done
+
+if [ ${#EXAMS[@]} -eq 0 ]; then
+	for exam_dir in "$EXAMS_DIR"/*/; do
+		[ -f "$exam_dir/exam.conf" ] && EXAMS+=("$(basename "$exam_dir")")
+	done
+fi
+
+print_header "CKAD Exam Simulator - Scoring Benchmark"
+
+failed=0
+for exam_id in "${EXAMS[@]}"; do
+	if ! exam_exists "$exam_id"; then
+		print_error "Exam not found: $exam_id"
+		exit 1
+	fi
+	bench_exam "$exam_id" || failed=1
+done
+echo ""
+
+exit $failed
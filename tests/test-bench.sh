@@ -0,0 +1,103 @@
+#!/bin/bash
+# test-bench.sh - Unit tests for the scoring benchmark's fake kubectl
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+FAKE_KUBECTL="$TESTS_DIR/bench/kubectl"
+
+# Fake cluster with one namespace and one pod
+BENCH_TMP=$(mktemp -d)
+trap 'rm -rf "$BENCH_TMP"' EXIT
+
+cat >"$BENCH_TMP/cluster.json" <<'JSON'
+{"apiVersion": "v1", "kind": "List", "items": [
+  {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "neptune"}},
+  {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "web", "namespace": "neptune"},
+   "status": {"phase": "Running"}}
+]}
+JSON
+export FAKE_KUBECTL_SNAPSHOT="$BENCH_TMP/snapshot"
+export FAKE_KUBECTL_LOG="$BENCH_TMP/calls.log"
+export FAKE_KUBECTL_MISSES="$BENCH_TMP/misses.log"
+mkdir -p "$FAKE_KUBECTL_SNAPSHOT"
+python3 "$PROJECT_DIR/scripts/lib/snapshot.py" build "$FAKE_KUBECTL_SNAPSHOT" "$BENCH_TMP/cluster.json" >/dev/null
+
+# ============================================================================
+# TEST SUITE: bench
+# ============================================================================
+
+test_suite "bench - Scoring Benchmark"
+
+# ----------------------------------------------------------------------------
+# Test: Harness files
+# ----------------------------------------------------------------------------
+test_case "Benchmark harness is present"
+
+assert_file_exists "$FAKE_KUBECTL" "Fake kubectl should exist"
+assert_true "[ -x '$FAKE_KUBECTL' ]" "Fake kubectl should be executable"
+assert_contains "$("$TESTS_DIR/bench/bench-scoring.sh" --help)" "--latency" "Help should document --latency"
+assert_contains "$("$TESTS_DIR/bench/bench-cli.sh" --help)" "--max-ms" "CLI benchmark help should document --max-ms"
+
+# ----------------------------------------------------------------------------
+# Test: Fake kubectl answers from fixtures
+# ----------------------------------------------------------------------------
+test_case "Fake kubectl serves recorded objects"
+
+assert_success "'$FAKE_KUBECTL' cluster-info" "cluster-info should succeed"
+assert_equals "Running" "$("$FAKE_KUBECTL" get pod web -n neptune -o jsonpath='{.status.phase}')" "Pod phase from fixture"
+assert_fails "'$FAKE_KUBECTL' get pod missing -n neptune 2>/dev/null" "Missing pod should fail"
+assert_contains "$("$FAKE_KUBECTL" get pods,services -n neptune -o json)" '"name": "web"' "Bulk multi-kind read should list the pod"
+
+# ----------------------------------------------------------------------------
+# Test: Call accounting
+# ----------------------------------------------------------------------------
+test_case "Fake kubectl logs every call and unanswerable ones"
+
+: >"$FAKE_KUBECTL_LOG"
+: >"$FAKE_KUBECTL_MISSES"
+"$FAKE_KUBECTL" get ns neptune >/dev/null
+"$FAKE_KUBECTL" exec web -n neptune -- true 2>/dev/null
+assert_equals "2" "$(wc -l <"$FAKE_KUBECTL_LOG" | tr -d ' ')" "Both calls should be logged"
+assert_equals "1" "$(wc -l <"$FAKE_KUBECTL_MISSES" | tr -d ' ')" "exec should be recorded as a miss"
+
+# ----------------------------------------------------------------------------
+# Test: Cluster checks reach the fake kubectl
+# ----------------------------------------------------------------------------
+test_case "CKAD_KUBE_CLIENT=kubectl routes cluster checks through kubectl"
+
+# A kubeconfig whose API server does not answer: only kubectl can succeed
+cat >"$BENCH_TMP/kubeconfig" <<'EOF'
+apiVersion: v1
+clusters:
+- cluster:
+    server: http://127.0.0.1:1
+  name: down
+contexts:
+- context:
+    cluster: down
+    user: down
+  name: down
+current-context: down
+users:
+- name: down
+  user:
+    token: unused
+EOF
+
+: >"$FAKE_KUBECTL_LOG"
+assert_success "(source '$PROJECT_DIR/scripts/lib/common.sh' && PATH='$TESTS_DIR/bench:$PATH' \
+	KUBECONFIG='$BENCH_TMP/kubeconfig' CKAD_KUBE_CLIENT=kubectl cluster_reachable)" \
+	"cluster_reachable should ask the fake kubectl"
+assert_equals "cluster-info" "$(cat "$FAKE_KUBECTL_LOG")" "The check should be one cluster-info call"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
@@ -0,0 +1,65 @@
+#!/bin/bash
+# test-cli.sh - Tests for the ckad-dojo CLI startup and completion
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+CLI_TMP=$(mktemp -d)
+trap 'rm -rf "$CLI_TMP"' EXIT
+
+# ============================================================================
+# TEST SUITE: ckad_dojo.py
+# ============================================================================
+
+test_suite "ckad_dojo.py - CLI"
+
+# ----------------------------------------------------------------------------
+# Test: CLI startup
+# ----------------------------------------------------------------------------
+test_case "CLI completes exam IDs on the fast path"
+
+# The fast path answers without argcomplete (and without the parser)
+COMP_LINE="ckad-dojo setup -e ckad-simulation" COMP_POINT=35 _ARGCOMPLETE=1 \
+	_ARGCOMPLETE_IFS=" " _ARGCOMPLETE_STDOUT_FILENAME="$CLI_TMP/completions" \
+	PYTHONPATH="" python3 -S "$PROJECT_DIR/ckad_dojo.py"
+assert_contains "$(cat "$CLI_TMP/completions")" "ckad-simulation2 ckad-simulation3" \
+	"Exam IDs should be completed from the cache"
+assert_equals "" "$(cd "$PROJECT_DIR" && python3 -c 'import sys, ckad_dojo; print(" ".join(m for m in ("argparse", "subprocess", "pathlib") if m in sys.modules))')" \
+	"Importing the CLI should not load argparse, subprocess or pathlib"
+
+# ----------------------------------------------------------------------------
+# Test: Completion output
+# ----------------------------------------------------------------------------
+test_case "Fast-path completions match argcomplete"
+
+if python3 -c 'import argcomplete' 2>/dev/null; then
+	for comp_line in "ckad-dojo setup -e ckad-sim" "ckad-dojo score --exam ckad-simulation4" "ckad-dojo setup -e none"; do
+		export COMP_LINE="$comp_line" COMP_POINT=${#comp_line} _ARGCOMPLETE=1 \
+			_ARGCOMPLETE_SHELL=bash _ARGCOMPLETE_SUPPRESS_SPACE=1
+		_ARGCOMPLETE_STDOUT_FILENAME="$CLI_TMP/fast" python3 "$PROJECT_DIR/ckad_dojo.py"
+		(cd "$PROJECT_DIR" && _ARGCOMPLETE_STDOUT_FILENAME="$CLI_TMP/full" python3 -c '
+import argcomplete
+import ckad_dojo
+
+parser = ckad_dojo.create_parser()
+ckad_dojo.set_exam_completers(parser)
+argcomplete.autocomplete(parser, exit_method=lambda code: None)
+')
+		unset COMP_LINE COMP_POINT _ARGCOMPLETE _ARGCOMPLETE_SHELL _ARGCOMPLETE_SUPPRESS_SPACE
+		assert_equals "$(od -c "$CLI_TMP/full")" "$(od -c "$CLI_TMP/fast")" \
+			"Completing '$comp_line' should print what argcomplete prints"
+	done
+else
+	skip_test "argcomplete is not installed"
+fi
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
@@ -255,6 +255,54 @@ assert_not_empty "$CURRENT_SCORING_FILE" "CURRENT_SCORING_FILE should be set"
 assert_dir_exists "$CURRENT_EXAM_DIR" "CURRENT_EXAM_DIR should exist"
 assert_dir_exists "$CURRENT_MANIFESTS_DIR" "CURRENT_MANIFESTS_DIR should exist"
 
+# ----------------------------------------------------------------------------
+# Test: Installed exam detection
+# ----------------------------------------------------------------------------
+test_case "detect_installed_exams reports coverage per exam"
+
+DETECTED=$(detect_installed_exams default kube-system phoenix ember tiger)
+assert_equals "ckad-simulation2	2	10	20	phoenix,ember" "$(echo "$DETECTED" | head -1)" \
+	"Best-covered exam should come first with its coverage"
+assert_contains "$DETECTED" "ckad-simulation3	1	10	10	tiger" "Every installed exam should be reported"
+assert_fails "detect_installed_exams default kube-system" "No exam namespaces should mean nothing installed"
+
+# ----------------------------------------------------------------------------
+# Test: Compiled exam index
+# ----------------------------------------------------------------------------
+test_case "exam_index_rows compiles exams and rebuilds on change"
+
+INDEX_TMP=$(mktemp -d)
+mkdir -p "$INDEX_TMP/exams/ckad-simulation2"
+cp "$PROJECT_DIR/exams/ckad-simulation2/exam.conf" "$PROJECT_DIR/exams/ckad-simulation2/questions.md" \
+	"$INDEX_TMP/exams/ckad-simulation2/"
+ROWS=$(EXAMS_DIR="$INDEX_TMP/exams" EXAM_INDEX_FILE="$INDEX_TMP/exam-index.json" exam_index_rows)
+
+assert_equals "ckad-simulation2	CKAD Simulation 2	120	21	112	66" "$ROWS" "Rows should summarize each exam"
+assert_file_exists "$INDEX_TMP/exam-index.json" "The index should be written"
+assert_equals "phoenix flare 112" "$(python3 -c 'import json, sys
+exam = json.load(open(sys.argv[1]))["exams"]["ckad-simulation2"]
+print(exam["config"]["EXAM_NAMESPACES"][0], exam["config"]["HELM_NAMESPACE"], sum(q["points"] for q in exam["questions"]))' \
+	"$INDEX_TMP/exam-index.json")" "The index should hold arrays, settings and question points"
+
+sleep 0.01
+sed -i 's/^EXAM_NAME=.*/EXAM_NAME="Renamed"/' "$INDEX_TMP/exams/ckad-simulation2/exam.conf"
+ROWS=$(EXAMS_DIR="$INDEX_TMP/exams" EXAM_INDEX_FILE="$INDEX_TMP/exam-index.json" exam_index_rows)
+assert_contains "$ROWS" "Renamed" "An edited exam.conf should rebuild the index"
+rm -rf "$INDEX_TMP"
+
+# ----------------------------------------------------------------------------
+# Test: Library file modes
+# ----------------------------------------------------------------------------
+test_case "Library helpers with a shebang are executable"
+
+NOT_EXECUTABLE=""
+for lib_file in "$PROJECT_DIR"/scripts/lib/*; do
+	if [ "$(head -c 2 "$lib_file")" = "#!" ] && [ ! -x "$lib_file" ]; then
+		NOT_EXECUTABLE+="$(basename "$lib_file") "
+	fi
+done
+assert_equals "" "$NOT_EXECUTABLE" "Helpers with a shebang but no execute bit"
+
 # ============================================================================
 # SUMMARY
 # ============================================================================
@@ -0,0 +1,129 @@
+#!/bin/bash
+# test-kube-client.sh - Tests for scripts/lib/kube_client.py against a local fake API server
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+KUBE_CLIENT="$PROJECT_DIR/scripts/lib/kube_client.py"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+KUBE_TMP=$(mktemp -d)
+trap 'kill "$FAKE_API_PID" 2>/dev/null; rm -rf "$KUBE_TMP"' EXIT
+
+# Fake API server: bearer token "secret", /version and /api/v1/namespaces,
+# one line in connections.log per TCP connection
+cat >"$KUBE_TMP/fake-api.py" <<'EOF'
+import http.server
+import json
+import sys
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with open(sys.argv[2], "a") as log:
+            log.write("connection\n")
+
+    def do_GET(self):
+        if self.headers.get("Authorization") != "Bearer secret":
+            status, body = 401, {"kind": "Status", "message": "Unauthorized"}
+        elif self.path == "/version":
+            status, body = 200, {"major": "1", "minor": "31"}
+        elif self.path == "/api/v1/namespaces":
+            names = ("default", "kube-system", "phoenix", "ember", "tiger")
+            status, body = 200, {"items": [{"metadata": {"name": n}} for n in names]}
+        else:
+            status, body = 404, {"message": "not found"}
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+with open(sys.argv[1], "w") as port_file:
+    port_file.write(str(server.server_address[1]))
+server.serve_forever()
+EOF
+
+python3 "$KUBE_TMP/fake-api.py" "$KUBE_TMP/port" "$KUBE_TMP/connections.log" &
+FAKE_API_PID=$!
+for _ in $(seq 1 50); do
+	[ -s "$KUBE_TMP/port" ] && break
+	sleep 0.1
+done
+
+# Write a kubeconfig for the fake API server with the given token
+# Usage: write_kubeconfig <file> <token>
+write_kubeconfig() {
+	cat >"$1" <<EOF
+apiVersion: v1
+clusters:
+- cluster:
+    server: http://127.0.0.1:$(cat "$KUBE_TMP/port")
+  name: fake
+contexts:
+- context:
+    cluster: fake
+    user: fake
+  name: fake
+current-context: fake
+kind: Config
+preferences: {}
+users:
+- name: fake
+  user:
+    token: $2
+EOF
+}
+
+write_kubeconfig "$KUBE_TMP/kubeconfig" secret
+write_kubeconfig "$KUBE_TMP/kubeconfig-bad-token" wrong
+
+# ============================================================================
+# TEST SUITE: kube_client.py
+# ============================================================================
+
+test_suite "kube_client.py - Cluster API Client"
+
+# ----------------------------------------------------------------------------
+# Test: Requests through the kubeconfig
+# ----------------------------------------------------------------------------
+test_case "Client reads the kubeconfig and talks to the API server"
+
+assert_success "KUBECONFIG='$KUBE_TMP/kubeconfig' python3 '$KUBE_CLIENT' check" "check should succeed"
+assert_contains "$(KUBECONFIG="$KUBE_TMP/kubeconfig" python3 "$KUBE_CLIENT" namespaces)" "phoenix" \
+	"namespaces should list the cluster's namespaces"
+assert_fails "KUBECONFIG='$KUBE_TMP/kubeconfig-bad-token' python3 '$KUBE_CLIENT' namespaces 2>/dev/null" \
+	"A rejected token should fail"
+assert_equals "2" "$(KUBECONFIG="$KUBE_TMP/none" python3 "$KUBE_CLIENT" check 2>/dev/null || echo $?)" \
+	"A missing kubeconfig should ask for kubectl"
+
+# ----------------------------------------------------------------------------
+# Test: One session for status checks
+# ----------------------------------------------------------------------------
+test_case "CLI connectivity check and exam detection share one connection"
+
+: >"$KUBE_TMP/connections.log"
+DETECTED=$(cd "$PROJECT_DIR" && KUBECONFIG="$KUBE_TMP/kubeconfig" python3 -c '
+import ckad_dojo
+print(ckad_dojo.check_cluster_connectivity(), ckad_dojo.detect_installed_exams()["ckad-simulation2"])')
+
+assert_equals "True (2, 10, 20)" "$DETECTED" "Connectivity and detection should go through the API client"
+assert_equals "1" "$(wc -l <"$KUBE_TMP/connections.log")" "Both requests should reuse one connection"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
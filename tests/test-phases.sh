@@ -0,0 +1,75 @@
+#!/bin/bash
+# test-phases.sh - Unit tests for scripts/lib/phases.sh
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+# Source the module under test
+source "$PROJECT_DIR/scripts/lib/common.sh"
+source "$PROJECT_DIR/scripts/lib/phases.sh"
+
+PHASE_LOG=$(mktemp)
+PHASE_OUTPUT_FILE=$(mktemp)
+trap 'rm -f "$PHASE_LOG" "$PHASE_OUTPUT_FILE"' EXIT
+
+phase_first() {
+	sleep 0.3
+	echo "first" >>"$PHASE_LOG"
+}
+phase_second() {
+	echo "second" >>"$PHASE_LOG"
+}
+phase_independent() {
+	sleep 0.3
+	echo "independent" >>"$PHASE_LOG"
+}
+phase_broken() {
+	echo "broken output"
+	return 1
+}
+
+# ============================================================================
+# TEST SUITE: phases.sh
+# ============================================================================
+
+test_suite "phases.sh - Phase Dependency Graph"
+
+# ----------------------------------------------------------------------------
+# Test: Dependencies and concurrency
+# ----------------------------------------------------------------------------
+test_case "Phases run after their dependencies, independent ones concurrently"
+
+phase_add second phase_second first
+phase_add first phase_first
+phase_add independent phase_independent
+phase_add broken phase_broken
+
+PHASE_FAILED=0
+phase_run_all >"$PHASE_OUTPUT_FILE" || PHASE_FAILED=$?
+PHASE_OUTPUT=$(cat "$PHASE_OUTPUT_FILE")
+
+assert_equals "first" "$(grep -m1 "first\|second" "$PHASE_LOG")" "A phase should run after its dependency"
+assert_true '[ "${PHASE_TOTAL_MS:-0}" -lt 550 ]' "Independent phases should overlap (took ${PHASE_TOTAL_MS}ms)"
+assert_equals "1" "$PHASE_FAILED" "Failed phases should be counted"
+assert_contains "$PHASE_OUTPUT" "broken output" "Phase output should be printed"
+
+# ----------------------------------------------------------------------------
+# Test: Timing report
+# ----------------------------------------------------------------------------
+test_case "Timing report lists every phase"
+
+REPORT=$(phase_report)
+assert_contains "$REPORT" "independent" "Report should list each phase"
+assert_contains "$REPORT" "(failed)" "Report should flag failed phases"
+assert_contains "$REPORT" "wall time" "Report should include the wall time"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
@@ -0,0 +1,92 @@
+#!/bin/bash
+# test-pool.sh - Tests for scripts/ckad-pool.sh (no cluster needed)
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+POOL_SCRIPT="$PROJECT_DIR/scripts/ckad-pool.sh"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+# Pool state lives in a scratch directory
+export CKAD_POOL_DIR
+CKAD_POOL_DIR=$(mktemp -d)
+trap 'rm -rf "$CKAD_POOL_DIR"' EXIT
+
+# ============================================================================
+# TEST SUITE: ckad-pool.sh
+# ============================================================================
+
+test_suite "ckad-pool.sh - Warm Pool"
+
+# ----------------------------------------------------------------------------
+# Test: Argument validation
+# ----------------------------------------------------------------------------
+test_case "Pool arguments are validated"
+
+assert_success "bash '$POOL_SCRIPT' --help" "--help should succeed"
+assert_fails "bash '$POOL_SCRIPT'" "A command should be required"
+assert_fails "bash '$POOL_SCRIPT' fill -n two" "Non-numeric size should be rejected"
+assert_fails "bash '$POOL_SCRIPT' status -e no-such-exam" "Unknown exam should be rejected"
+
+# ----------------------------------------------------------------------------
+# Test: Claiming
+# ----------------------------------------------------------------------------
+test_case "Claims only take ready environments"
+
+mkdir -p "$CKAD_POOL_DIR/ckad-simulation2"
+touch "$CKAD_POOL_DIR/ckad-simulation2/ckad-pool-simulation2-1-1.provisioning"
+
+assert_fails "bash '$POOL_SCRIPT' claim -e ckad-simulation2" "Claim should fail without a ready environment"
+assert_file_exists "$CKAD_POOL_DIR/ckad-simulation2/ckad-pool-simulation2-1-1.provisioning" \
+	"Provisioning environments should be left alone"
+assert_contains "$(bash "$POOL_SCRIPT" status -e ckad-simulation2)" "provisioning" \
+	"Status should list environments with their state"
+
+# ----------------------------------------------------------------------------
+# Test: Releasing
+# ----------------------------------------------------------------------------
+test_case "Release deletes claimed environments and restores the kubectl context"
+
+# Fake kind and kubectl: the current context lives in a file, deletions are logged
+FAKE_BIN="$CKAD_POOL_DIR/bin"
+mkdir -p "$FAKE_BIN"
+cat >"$FAKE_BIN/kubectl" <<'FAKE'
+#!/bin/bash
+case "$*" in
+"config current-context") cat "$FAKE_CONTEXT" ;;
+"config use-context "*) echo "$3" >"$FAKE_CONTEXT" ;;
+"config unset current-context") : >"$FAKE_CONTEXT" ;;
+esac
+FAKE
+cat >"$FAKE_BIN/kind" <<'FAKE'
+#!/bin/bash
+echo "kind $*" >>"$FAKE_CONTEXT.log"
+FAKE
+chmod +x "$FAKE_BIN/kubectl" "$FAKE_BIN/kind"
+export FAKE_CONTEXT="$CKAD_POOL_DIR/context"
+
+touch "$CKAD_POOL_DIR/ckad-simulation2/ckad-pool-simulation2-2-1.claimed"
+echo "my-cluster" >"$CKAD_POOL_DIR/ckad-simulation2/ckad-pool-simulation2-2-1.context"
+echo "kind-ckad-pool-simulation2-2-1" >"$FAKE_CONTEXT"
+
+RELEASE_OUTPUT=$(PATH="$FAKE_BIN:$PATH" bash "$POOL_SCRIPT" release -e ckad-simulation2 2>&1)
+assert_equals "my-cluster" "$(cat "$FAKE_CONTEXT")" "The context replaced by the claim should be restored"
+assert_contains "$RELEASE_OUTPUT" "switched back to my-cluster" "The context switch should be printed"
+assert_contains "$(cat "$FAKE_CONTEXT.log")" "kind delete cluster --name ckad-pool-simulation2-2-1" \
+	"The claimed cluster should be deleted"
+assert_fails "test -e '$CKAD_POOL_DIR/ckad-simulation2/ckad-pool-simulation2-2-1.claimed'" \
+	"The claimed environment should leave the pool"
+
+touch "$CKAD_POOL_DIR/ckad-simulation2/ckad-pool-simulation2-3-1.claimed"
+echo "other-cluster" >"$FAKE_CONTEXT"
+PATH="$FAKE_BIN:$PATH" bash "$POOL_SCRIPT" release -e ckad-simulation2 >/dev/null 2>&1
+assert_equals "other-cluster" "$(cat "$FAKE_CONTEXT")" "A context switched away from the claim should be kept"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
@@ -0,0 +1,268 @@
+#!/bin/bash
+# test-score-watch.sh - Tests for the scoring dependency map and watch mode helpers
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+LIB_DIR="$PROJECT_DIR/scripts/lib"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+WATCH_TMP=$(mktemp -d)
+trap 'kill "$SERVER_PID" 2>/dev/null; rm -rf "$WATCH_TMP"' EXIT
+
+cat >"$WATCH_TMP/scoring-functions.sh" <<'EOF'
+score_q1() {
+	local score=0
+	local total=2
+	# kubectl get secrets -n ignored
+	check_criterion "Deployment exists in phoenix" \
+		"$(kubectl get deploy web -n phoenix 2>/dev/null && echo true)" && ((score++))
+	[ -f "$EXAM_DIR/1/answer.txt" ] && ((score++))
+	echo "$score/$total"
+}
+
+score_q2() {
+	local score=0
+	local total=2
+	local pods=$(kubectl get pods -A -o name 2>/dev/null | wc -l)
+	docker image ls | grep -q app && ((score++))
+	kubectl get pv data 2>/dev/null && [ -s "./exam/course/2/pods.txt" ] && ((score++))
+	echo "$score/$total"
+}
+
+score_preview_q1() {
+	local score=0
+	helm list -n ember 2>/dev/null | grep -q web && ((score++))
+	echo "$score/1"
+}
+EOF
+
+# Print the score_deps.py map of the fixture, one line per dependency
+deps_lines() {
+	(cd "$LIB_DIR" && python3 -c '
+import sys
+import score_deps
+for question, deps in score_deps.extract(sys.argv[1]).items():
+    for dep in deps["resources"]:
+        print(question, dep["resource"], dep["namespace"], dep["name"])
+    for path in deps["files"]:
+        print(question, "file", path)
+    for source in deps["untracked"]:
+        print(question, "untracked", source)
+' "$WATCH_TMP/scoring-functions.sh")
+}
+
+# ============================================================================
+# TEST SUITE: score_deps.py / score_watch.py
+# ============================================================================
+
+test_suite "score_deps.py / score_watch.py - Score Watch Mode"
+
+# ----------------------------------------------------------------------------
+# Test: Dependencies extracted from scoring functions
+# ----------------------------------------------------------------------------
+test_case "Scoring functions are mapped to the resources and files they read"
+
+DEPS=$(deps_lines)
+assert_contains "$DEPS" "1 deployments phoenix web" "kubectl get should record kind, namespace and name"
+assert_contains "$DEPS" "1 file 1/answer.txt" "\$EXAM_DIR paths should be recorded"
+assert_contains "$DEPS" "2 file 2/pods.txt" "./exam/course paths should be recorded"
+assert_contains "$DEPS" "2 pods None None" "-A should match any namespace"
+assert_contains "$DEPS" "2 persistentvolumes  data" "Cluster-scoped resources should have no namespace"
+assert_contains "$DEPS" "2 untracked docker" "docker should be reported as untracked"
+assert_contains "$DEPS" "P1 secrets ember None" "helm should read release secrets"
+assert_equals "0" "$(echo "$DEPS" | grep -c '^1 secrets')" "Comments should be ignored"
+
+assert_contains "$(cd "$LIB_DIR" && python3 -c '
+import score_deps
+print(score_deps.extract("/dev/null") or "empty")')" "empty" "A file without scoring functions should map nothing"
+
+# ----------------------------------------------------------------------------
+# Test: Declared dependencies
+# ----------------------------------------------------------------------------
+test_case "SCORE_DEPENDS entries declare a question's inputs"
+
+DECLARED=$(cd "$LIB_DIR" && python3 -c '
+import score_deps
+deps = score_deps.declared(["13 deploy/flare/* secrets/flare file:13/values.yaml", "p1 pv/data untracked:docker"])
+for question, entry in sorted(deps.items()):
+    print(question, entry)
+for entry in ("x deploy/flare", "2 deploy", "3"):
+    try:
+        score_deps.declared([entry])
+    except ValueError:
+        print("rejected", entry)
+')
+assert_contains "$DECLARED" "'resource': 'deployments', 'namespace': 'flare', 'name': None" \
+	"Aliases and * should be resolved"
+assert_contains "$DECLARED" "'files': ['13/values.yaml']" "file: inputs should be recorded"
+assert_contains "$DECLARED" "P1 {'resources': [{'resource': 'persistentvolumes', 'namespace': '', 'name': 'data'}]" \
+	"Cluster-scoped inputs should take a name without namespace"
+assert_contains "$DECLARED" "'untracked': ['docker']" "untracked: inputs should be recorded"
+assert_equals "3" "$(echo "$DECLARED" | grep -c '^rejected')" "Malformed entries should be rejected"
+
+# ----------------------------------------------------------------------------
+# Test: Every exam question has an entry in the index
+# ----------------------------------------------------------------------------
+test_case "The exam index carries a dependency entry per question"
+
+MISSING=$(cd "$LIB_DIR" && CKAD_EXAM_INDEX="$WATCH_TMP/index.json" python3 -c '
+import sys
+import exam_index
+for exam_id, exam in exam_index.load(sys.argv[1])["exams"].items():
+    for question in exam["questions"]:
+        if question["id"] not in exam["dependencies"]:
+            print(exam_id, question["id"])
+' "$PROJECT_DIR/exams")
+assert_equals "" "$MISSING" "Questions without a dependency entry"
+
+# ----------------------------------------------------------------------------
+# Test: Changes map to the questions that read them
+# ----------------------------------------------------------------------------
+test_case "Changes re-score only the affected questions"
+
+# Print the sorted questions affected by the given change tuples (Python literals)
+affected() {
+	(cd "$LIB_DIR" && python3 -c '
+import sys
+import score_deps
+import score_watch
+deps = score_deps.extract(sys.argv[1])
+changes = [eval(change) for change in sys.argv[2:]]
+print(" ".join(sorted(score_watch.affected_questions(deps, changes))))
+' "$WATCH_TMP/scoring-functions.sh" "$@")
+}
+
+assert_equals "1" "$(affected '("resource", "deployments", "phoenix", "web")')" "A read object should match"
+assert_equals "" "$(affected '("resource", "deployments", "phoenix", "api")')" "Other objects should not match"
+assert_equals "2" "$(affected '("resource", "pods", "tiger", "x")')" "Any-namespace reads should match every namespace"
+assert_equals "1 2" "$(affected '("resource", "deployments", None, None)' '("resource", "pods", "", "y")')" \
+	"A wildcard change should match every read of the resource"
+assert_equals "1" "$(affected '("file", "1")')" "A changed directory should match files inside it"
+assert_equals "P1" "$(affected '("resource", "secrets", "ember", "sh.helm.release.v1.web.v1")')" \
+	"Helm releases should match through their secrets"
+
+# ----------------------------------------------------------------------------
+# Test: File watcher
+# ----------------------------------------------------------------------------
+test_case "File watcher reports files written under exam/course"
+
+mkdir -p "$WATCH_TMP/course/3"
+FILE_EVENTS=$(cd "$LIB_DIR" && python3 -c '
+import queue
+import sys
+import time
+import score_watch
+changes = queue.Queue()
+watcher = score_watch.FileWatcher(sys.argv[1], changes)
+watcher.start()
+time.sleep(0.2)
+with open(sys.argv[1] + "/3/answer.yaml", "w") as f:
+    f.write("kind: Pod\n")
+print(watcher.mode, changes.get(timeout=5))
+' "$WATCH_TMP/course")
+assert_contains "$FILE_EVENTS" "('file', '3/answer.yaml')" "Writing a file should report its relative path"
+
+# ----------------------------------------------------------------------------
+# Test: Change tracker
+# ----------------------------------------------------------------------------
+test_case "Change tracker keeps the questions changed since last scored"
+
+mkdir -p "$WATCH_TMP/tracked/1"
+TRACKED=$(cd "$LIB_DIR" && python3 -c '
+import sys
+import time
+import score_deps
+import score_watch
+deps = score_deps.declared(["1 file:1/answer.txt", "2 untracked:docker", "3 deploy/phoenix/web"])
+tracker = score_watch.ChangeTracker(deps, sys.argv[1])
+tracker.start()
+print("start", sorted(tracker.changed()))
+time.sleep(0.2)
+with open(sys.argv[1] + "/1/answer.txt", "w") as f:
+    f.write("done\n")
+print("woke", tracker.wait(5))
+print("written", sorted(tracker.take()))
+print("taken", sorted(tracker.changed()))
+' "$WATCH_TMP/tracked")
+assert_contains "$TRACKED" "start ['2', '3']" \
+	"Untracked inputs, and cluster inputs without an API client, should always count as changed"
+assert_contains "$TRACKED" "woke True" "A change should wake up waiters"
+assert_contains "$TRACKED" "written ['1', '2', '3']" "A written answer file should mark its question"
+assert_contains "$TRACKED" "taken ['2', '3']" "Taken changes should be forgotten"
+
+test_case "A failing watch makes its questions blind until it recovers"
+
+# Fake API client: deployments watch fine, secrets are forbidden until allowed
+BROKEN=$(cd "$LIB_DIR" && python3 -c '
+import sys
+import threading
+import time
+import kube_client
+import score_deps
+import score_watch
+
+allowed = threading.Event()
+
+
+class FakeClient:
+    def resource_version(self, resource):
+        if resource == "secrets" and not allowed.is_set():
+            raise kube_client.ClusterError("HTTP 403: forbidden", 403)
+        return "1"
+
+    def watch(self, resource, resource_version):
+        time.sleep(60)
+        return iter(())
+
+
+deps = score_deps.declared(["1 deploy/phoenix/web", "2 secrets/phoenix/db", "3 file:3/a.txt"])
+tracker = score_watch.ChangeTracker(deps, sys.argv[1], FakeClient())
+tracker.start()
+time.sleep(0.5)
+status = tracker.status()
+print("broken", sorted(status["broken"]), "blind", status["blind"], "changed", sorted(tracker.take()))
+allowed.set()
+print("recovered", tracker.wait(5), sorted(tracker.take()), tracker.status()["broken"])
+' "$WATCH_TMP/tracked")
+assert_contains "$BROKEN" "broken ['secrets'] blind ['2'] changed ['2']" \
+	"Questions on a failing watch should count as changed"
+assert_contains "$BROKEN" "recovered True ['2'] {}" \
+	"A recovered watch should mark its questions once and stop being blind"
+
+# ----------------------------------------------------------------------------
+# Test: Web server score endpoints
+# ----------------------------------------------------------------------------
+test_case "Web server lists changed questions and validates question IDs"
+
+SERVER_PORT=$(python3 -c 'import socket; s = socket.socket(); s.bind(("127.0.0.1", 0)); print(s.getsockname()[1])')
+(cd "$PROJECT_DIR" && KUBECONFIG="$WATCH_TMP/none" CKAD_EXAM_INDEX="$WATCH_TMP/index.json" \
+	exec python3 web/server.py "$SERVER_PORT" ckad-simulation2 >/dev/null 2>&1) &
+SERVER_PID=$!
+for _ in $(seq 1 50); do
+	curl -s "http://localhost:$SERVER_PORT/api/timer" >/dev/null 2>&1 && break
+	sleep 0.1
+done
+
+CHANGED=$(curl -s "http://localhost:$SERVER_PORT/api/score/changed")
+assert_contains "$CHANGED" '"scored": false' "Nothing should be scored yet"
+assert_contains "$CHANGED" '"questions": ["1", "2", "3"' "Every question should count as changed before the first score"
+assert_equals "404" "$(curl -s -o /dev/null -w '%{http_code}' -X POST "http://localhost:$SERVER_PORT/api/score/99")" \
+	"Unknown questions should be rejected"
+
+# ----------------------------------------------------------------------------
+# Test: CLI
+# ----------------------------------------------------------------------------
+test_case "CLI and ckad-score.sh document watch mode and question lists"
+
+assert_contains "$(python3 "$PROJECT_DIR/ckad_dojo.py" score --help)" "--watch" "score should offer --watch"
+assert_contains "$("$PROJECT_DIR/scripts/ckad-score.sh" --help)" "2,7,p1" "ckad-score.sh should take a question list"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
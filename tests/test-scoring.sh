@@ -226,6 +226,35 @@ for _exam in $_exams; do
 	assert_true "[ $_score_init_count -ge $_expected ]" "$_exam should have at least $_expected score=0 initializations (found $_score_init_count)"
 done
 
+# ----------------------------------------------------------------------------
+# Test: ckad-score.sh parallel job count
+# ----------------------------------------------------------------------------
+test_case "ckad-score.sh validates the parallel job count"
+
+assert_contains "$("$PROJECT_DIR/scripts/ckad-score.sh" --help)" "--jobs" "Help should document --jobs"
+assert_fails "'$PROJECT_DIR/scripts/ckad-score.sh' -j 0 >/dev/null 2>&1" "Job count 0 should be rejected"
+assert_fails "'$PROJECT_DIR/scripts/ckad-score.sh' --jobs many >/dev/null 2>&1" "Non-numeric job count should be rejected"
+
+# ----------------------------------------------------------------------------
+# Test: ckad-score.sh option values
+# ----------------------------------------------------------------------------
+test_case "ckad-score.sh rejects options without a value"
+
+for option in -j --format -q -e; do
+	assert_fails "'$PROJECT_DIR/scripts/ckad-score.sh' $option >/dev/null 2>&1" "$option without a value should be rejected"
+done
+assert_contains "$("$PROJECT_DIR/scripts/ckad-score.sh" -j 2>&1)" "Usage:" "A missing value should print usage"
+assert_contains "$("$PROJECT_DIR/scripts/ckad-score.sh" -q -s 2>&1)" "-q requires a value" \
+	"An option should not take the next option as its value"
+
+# ----------------------------------------------------------------------------
+# Test: ckad-score.sh output format
+# ----------------------------------------------------------------------------
+test_case "ckad-score.sh validates the output format"
+
+assert_contains "$("$PROJECT_DIR/scripts/ckad-score.sh" --help)" "ndjson" "Help should document the ndjson format"
+assert_fails "'$PROJECT_DIR/scripts/ckad-score.sh' --format xml >/dev/null 2>&1" "Unknown format should be rejected"
+
 # ============================================================================
 # SUMMARY
 # ============================================================================
@@ -0,0 +1,375 @@
+#!/bin/bash
+# test-server.sh - Tests for the web server (web/server.py), no cluster needed
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+# Scoring runs against the benchmark's fake kubectl with an empty cluster
+SERVER_TMP=$(mktemp -d)
+trap 'rm -rf "$SERVER_TMP"' EXIT
+export FAKE_KUBECTL_SNAPSHOT="$SERVER_TMP/snapshot"
+mkdir -p "$FAKE_KUBECTL_SNAPSHOT"
+
+# ============================================================================
+# TEST SUITE: web/server.py
+# ============================================================================
+
+test_suite "web/server.py - Web Server"
+
+# ----------------------------------------------------------------------------
+# Test: Streamed scoring stops with its client
+# ----------------------------------------------------------------------------
+test_case "Web server stops scoring and all its subprocesses on disconnect or timeout"
+
+# Slow kubectl calls keep the parallel question subshells busy when scoring is
+# killed; every process of the run inherits SCORE_TEST_RUN, so survivors can be found
+mkdir -p "$SERVER_TMP/tmp"
+DISCONNECT=$(cd "$PROJECT_DIR/web" && PATH="$TESTS_DIR/bench:$PATH" CKAD_KUBE_CLIENT=kubectl \
+	FAKE_KUBECTL_LATENCY=0.5 TMPDIR="$SERVER_TMP/tmp" SCORE_TEST_RUN="disconnect-$$" \
+	CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import glob
+import os
+import subprocess
+import time
+import server
+
+
+def disconnect(question):
+    raise BrokenPipeError
+
+
+def survivors():
+    marker = ("SCORE_TEST_RUN=" + os.environ["SCORE_TEST_RUN"]).encode()
+    found = 0
+    for environ in glob.glob("/proc/[0-9]*/environ"):
+        if environ == "/proc/%d/environ" % os.getpid():
+            continue
+        try:
+            with open(environ, "rb") as f:
+                found += marker in f.read().split(b"\0")
+        except OSError:
+            pass
+    return found
+
+
+def leftovers():
+    return len(os.listdir(os.environ["TMPDIR"]))
+
+
+try:
+    print(server.run_scoring_script("ckad-simulation2", on_question=disconnect, questions_only=["1"]))
+except BrokenPipeError:
+    time.sleep(0.2)
+    print("disconnected survivors", survivors(), "leftovers", leftovers())
+
+try:
+    list(server.iter_score_records("ckad-simulation2", timeout=2, questions=["1", "2", "3", "4"]))
+except subprocess.TimeoutExpired:
+    time.sleep(0.2)
+    print("timed out survivors", survivors(), "leftovers", leftovers())
+' 2>&1)
+assert_contains "$DISCONNECT" "disconnected survivors 0 leftovers 0" \
+	"A disconnect should stop the scoring script and remove its temporary files"
+assert_contains "$DISCONNECT" "timed out survivors 0 leftovers 0" \
+	"A timeout should also stop the parallel question subshells and their kubectl calls"
+
+# ----------------------------------------------------------------------------
+# Test: Timer expiry
+# ----------------------------------------------------------------------------
+test_case "Web server pushes timer expiry to event streams"
+
+EXPIRY=$(cd "$PROJECT_DIR/web" && CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import io
+import json
+import time
+import server
+
+
+class EventLog(io.BytesIO):
+    """Stream sink that hangs up after the second timer event"""
+
+    def flush(self):
+        if self.getvalue().count(b"event: timer") >= 2:
+            raise BrokenPipeError
+
+
+handler = server.ExamHandler.__new__(server.ExamHandler)
+handler.wfile = EventLog()
+handler.request_version = "HTTP/1.1"
+handler.requestline = "GET /api/timer/events HTTP/1.1"
+handler.command = "GET"
+handler.path = "/api/timer/events"
+handler.client_address = ("127.0.0.1", 0)
+
+# One second left of a one-minute exam
+server.timer_state.update(running=True, start_time=time.time() - 59, duration_minutes=1)
+start = time.time()
+handler.stream_timer()
+events = [json.loads(line[6:]) for line in handler.wfile.getvalue().decode().splitlines()
+          if line.startswith("data: ")]
+print("expired", events[-1]["running"], "after", round(time.time() - start))
+' 2>&1)
+assert_equals "expired False after 1" "$EXPIRY" \
+	"Expiry should be pushed when the timer runs out, not at the next keep-alive"
+
+# ----------------------------------------------------------------------------
+# Test: Response compression
+# ----------------------------------------------------------------------------
+test_case "Web server compresses only 200 responses to clients accepting gzip"
+
+ENCODING=$(cd "$PROJECT_DIR/web" && CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import email.message
+import io
+import json
+import server
+
+for header in ("gzip", "gzip;q=0", "br, gzip;q=0.5", "identity", "*", "*, gzip;q=0", "gzip;q=bad"):
+    print(repr(header), server.accepts_gzip(header))
+
+compressions = []
+gzip_json = server.gzip_json
+
+
+def count_gzip(body, etag):
+    compressions.append(etag)
+    return gzip_json(body, etag)
+
+
+server.gzip_json = count_gzip
+
+
+def get(accept_encoding, if_none_match=None):
+    handler = server.ExamHandler.__new__(server.ExamHandler)
+    handler.headers = email.message.Message()
+    handler.headers["Accept-Encoding"] = accept_encoding
+    if if_none_match:
+        handler.headers["If-None-Match"] = if_none_match
+    handler.wfile = io.BytesIO()
+    handler.request_version = "HTTP/1.1"
+    handler.requestline = "GET /api/test HTTP/1.1"
+    handler.command = "GET"
+    handler.path = "/api/test"
+    handler.client_address = ("127.0.0.1", 0)
+    handler.send_json({"padding": "x" * 4096})
+    head = handler.wfile.getvalue().split(b"\r\n\r\n")[0].decode()
+    return head.split(" ")[1], "Content-Encoding: gzip" in head, "Vary: Accept-Encoding" in head
+
+
+etag = server.make_etag(json.dumps({"padding": "x" * 4096}).encode())
+print("revalidated", get("gzip", etag), len(compressions))
+print("refused", get("gzip;q=0"), len(compressions))
+print("accepted", get("deflate, gzip"), len(compressions))
+' 2>&1)
+assert_contains "$ENCODING" "'gzip' True" "A plain gzip coding should be accepted"
+assert_contains "$ENCODING" "'gzip;q=0' False" "gzip;q=0 should refuse gzip"
+assert_contains "$ENCODING" "'br, gzip;q=0.5' True" "A non-zero q-value should accept gzip"
+assert_contains "$ENCODING" "'identity' False" "Other codings should not accept gzip"
+assert_contains "$ENCODING" "'*' True" "A wildcard should accept gzip"
+assert_contains "$ENCODING" "'*, gzip;q=0' False" "An explicit gzip;q=0 should override the wildcard"
+assert_contains "$ENCODING" "'gzip;q=bad' False" "A malformed q-value should refuse gzip"
+assert_contains "$ENCODING" "revalidated ('304', False, True) 0" \
+	"A matching ETag should answer 304 without compressing, varying on Accept-Encoding"
+assert_contains "$ENCODING" "refused ('200', False, True) 0" "A refused gzip should not be compressed"
+assert_contains "$ENCODING" "accepted ('200', True, True) 1" "An accepted gzip should compress the body"
+
+# ----------------------------------------------------------------------------
+# Test: Exam catalog cache
+# ----------------------------------------------------------------------------
+test_case "Exam catalog re-reads a file only when its mtime or size changes"
+
+mkdir -p "$SERVER_TMP/exams/ckad-simulation2"
+cp "$PROJECT_DIR/exams/ckad-simulation2/questions.md" "$SERVER_TMP/exams/ckad-simulation2/"
+CATALOG=$(cd "$PROJECT_DIR/web" && CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import json
+import os
+import sys
+import threading
+import urllib.request
+from pathlib import Path
+import server
+
+server.EXAMS_DIR = Path(sys.argv[1])
+questions = server.EXAMS_DIR / "ckad-simulation2" / "questions.md"
+catalog = server.exam_catalog
+
+print("first", catalog.question("ckad-simulation2", "1")["topic"])
+catalog.questions("ckad-simulation2")
+print("cached", catalog.stats()["hits"], catalog.stats()["misses"])
+
+# Same size, new mtime: still re-read
+text = questions.read_text()
+questions.write_text(text.replace("API Resources", "API Resourcez", 1))
+stat = questions.stat()
+os.utime(questions, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+print("edited", catalog.question("ckad-simulation2", "1")["topic"], catalog.stats()["misses"])
+
+# Longer file: re-read
+questions.write_text(text.replace("API Resources", "API Resources Renamed", 1))
+print("grown", catalog.question("ckad-simulation2", "1")["topic"], catalog.stats()["misses"])
+
+httpd = server.ExamServer(("127.0.0.1", 0), server.ExamHandler)
+threading.Thread(target=httpd.serve_forever, daemon=True).start()
+with urllib.request.urlopen("http://127.0.0.1:%d/api/catalog/stats" % httpd.server_address[1]) as response:
+    print("stats", json.dumps(json.load(response), sort_keys=True))
+httpd.shutdown()
+' "$SERVER_TMP/exams" 2>&1)
+assert_contains "$CATALOG" "first API Resources" "Questions should be parsed on first use"
+assert_contains "$CATALOG" "cached 1 1" "An unchanged file should be served from the cache"
+assert_contains "$CATALOG" "edited API Resourcez 2" "A same-size edit with a new mtime should be re-read"
+assert_contains "$CATALOG" "grown API Resources Renamed 3" "A size change should be re-read"
+assert_contains "$CATALOG" 'stats {"entries": 1, "hit_rate": 0.25, "hits": 1, "misses": 3}' \
+	"/api/catalog/stats should report the cache counters"
+
+# ----------------------------------------------------------------------------
+# Test: Change tracking lifecycle
+# ----------------------------------------------------------------------------
+test_case "Changes are tracked for one exam, from the first targeted re-score"
+
+TRACKING=$(cd "$PROJECT_DIR/web" && KUBECONFIG="$SERVER_TMP/none" CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import threading
+import time
+import server
+
+board = server.score_board
+
+
+def watch_threads():
+    time.sleep(1.5)
+    return sum(thread.name.startswith("watch-") for thread in threading.enumerate())
+
+
+board.changed("ckad-simulation2")
+board.begin_full("ckad-simulation2")
+print("untracked", board.tracked_exam, board.watch_status("ckad-simulation2"), watch_threads())
+
+board.results["ckad-simulation2"] = {}
+board.begin("ckad-simulation2", ["1"])
+print("tracked", board.tracked_exam, watch_threads(),
+      "pending", board.changed("ckad-simulation2") == board.question_ids("ckad-simulation2")[1:])
+
+first = board.tracking
+board.begin("ckad-simulation3", ["1"])
+print("replaced", board.tracked_exam, first is not board.tracking, watch_threads())
+
+board.switch_exam("ckad-simulation2")
+print("switched", board.tracked_exam, watch_threads())
+' 2>&1)
+assert_contains "$TRACKING" "untracked None None 0" "Listing changes and full scores should not start watching"
+assert_contains "$TRACKING" "tracked ckad-simulation2 2 pending True" \
+	"A targeted re-score should start watching, with every other question changed since the last score"
+assert_contains "$TRACKING" "replaced ckad-simulation3 True 2" "Tracking another exam should stop the previous watches"
+assert_contains "$TRACKING" "switched None 0" "Switching the active exam should stop watching"
+
+# A stream that loses its client must not lose the changes it took
+LOST=$(cd "$PROJECT_DIR/web" && KUBECONFIG="$SERVER_TMP/none" CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import io
+import server
+
+board = server.score_board
+board.results["ckad-simulation2"] = {}
+board.begin("ckad-simulation2", board.question_ids("ckad-simulation2"))
+board.tracking.mark_changed(["4", "7"])
+
+
+def scoring(exam_id, on_question=None):
+    on_question({"id": "1"})
+
+
+class Gone(io.BytesIO):
+    def write(self, data):
+        if b"event: question" in data:
+            raise BrokenPipeError
+        return super().write(data)
+
+
+server.run_scoring_script = scoring
+handler = server.ExamHandler.__new__(server.ExamHandler)
+handler.wfile = Gone()
+handler.request_version = "HTTP/1.1"
+handler.requestline = "GET /api/score/stream HTTP/1.1"
+handler.command = "GET"
+handler.path = "/api/score/stream"
+handler.client_address = ("127.0.0.1", 0)
+handler.stream_score("ckad-simulation2")
+print("pending", sorted(set(board.changed("ckad-simulation2")) & {"4", "7"}))
+' 2>/dev/null | tail -n 1)
+assert_equals "pending ['4', '7']" "$LOST" "Changes taken by a disconnected score stream should stay pending"
+
+# ----------------------------------------------------------------------------
+# Test: Concurrent requests
+# ----------------------------------------------------------------------------
+test_case "Timer answers while scoring runs and score requests and streams share one job"
+
+CONCURRENT=$(cd "$PROJECT_DIR/web" && PATH="$TESTS_DIR/bench:$PATH" CKAD_KUBE_CLIENT=kubectl \
+	FAKE_KUBECTL_LATENCY=0.02 KUBECONFIG="$SERVER_TMP/none" CKAD_EXAM_INDEX="$SERVER_TMP/index.json" python3 -c '
+import json
+import subprocess
+import threading
+import time
+import urllib.request
+import server
+
+spawned = []
+popen = subprocess.Popen
+
+
+def record_spawn(cmd, *args, **kwargs):
+    spawned.append(cmd[0])
+    return popen(cmd, *args, **kwargs)
+
+
+subprocess.Popen = record_spawn
+httpd = server.ExamServer(("127.0.0.1", 0), server.ExamHandler)
+threading.Thread(target=httpd.serve_forever, daemon=True).start()
+url = "http://127.0.0.1:%d" % httpd.server_address[1]
+
+results = []
+
+
+def score():
+    request = urllib.request.Request(url + "/api/score", method="POST",
+                                     data=json.dumps({"exam_id": "ckad-simulation2"}).encode())
+    with urllib.request.urlopen(request, timeout=120) as response:
+        results.append(json.load(response)["success"])
+
+
+def stream():
+    with urllib.request.urlopen(url + "/api/score/stream?exam_id=ckad-simulation2", timeout=120) as response:
+        events = [line.split(": ", 1)[1] for line in response.read().decode().splitlines()
+                  if line.startswith("event: ")]
+    streamed.extend(events)
+
+
+streamed = []
+scorers = [threading.Thread(target=score) for _ in range(2)] + [threading.Thread(target=stream)]
+for scorer in scorers:
+    scorer.start()
+    time.sleep(0.2)
+start = time.time()
+with urllib.request.urlopen(url + "/api/timer", timeout=5) as response:
+    response.read()
+print("timer", "fast" if time.time() - start < 0.5 else "blocked",
+      "while", "scoring" if scorers[0].is_alive() else "idle")
+for scorer in scorers:
+    scorer.join()
+print("results", results, "spawned", sum(cmd.endswith("ckad-score.sh") for cmd in spawned))
+scored = len(server.score_board.question_ids("ckad-simulation2"))
+print("streamed", streamed.count("question") == scored, streamed[-1])
+httpd.shutdown()
+' 2>&1)
+assert_contains "$CONCURRENT" "timer fast while scoring" "The timer should answer while scoring runs"
+assert_contains "$CONCURRENT" "results [True, True] spawned 1" \
+	"A second score request should join the running job instead of spawning ckad-score.sh again"
+assert_contains "$CONCURRENT" "streamed True summary" \
+	"A score stream should replay and follow the running job's questions"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
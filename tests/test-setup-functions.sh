@@ -39,6 +39,7 @@ assert_function_exists "cleanup_helm" "cleanup_helm function should exist"
 assert_function_exists "cleanup_directories" "cleanup_directories function should exist"
 assert_function_exists "cleanup_registry" "cleanup_registry function should exist"
 assert_function_exists "wait_for_namespace_deletion" "wait_for_namespace_deletion function should exist"
+assert_function_exists "remaining_namespaces" "remaining_namespaces function should exist"
 
 # ----------------------------------------------------------------------------
 # Test: Exam configuration variables with load_exam
@@ -93,6 +94,20 @@ test_case "Manifest files exist for public exams"
 assert_file_exists "$PROJECT_DIR/exams/ckad-simulation2/manifests/setup/namespaces.yaml" "simulation2 namespaces.yaml should exist"
 assert_file_exists "$PROJECT_DIR/exams/ckad-simulation3/manifests/setup/namespaces.yaml" "simulation3 namespaces.yaml should exist"
 
+# ----------------------------------------------------------------------------
+# Test: Manifest bundle documents
+# ----------------------------------------------------------------------------
+test_case "Setup manifests split into one document per object"
+
+BUNDLE_DOCS_DIR=$(mktemp -d)
+DOC_COUNT=$(write_manifest_documents "$PROJECT_DIR/exams/ckad-simulation2/manifests/setup" "$BUNDLE_DOCS_DIR")
+KIND_COUNT=$(cat "$PROJECT_DIR"/exams/ckad-simulation2/manifests/setup/*.yaml | grep -c "^kind:")
+
+assert_equals "$KIND_COUNT" "$DOC_COUNT" "Every object should get its own document"
+assert_equals "Namespace phoenix " "$(manifest_object_ref "$BUNDLE_DOCS_DIR/0001.yaml")" "namespaces.yaml should come first"
+assert_contains "$(cat "$BUNDLE_DOCS_DIR"/*.yaml | grep -h "^kind:" | sort -u)" "Deployment" "Documents should include the question resources"
+rm -rf "$BUNDLE_DOCS_DIR"
+
 # ----------------------------------------------------------------------------
 # Test: HELM configuration
 # ----------------------------------------------------------------------------
@@ -108,6 +123,180 @@ assert_true '[ ${#HELM_RELEASES[@]} -gt 0 ]' "HELM_RELEASES should have elements
 load_exam "ckad-simulation3"
 assert_not_empty "$HELM_NAMESPACE" "HELM_NAMESPACE should be set for simulation3"
 
+# ----------------------------------------------------------------------------
+# Test: Ownership label and setup ledger
+# ----------------------------------------------------------------------------
+test_case "Setup documents carry the exam label and the ledger compares versions"
+
+BUNDLE_DOCS_DIR=$(mktemp -d)
+DOC_COUNT=$(write_manifest_documents "$PROJECT_DIR/exams/ckad-simulation3/manifests/setup" "$BUNDLE_DOCS_DIR" ckad-simulation3)
+LABELLED_COUNT=$(grep -l "^    $EXAM_OWNER_LABEL: \"ckad-simulation3\"" "$BUNDLE_DOCS_DIR"/*.yaml | wc -l)
+assert_equals "$DOC_COUNT" "$LABELLED_COUNT" "Every document should get the exam ownership label"
+assert_equals "0" "$(grep -c "^  labels:" "$BUNDLE_DOCS_DIR"/*.yaml | grep -vc ":1$")" \
+	"Each document should have exactly one labels block"
+rm -rf "$BUNDLE_DOCS_DIR"
+
+assert_success "_version_matches 2:100 2:250" "Same generation should match despite status updates"
+assert_fails "_version_matches 2:100 3:250" "A new generation should count as drift"
+assert_success "_version_matches :100 :100" "Kinds without generation should compare resourceVersion"
+assert_fails "_version_matches :100 ''" "A missing object should count as drift"
+
+# ----------------------------------------------------------------------------
+# Test: Immutable field fallback
+# ----------------------------------------------------------------------------
+test_case "Only immutable field errors fall back to replace --force"
+
+# Print how _apply_manifest_object handled an apply rejected with the given error
+apply_after_error() {
+	kubectl() {
+		case "$1" in
+		apply)
+			echo "$APPLY_ERROR" >&2
+			return 1
+			;;
+		replace) echo "Pod/default/web 1:2" ;;
+		esac
+	}
+	APPLY_ERROR="$1" _apply_manifest_object /dev/null "pod/web"
+}
+
+assert_contains "$(apply_after_error 'The Deployment "web" is invalid: spec.selector: Invalid value: {}: field is immutable')" \
+	"Replaced pod/web" "Immutable field changes should be replaced"
+assert_contains "$(apply_after_error 'The Pod "web" is invalid: spec: Forbidden: pod updates may not change fields other than `spec.containers[*].image`')" \
+	"Replaced pod/web" "Pod spec changes should be replaced"
+assert_contains "$(apply_after_error "The StatefulSet \"db\" is invalid: spec: Forbidden: updates to statefulset spec for fields other than 'replicas' and 'template' are forbidden")" \
+	"Replaced pod/web" "StatefulSet spec changes should be replaced"
+assert_contains "$(apply_after_error 'pods "web" is forbidden: User "dev" cannot patch resource "pods": RBAC: access are forbidden')" \
+	"Failed to apply pod/web" "Forbidden errors other than immutable fields should fail"
+assert_contains "$(apply_after_error 'pods "web" is forbidden: exceeded quota: compute-quota')" \
+	"Failed to apply pod/web" "Quota rejections should fail"
+
+# ----------------------------------------------------------------------------
+# Test: Default namespace allow-list
+# ----------------------------------------------------------------------------
+test_case "Cleanup keeps only allow-listed default namespace objects"
+
+assert_success "cleanup_keeps_object service/kubernetes" "kubernetes service should be kept"
+assert_success "cleanup_keeps_object configmap/kube-root-ca.crt" "kube-root-ca.crt should be kept"
+assert_success "cleanup_keeps_object secret/sh.helm.release.v1.web.v1" "Helm release secrets should be kept"
+assert_success "cleanup_keeps_object pod/coredns-5d78c9869d-abcde" "coredns pods should be kept"
+assert_fails "cleanup_keeps_object service/web" "Other services should be deleted"
+assert_fails "cleanup_keeps_object deployment.apps/kube-proxy" "Allow-list should match on kind"
+
+DELETE_CALLS=$(
+	kubectl() {
+		case "$1" in
+		get) [[ "$*" == *-l* ]] || printf 'pod/web\ndeployment.apps/web\nservice/kubernetes\n' ;;
+		delete) echo "$*" >&3 ;;
+		esac
+	}
+	cleanup_default_namespace 3>&1 >/dev/null
+)
+assert_contains "$DELETE_CALLS" "delete pod/web -n default --grace-period=0 --force" "Pods should be force-deleted"
+assert_contains "$DELETE_CALLS" "delete deployment.apps/web -n default --wait=false" \
+	"Other kinds should be deleted without --force"
+
+# ----------------------------------------------------------------------------
+# Test: Helm chart cache
+# ----------------------------------------------------------------------------
+test_case "Helm chart comes from the local cache"
+
+assert_function_exists "helm_cached_chart" "helm_cached_chart function should exist"
+
+CHART_CACHE_DIR=$(mktemp -d)
+touch "$CHART_CACHE_DIR/nginx-18.2.0.tgz" "$CHART_CACHE_DIR/nginx-18.10.1.tgz"
+CACHED_CHART=$(HELM_CHART_CACHE_DIR="$CHART_CACHE_DIR" helm_cached_chart)
+assert_equals "$CHART_CACHE_DIR/nginx-18.10.1.tgz" "$CACHED_CHART" "Newest cached chart version should be used"
+rm -rf "$CHART_CACHE_DIR"
+
+# The candidate still gets bitnami/nginx; adding the repo must not fail setup offline
+REPO_OUTPUT=$(
+	helm() { [ "$1 $2" = "repo list" ] && echo "NAME	URL"; [ "$1 $2" = "repo list" ]; }
+	helm_candidate_repo
+)
+assert_contains "$REPO_OUTPUT" "helm repo add bitnami" "An unreachable repo should tell the candidate how to add it"
+REPO_OUTPUT=$(
+	helm() { [ "$1 $2" = "repo list" ] && printf 'NAME\tURL\nbitnami\thttps://charts.bitnami.com/bitnami\n'; }
+	helm_candidate_repo
+)
+assert_contains "$REPO_OUTPUT" "already configured" "A configured repo should not be added again"
+
+# ----------------------------------------------------------------------------
+# Test: Post-setup steps
+# ----------------------------------------------------------------------------
+test_case "Post-setup runs only the exam's declared steps, concurrently"
+
+load_exam "ckad-simulation2"
+assert_contains "$(setup_post_resources)" "No post-setup steps" "Exams without post-setup steps should skip it"
+
+POST_OUTPUT=$(
+	kubectl() {
+		[ "$1" = "rollout" ] && sleep 0.5
+		[[ "$*" != *missing* ]]
+	}
+	POST_SETUP_BROKEN_ROLLOUTS=(
+		"hydra/rollback-app nginx=nginx:broken Q21"
+		"ares/battle-app battle-container=nginx:broken-image Q8"
+		"njord/missing app=nginx:broken Q9"
+	)
+	POST_SETUP_BROKEN_HELM_RELEASE=""
+	start=$(date +%s%N)
+	setup_post_resources
+	echo "errors=$? ms=$((($(date +%s%N) - start) / 1000000))"
+)
+assert_contains "$POST_OUTPUT" "Q21: Created broken deployment revision (nginx:broken)" "Rollouts should get their broken image"
+assert_contains "$POST_OUTPUT" "Q9: Deployment njord/missing did not become available" "Failed steps should be reported"
+assert_contains "$POST_OUTPUT" "errors=1" "Failed steps should be counted"
+assert_true '[ "$(grep -o "ms=[0-9]*" <<<"$POST_OUTPUT" | cut -d= -f2)" -lt 1200 ]' \
+	"Rollout waits should run concurrently"
+
+# ----------------------------------------------------------------------------
+# Test: Image cache
+# ----------------------------------------------------------------------------
+test_case "Exam images are derived from manifests, templates and documents"
+
+load_exam "ckad-simulation4"
+EXAM_IMAGES=$(exam_images)
+assert_contains "$EXAM_IMAGES" "nginx:1.20" "Manifest images should be listed"
+assert_contains "$EXAM_IMAGES" "docker.io/library/alpine:3.18" "Dockerfile base images should be listed"
+assert_contains "$EXAM_IMAGES" "$REGISTRY_IMAGE" "The registry image should be listed"
+load_exam "ckad-simulation5"
+assert_equals "0" "$(exam_images | grep -cx "nginx")" "Untagged images should be listed with :latest"
+
+assert_equals "docker.io/library/nginx:latest" "$(image_full_name nginx)" "Official images should get docker.io/library"
+assert_equals "docker.io/bitnami/kubectl:1.30" "$(image_full_name bitnami/kubectl:1.30)" "User images should get docker.io"
+assert_equals "localhost:5000/app:v1" "$(image_full_name localhost:5000/app:v1)" "Registry hosts should be kept"
+assert_equals "library/nginx:1.20" "$(registry_image_path nginx:1.20)" "Registry paths should drop the source host"
+
+# Listing images reads only the chart cache, never the network
+load_exam "ckad-simulation2"
+HELM_CALLS=$(
+	helm() { echo "helm $*" >&3; }
+	HELM_CHART_CACHE_DIR="$(mktemp -d)"
+	_helm_images 3>&1 2>/dev/null
+	rmdir "$HELM_CHART_CACHE_DIR"
+)
+assert_equals "" "$HELM_CALLS" "An empty chart cache should not be filled by helm pull"
+assert_contains "$(helm() { :; }; HELM_CHART_CACHE_DIR=/nonexistent _helm_images 2>&1)" "Helm chart not cached" \
+	"Skipped chart images should be reported"
+
+test_case "Cached images are seeded into the local registry"
+
+IMAGE_CACHE_DIR=$(mktemp -d)
+touch "$(image_archive nginx:1.20)" "$(image_archive redis:7)"
+SEED_OUTPUT=$(
+	exam_images() { printf '%s\n' nginx:1.20 redis:7 busybox:1.36 localhost:5000/app:v1; }
+	curl() { [[ "$*" != */redis/manifests/* ]]; }
+	docker() { [ "$1" = "push" ] && echo "push $2" >&3; true; }
+	images_seed_registry 3>&1
+)
+rm -rf "$IMAGE_CACHE_DIR"
+assert_contains "$SEED_OUTPUT" "push localhost:5000/library/redis:7" "Cached images missing from the registry should be pushed"
+assert_equals "0" "$(grep -c "push localhost:5000/library/nginx" <<<"$SEED_OUTPUT")" \
+	"Images already in the registry should not be pushed again"
+assert_contains "$SEED_OUTPUT" "1 image(s) not cached" "Uncached images should be reported"
+assert_equals "0" "$(grep -c "localhost:5000/app" <<<"$SEED_OUTPUT")" "Candidate registry images should be left alone"
+
 # ============================================================================
 # SUMMARY
 # ============================================================================
@@ -0,0 +1,123 @@
+#!/bin/bash
+# test-snapshot.sh - Unit tests for scripts/lib/snapshot.sh
+
+# Get script directory
+TESTS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$TESTS_DIR/.." && pwd)"
+
+# Source test framework
+source "$TESTS_DIR/test-framework.sh"
+
+# Source the module under test
+source "$PROJECT_DIR/scripts/lib/snapshot.sh"
+
+# Build a snapshot from fixture lists instead of a live cluster
+FIXTURE_DIR=$(mktemp -d)
+cleanup_snapshot_tests() {
+	snapshot_clear
+	rm -rf "$FIXTURE_DIR"
+}
+trap cleanup_snapshot_tests EXIT
+
+cat >"$FIXTURE_DIR/neptune.json" <<'JSON'
+{"apiVersion": "v1", "kind": "List", "items": [
+  {"apiVersion": "apps/v1", "kind": "Deployment",
+   "metadata": {"name": "web", "namespace": "neptune", "labels": {"app": "web", "tier": "frontend"}},
+   "spec": {"replicas": 3, "selector": {"matchLabels": {"app": "web"}},
+     "template": {"spec": {"containers": [
+       {"name": "nginx", "image": "nginx:1.25", "ports": [{"containerPort": 80}]},
+       {"name": "sidecar", "image": "busybox:1.36"}]}}}},
+  {"apiVersion": "v1", "kind": "Pod",
+   "metadata": {"name": "web-abc", "namespace": "neptune", "labels": {"app": "web"}},
+   "status": {"phase": "Running"}},
+  {"apiVersion": "v1", "kind": "Pod",
+   "metadata": {"name": "db-xyz", "namespace": "neptune", "labels": {"app": "db"}},
+   "status": {"phase": "Pending"}},
+  {"apiVersion": "v1", "kind": "ConfigMap",
+   "metadata": {"name": "settings-v2", "namespace": "neptune"}},
+  {"apiVersion": "v1", "kind": "ConfigMap",
+   "metadata": {"name": "settings", "namespace": "neptune"}}
+]}
+JSON
+cat >"$FIXTURE_DIR/cluster.json" <<'JSON'
+{"apiVersion": "v1", "kind": "List", "items": [
+  {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "neptune"}}
+]}
+JSON
+
+SNAPSHOT_DIR=$(mktemp -d)
+mkdir -p "$SNAPSHOT_DIR/neptune" "$SNAPSHOT_DIR/_cluster"
+python3 "$SNAPSHOT_HELPER" build "$SNAPSHOT_DIR" "$FIXTURE_DIR/neptune.json" "$FIXTURE_DIR/cluster.json" >/dev/null
+
+# ============================================================================
+# TEST SUITE: snapshot.sh
+# ============================================================================
+
+test_suite "snapshot.sh - Snapshot Scoring"
+
+# ----------------------------------------------------------------------------
+# Test: Functions exist
+# ----------------------------------------------------------------------------
+test_case "Snapshot functions are defined"
+
+assert_function_exists "snapshot_take" "snapshot_take should be defined"
+assert_function_exists "snapshot_clear" "snapshot_clear should be defined"
+assert_function_exists "kubectl" "kubectl wrapper should be defined"
+assert_file_exists "$SNAPSHOT_HELPER" "snapshot.py helper should exist"
+
+# ----------------------------------------------------------------------------
+# Test: Named objects
+# ----------------------------------------------------------------------------
+test_case "Named objects are answered from the snapshot"
+
+assert_success "kubectl get deploy web -n neptune" "Existing deployment should be found"
+assert_fails "kubectl get deploy missing -n neptune 2>/dev/null" "Missing deployment should fail"
+assert_success "kubectl get ns neptune" "Cluster-scoped namespace should be found"
+assert_contains "$(kubectl get deployment web -n neptune -o json)" '"replicas": 3' "-o json should be pretty-printed"
+
+# ----------------------------------------------------------------------------
+# Test: JSONPath output
+# ----------------------------------------------------------------------------
+test_case "JSONPath output matches kubectl formatting"
+
+assert_equals "3" "$(kubectl get deploy web -n neptune -o jsonpath='{.spec.replicas}')" "Scalar field"
+assert_equals "nginx:1.25 busybox:1.36" \
+	"$(kubectl get deploy web -n neptune -o jsonpath='{.spec.template.spec.containers[*].image}')" "Wildcard joins with spaces"
+assert_equals "busybox:1.36" \
+	"$(kubectl get deploy web -n neptune -o jsonpath='{.spec.template.spec.containers[?(@.name=="sidecar")].image}')" "Filter expression"
+assert_equals '{"app":"web","tier":"frontend"}' \
+	"$(kubectl get deploy/web -n neptune -o jsonpath='{.metadata.labels}')" "Maps print as compact JSON"
+assert_equals "" "$(kubectl get deploy web -n neptune -o jsonpath='{.spec.paused}')" "Missing field prints nothing"
+
+# ----------------------------------------------------------------------------
+# Test: Lists and selectors
+# ----------------------------------------------------------------------------
+test_case "Lists honour label selectors"
+
+assert_equals "db-xyz web-abc" "$(kubectl get pods -n neptune -o jsonpath='{.items[*].metadata.name}')" "All pods, sorted by name"
+assert_equals "web-abc" "$(kubectl get pods -n neptune -l app=web -o jsonpath='{.items[*].metadata.name}')" "Equality selector"
+assert_equals "Pending" "$(kubectl get pods -n neptune -l 'app!=web' -o jsonpath='{range .items[*]}{.status.phase}{end}')" "Inequality selector with range"
+assert_equals "settings settings-v2" "$(kubectl get cm -n neptune -o jsonpath='{.items[*].metadata.name}')" \
+	"Items are sorted by name, not by file name"
+
+# ----------------------------------------------------------------------------
+# Test: Fallback to the API server
+# ----------------------------------------------------------------------------
+test_case "Unsupported queries fall back to kubectl"
+
+rc=0
+_snapshot_kubectl_get deploy web -n neptune -o yaml >/dev/null 2>&1 || rc=$?
+assert_equals "$SNAPSHOT_UNSUPPORTED" "$rc" "-o yaml should fall back"
+rc=0
+_snapshot_kubectl_get pods -n saturn -o json >/dev/null 2>&1 || rc=$?
+assert_equals "$SNAPSHOT_UNSUPPORTED" "$rc" "Namespace outside the snapshot should fall back"
+rc=0
+_snapshot_kubectl_get pods -n neptune -l 'app in (web)' -o json >/dev/null 2>&1 || rc=$?
+assert_equals "$SNAPSHOT_UNSUPPORTED" "$rc" "Set-based selector should fall back"
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+test_summary
+exit $?
@@ -211,6 +211,22 @@ assert_not_empty "$_end_time" "END_TIME should be set"
 kill $_timer_pid 2>/dev/null
 timer_stop 2>/dev/null
 
+# ----------------------------------------------------------------------------
+# Test: State file keeps a constant size and survives status rewrites
+# ----------------------------------------------------------------------------
+test_case "State file is rewritten in place with a fixed set of keys"
+
+timer_init
+_timer_write_state 1000 4600 60 10 "Exam With Spaces" running
+_timer_set_status stopped
+_timer_read_state
+
+assert_equals "6" "$(wc -l <"$TIMER_STATE_FILE" | tr -d ' ')" "State file should always have 6 lines"
+assert_equals "stopped" "$STATUS" "STATUS should be rewritten"
+assert_equals "4600" "$END_TIME" "END_TIME (deadline) should be kept"
+assert_equals "Exam With Spaces" "$EXAM_NAME" "EXAM_NAME with spaces should round-trip"
+assert_true '[ -z "$(ls "$TIMER_STATE_DIR" | grep -v "^timer.state$")" ]' "No temp files should be left behind"
+
 # ----------------------------------------------------------------------------
 # Test: timer_reset clears state
 # ----------------------------------------------------------------------------
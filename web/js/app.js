@@ -13,6 +13,8 @@ const state = {
     currentQuestionIndex: 0,
     flaggedQuestions: new Set(),
     timerInterval: null,
+    timerSource: null,
+    timerSync: null,
     timeRemaining: 0,
     timerPaused: false,
     examStarted: false,
@@ -83,6 +85,29 @@ const api = {
         return response.json();
     },
 
+    // Score via Server-Sent Events: onQuestion runs as each question is scored,
+    // the promise resolves with the same result as getScore()
+    streamScore(onQuestion) {
+        if (!window.EventSource) {
+            return this.getScore();
+        }
+        return new Promise((resolve, reject) => {
+            const source = new EventSource('/api/score/stream');
+            source.addEventListener('question', event => {
+                onQuestion(JSON.parse(event.data));
+            });
+            source.addEventListener('summary', event => {
+                source.close();
+                resolve(JSON.parse(event.data));
+            });
+            // Close on error so the browser does not reconnect and score again
+            source.onerror = () => {
+                source.close();
+                reject(new Error('Score stream interrupted'));
+            };
+        });
+    },
+
     async getSolutions(examId) {
         const response = await fetch(`/api/exam/${examId}/solutions`);
         return response.json();
@@ -527,53 +552,95 @@ async function startExam(examId) {
 // ============================================================================
 
 function startTimerUpdates() {
-    // Clear any existing interval
+    // Clear any existing interval or stream
+    stopTimerUpdates();
+
+    if (window.EventSource) {
+        // The server pushes the timer state when it changes (start, pause,
+        // resume, stop); the countdown itself runs locally. EventSource
+        // reconnects on its own and the first event resyncs the clock.
+        state.timerSource = new EventSource('/api/timer/events');
+        state.timerSource.addEventListener('timer', event => {
+            applyTimerState(JSON.parse(event.data));
+        });
+        state.timerInterval = setInterval(renderTimer, 1000);
+    } else {
+        // Fallback: poll every second
+        updateTimer();
+        state.timerInterval = setInterval(updateTimer, 1000);
+    }
+}
+
+function stopTimerUpdates() {
     if (state.timerInterval) {
         clearInterval(state.timerInterval);
+        state.timerInterval = null;
+    }
+    if (state.timerSource) {
+        state.timerSource.close();
+        state.timerSource = null;
     }
-
-    // Update immediately
-    updateTimer();
-
-    // Then update every second
-    state.timerInterval = setInterval(updateTimer, 1000);
 }
 
 async function updateTimer() {
     try {
-        const timerState = await api.getTimerState();
-        state.timeRemaining = timerState.remaining_seconds;
+        applyTimerState(await api.getTimerState());
+    } catch (error) {
+        console.error('Failed to update timer:', error);
+    }
+}
 
-        // Sync paused state from server
-        if (timerState.paused !== state.timerPaused) {
-            state.timerPaused = timerState.paused;
-            updatePauseUI();
-        }
+// Record the server's timer state as the reference for the local countdown
+function applyTimerState(timerState) {
+    state.timerSync = {
+        remaining: timerState.remaining_seconds,
+        running: timerState.running,
+        paused: timerState.paused,
+        receivedAt: performance.now()
+    };
 
-        // Format time
-        const minutes = Math.floor(state.timeRemaining / 60);
-        const seconds = state.timeRemaining % 60;
-        const timeStr = `${minutes}:${seconds.toString().padStart(2, '0')}`;
-        elements.timerDisplay.textContent = timeStr;
-
-        // Update timer color based on remaining time
-        elements.timer.classList.remove('warning', 'danger');
-
-        if (state.timeRemaining <= 60) {
-            elements.timer.classList.add('danger');
-        } else if (state.timeRemaining <= 5 * 60) {
-            elements.timer.classList.add('danger');
-        } else if (state.timeRemaining <= 15 * 60) {
-            elements.timer.classList.add('warning');
-        }
+    // Sync paused state from server
+    if (timerState.paused !== state.timerPaused) {
+        state.timerPaused = timerState.paused;
+        updatePauseUI();
+    }
 
-        // Check if time's up
-        if (!timerState.running && state.examStarted && !state.examEnded && !timerState.paused) {
-            endExam();
-        }
+    renderTimer();
+}
 
-    } catch (error) {
-        console.error('Failed to update timer:', error);
+function renderTimer() {
+    const sync = state.timerSync;
+    if (!sync) return;
+
+    // Count down from the last server state while the timer runs
+    let remaining = sync.remaining;
+    if (sync.running && !sync.paused) {
+        const elapsed = Math.floor((performance.now() - sync.receivedAt) / 1000);
+        remaining = Math.max(0, sync.remaining - elapsed);
+    }
+    state.timeRemaining = remaining;
+
+    // Format time
+    const minutes = Math.floor(state.timeRemaining / 60);
+    const seconds = state.timeRemaining % 60;
+    const timeStr = `${minutes}:${seconds.toString().padStart(2, '0')}`;
+    elements.timerDisplay.textContent = timeStr;
+
+    // Update timer color based on remaining time
+    elements.timer.classList.remove('warning', 'danger');
+
+    if (state.timeRemaining <= 60) {
+        elements.timer.classList.add('danger');
+    } else if (state.timeRemaining <= 5 * 60) {
+        elements.timer.classList.add('danger');
+    } else if (state.timeRemaining <= 15 * 60) {
+        elements.timer.classList.add('warning');
+    }
+
+    // Check if time's up
+    const timeUp = !sync.paused && (!sync.running || remaining <= 0);
+    if (timeUp && state.examStarted && !state.examEnded) {
+        endExam();
     }
 }
 
@@ -606,9 +673,7 @@ function updatePauseButtonVisibility() {
 
 function endExam() {
     state.examEnded = true;
-    if (state.timerInterval) {
-        clearInterval(state.timerInterval);
-    }
+    stopTimerUpdates();
     elements.timesUpModal.classList.remove('hidden');
 }
 
@@ -640,9 +705,7 @@ async function stopExam() {
 async function executeStopExam() {
     // Stop timer
     state.examEnded = true;
-    if (state.timerInterval) {
-        clearInterval(state.timerInterval);
-    }
+    stopTimerUpdates();
 
     // Show modal with loading state
     elements.scoreModal.classList.remove('hidden');
@@ -656,7 +719,17 @@ async function executeStopExam() {
     elements.scoreQuestionsList.innerHTML = '<div class="loading">Scoring in progress...</div>';
 
     try {
-        const result = await api.getScore();
+        let scoredCount = 0;
+        // Preview questions (P1, P2...) are not scored
+        const scoredTotal = state.questions.filter(q => !String(q.id).startsWith('P')).length;
+        const result = await api.streamScore(question => {
+            if (scoredCount === 0) {
+                elements.scoreQuestionsList.innerHTML = '';
+            }
+            scoredCount++;
+            elements.scoreStatus.textContent = `Scored ${scoredCount} of ${scoredTotal} questions...`;
+            appendQuestionScore(question);
+        });
 
         if (result.success) {
             // Save score result for solutions view
@@ -693,8 +766,10 @@ async function executeStopExam() {
                 }
             }
 
-            // Render question scores
-            renderQuestionScores(result.questions);
+            // Render question scores (already shown if they were streamed)
+            if (scoredCount === 0) {
+                renderQuestionScores(result.questions);
+            }
 
         } else {
             elements.scoreResultIcon.textContent = '❌';
@@ -724,9 +799,15 @@ function renderQuestionScores(questions) {
         return;
     }
 
-    elements.scoreQuestionsList.innerHTML = questions.map(q => {
-        const indicator = getScoreIndicator(q.score, q.max_score);
-        return `
+    elements.scoreQuestionsList.innerHTML = questions.map(renderQuestionScore).join('');
+
+    // Add click handlers for expand/collapse
+    setupQuestionRowClickHandlers();
+}
+
+function renderQuestionScore(q) {
+    const indicator = getScoreIndicator(q.score, q.max_score);
+    return `
         <div class="score-question-item ${q.passed ? 'passed' : 'failed'}" data-question-id="${q.id}">
             <div class="question-header">
                 <span class="expand-icon">▶</span>
@@ -738,10 +819,16 @@ function renderQuestionScores(questions) {
             ${renderCriteriaList(q.criteria, true)}
         </div>
     `;
-    }).join('');
+}
 
-    // Add click handlers for expand/collapse
-    setupQuestionRowClickHandlers();
+function appendQuestionScore(q) {
+    elements.scoreQuestionsList.insertAdjacentHTML('beforeend', renderQuestionScore(q));
+
+    const item = elements.scoreQuestionsList.lastElementChild;
+    const header = item.querySelector('.question-header');
+    if (header) {
+        header.addEventListener('click', () => toggleQuestionCriteria(item));
+    }
 }
 
 function renderCriteriaList(criteria, collapsed = false) {
@@ -1262,9 +1349,7 @@ function backToSelection() {
     }
 
     // Stop timer
-    if (state.timerInterval) {
-        clearInterval(state.timerInterval);
-    }
+    stopTimerUpdates();
 
     // Reset state
     state.examStarted = false;
@@ -4,15 +4,21 @@ ckad-dojo - Web Server
 Serves the exam interface and provides API endpoints
 """
 
+import gzip
+import hashlib
 import http.server
 import json
+import mimetypes
 import os
 import re
-import socketserver
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -24,6 +30,12 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 EXAMS_DIR = PROJECT_DIR / "exams"
 
+# Compiled exam index, shared with the CLI and the scripts
+sys.path.insert(0, str(PROJECT_DIR / "scripts" / "lib"))
+import exam_index  # noqa: E402
+import kube_client  # noqa: E402
+import score_watch  # noqa: E402
+
 # Timer state (in-memory)
 timer_state = {
     "start_time": None,
@@ -43,10 +55,130 @@ shutdown_requested = False
 # Question flags state (in-memory)
 flagged_questions = set()
 
+# Guards timer_state and flagged_questions across request threads
+state_lock = threading.RLock()
+
+# Signalled on every timer_state change, for /api/timer/events subscribers
+timer_changed = threading.Condition(state_lock)
+timer_version = 0
+
+# Seconds between keep-alive comments on an idle timer event stream
+TIMER_KEEPALIVE = 15
+
+# Scoring and cleanup run on this pool; identical in-flight requests share a job
+job_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ckad-job")
+running_jobs = {}
+running_jobs_lock = threading.Lock()
+
 # Scripts directory
 SCRIPTS_DIR = PROJECT_DIR / "scripts"
 
 
+def notify_timer_change():
+    """Wake the timer event streams (caller must hold state_lock)"""
+    global timer_version
+    timer_version += 1
+    timer_changed.notify_all()
+
+
+def timer_seconds_left():
+    """Seconds until the running timer expires, None while it is stopped or paused
+    (caller must hold state_lock)"""
+    if not timer_state["running"] or timer_state["start_time"] is None or timer_state.get("paused"):
+        return None
+    elapsed = time.time() - timer_state["start_time"] - timer_state.get("total_paused_seconds", 0)
+    return timer_state["duration_minutes"] * 60 - elapsed
+
+
+class Job:
+    """A job on the pool, shared by every request that asked for its key.
+
+    Progress events the job publishes are kept so that a request joining late
+    (e.g. a score stream opened while POST /api/score runs) can replay them.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.future = None
+        self.events = []
+        self.finished = False
+        self.followers = 0
+        self.abandoned = False
+        self.changed = threading.Condition()
+
+    def publish(self, event):
+        """Record a progress event; raises BrokenPipeError once every request
+        following the job has left, which stops the job"""
+        if self.abandoned:
+            raise BrokenPipeError(f"No one is waiting for {self.key}")
+        with self.changed:
+            self.events.append(event)
+            self.changed.notify_all()
+
+    def finish(self, future):
+        """Wake the followers when the job is done and drop it from running_jobs"""
+        with self.changed:
+            self.finished = True
+            self.changed.notify_all()
+        with running_jobs_lock:
+            if running_jobs.get(self.key) is self:
+                del running_jobs[self.key]
+
+    def follow(self):
+        """Yield every progress event so far, then the new ones until the job is done"""
+        seen = 0
+        while True:
+            with self.changed:
+                self.changed.wait_for(lambda: len(self.events) > seen or self.finished)
+                events = self.events[seen:]
+                finished = self.finished
+            seen += len(events)
+            yield from events
+            if finished:
+                return
+
+    def leave(self):
+        """Stop following the job; the last request to leave abandons it"""
+        with running_jobs_lock:
+            self.followers -= 1
+            if self.followers == 0 and not self.finished:
+                self.abandoned = True
+                if running_jobs.get(self.key) is self:
+                    del running_jobs[self.key]
+
+
+def start_job(key: str, func, *args, progress: str = None) -> Job:
+    """Start func(*args) on the job pool, or join the job already running for
+    key (e.g. a double-clicked "Stop Exam").
+
+    With `progress`, the job's publish method is passed to func as that
+    keyword argument.
+    """
+    with running_jobs_lock:
+        job = running_jobs.get(key)
+        started = job is None
+        if started:
+            job = Job(key)
+            kwargs = {progress: job.publish} if progress else {}
+            job.future = job_executor.submit(func, *args, **kwargs)
+            running_jobs[key] = job
+        job.followers += 1
+    if started:
+        # Outside the lock: runs at once if the job is already done
+        job.future.add_done_callback(job.finish)
+    return job
+
+
+def run_in_background(key: str, func, *args):
+    """Run a long operation on the job pool and wait for its result"""
+    return start_job(key, func, *args).future.result()
+
+
+def full_score_job(exam_id: str) -> Job:
+    """The job scoring the whole exam, whose events are the scored questions"""
+    return start_job(f"score:{exam_id}", run_scoring_script, exam_id, progress="on_question")
+
+
 def run_cleanup_script(exam_id: str = None) -> dict:
     """Run ckad-cleanup.sh to clean up exam resources"""
     script_path = SCRIPTS_DIR / "ckad-cleanup.sh"
@@ -96,146 +228,144 @@ def run_cleanup_script(exam_id: str = None) -> dict:
         return {"success": False, "error": str(e)}
 
 
-def strip_ansi_codes(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    ansi_pattern = re.compile(r"\x1b\[[0-9;]*m")
-    return ansi_pattern.sub("", text)
+def iter_score_records(exam_id: str = None, timeout: int = 60, questions: list = None):
+    """Run ckad-score.sh in NDJSON mode and yield its records as they are written.
 
+    With `questions`, only those are scored (ckad-score.sh -q) and there is no
+    summary record. Raises subprocess.TimeoutExpired if scoring takes longer
+    than `timeout` seconds, and RuntimeError if the script exits without a
+    summary record (or with an error when scoring questions).
 
-def parse_criteria_from_output(output: str, question_id: str) -> list:
-    """Extract criteria (PASS/FAIL) for a specific question from scoring output.
-
-    Criteria lines start with ✓ (pass) or ✗ (fail) markers.
-    They appear between the question header and the score line.
+    The script runs in its own process group with a private TMPDIR, so a kill
+    also stops its parallel question subshells and their kubectl calls, and
+    leaves no temporary files behind.
     """
-    criteria = []
+    script_path = SCRIPTS_DIR / "ckad-score.sh"
+    if not script_path.exists():
+        raise FileNotFoundError("Scoring script not found")
 
-    # Strip ANSI color codes from output before parsing
-    output = strip_ansi_codes(output)
+    cmd = [str(script_path), "--format", "ndjson"]
+    if exam_id:
+        cmd.extend(["-e", exam_id])
+    if questions:
+        cmd.extend(["-q", ",".join(questions), "-j", str(min(len(questions), 4))])
+
+    with tempfile.TemporaryFile(mode="w+") as stderr, \
+            tempfile.TemporaryDirectory(prefix="ckad-score-") as tmp_dir:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, text=True, cwd=str(PROJECT_DIR),
+            env={**os.environ, "TMPDIR": tmp_dir}, start_new_session=True,
+        )
+        timed_out = threading.Event()
 
-    # Find the section for this question
-    # Question headers: "Question N | Topic" or just "Question N"
-    # Also handle format with "QN" prefix in summary
-    lines = output.split("\n")
-    in_question = False
+        def kill_group():
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
 
-    for line in lines:
-        # Check if we're entering a question section
-        # Match patterns like "Question 1 |" or "Question 1 "
-        if re.match(rf"^Question\s+{question_id}\s*[\|\s]", line, re.IGNORECASE):
-            in_question = True
-            continue
-
-        # Check if we're at the score line (end of question section)
-        # Format: "N/N" at end of scoring output for each question
-        if in_question and re.match(r"^\d+/\d+$", line.strip()):
-            break
-
-        # Check if we've reached a new question (exit current section)
-        if in_question and re.match(r"^Question\s+\d+", line, re.IGNORECASE):
-            break
-
-        # Parse criteria lines (✓ or ✗ followed by description)
-        if in_question:
-            # Match PASS criteria: ✓ description
-            pass_match = re.match(r"^[✓✔]\s+(.+)$", line.strip())
-            if pass_match:
-                criteria.append(
-                    {"description": pass_match.group(1).strip(), "passed": True}
-                )
-                continue
+        def kill_on_timeout():
+            timed_out.set()
+            kill_group()
 
-            # Match FAIL criteria: ✗ description
-            fail_match = re.match(r"^[✗✘×]\s+(.+)$", line.strip())
-            if fail_match:
-                criteria.append(
-                    {"description": fail_match.group(1).strip(), "passed": False}
-                )
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+        summary_seen = False
+        try:
+            for line in proc.stdout:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                summary_seen = summary_seen or record.get("type") == "summary"
+                yield record
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                kill_group()
+                proc.wait()
+            proc.stdout.close()
+
+        complete = summary_seen or (questions and proc.returncode == 0)
+        if timed_out.is_set() and not complete:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if not complete:
+            stderr.seek(0)
+            error = strip_ansi_codes(stderr.read()).strip()
+            raise RuntimeError(error or f"Scoring script exited with code {proc.returncode}")
 
-    return criteria
 
+def strip_ansi_codes(text: str) -> str:
+    """Remove ANSI escape codes from text."""
+    ansi_pattern = re.compile(r"\x1b\[[0-9;]*m")
+    return ansi_pattern.sub("", text)
 
-def run_scoring_script(exam_id: str = None) -> dict:
-    """Run ckad-score.sh and parse the output"""
-    script_path = SCRIPTS_DIR / "ckad-score.sh"
 
-    if not script_path.exists():
-        return {
-            "success": False,
-            "error": "Scoring script not found",
-            "questions": [],
-            "total_score": 0,
-            "max_score": 0,
-            "percentage": 0,
-            "passed": False,
-        }
+def score_totals(questions: list, passing_percentage: int) -> dict:
+    """Total score, percentage and pass/fail of a list of scored questions"""
+    total_score = sum(q["score"] for q in questions)
+    max_score = sum(q["max_score"] for q in questions)
+    percentage = total_score * 100 // max_score if max_score else 0
+    return {
+        "total_score": total_score,
+        "max_score": max_score,
+        "percentage": percentage,
+        "passed": percentage >= passing_percentage,
+    }
 
-    try:
-        cmd = [str(script_path)]
-        if exam_id:
-            cmd.extend(["-e", exam_id])
 
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, cwd=str(PROJECT_DIR), timeout=60
-        )
+def run_scoring_script(exam_id: str = None, on_question=None, questions_only: list = None) -> dict:
+    """Run ckad-score.sh and collect its NDJSON records in a single pass
 
-        output = result.stdout
+    If given, on_question is called with each question as soon as it is scored.
+    With questions_only, only those questions are scored and the totals cover them.
+    A client disconnect raised by on_question stops scoring and is re-raised.
+    """
+    records = iter_score_records(exam_id, questions=questions_only)
+    try:
         questions = []
-        total_score = 0
-        max_score = 0
-
-        # Parse question scores from output
-        # Format: Q1       1/1          Namespaces
-        question_pattern = r"^Q(\d+|P\d+)\s+(\d+)/(\d+)\s+(.+)$"
+        criteria = []
+        summary = None
 
-        for line in output.split("\n"):
-            match = re.match(question_pattern, line.strip())
-            if match:
-                q_id = match.group(1)
-                scored = int(match.group(2))
-                possible = int(match.group(3))
-                topic = match.group(4).strip()
-
-                # Parse criteria for this question
-                criteria = parse_criteria_from_output(output, q_id)
-
-                questions.append(
-                    {
-                        "id": q_id,
-                        "score": scored,
-                        "max_score": possible,
-                        "topic": topic,
-                        "passed": scored == possible,
+        for record in records:
+            record_type = record.get("type")
+            if record_type == "criterion":
+                criteria.append(
+                    {"description": record["description"], "passed": record["passed"]}
+                )
+            elif record_type == "question":
+                # Preview questions don't count towards the exam score
+                if not record.get("preview"):
+                    question = {
+                        "id": record["question"],
+                        "score": record["score"],
+                        "max_score": record["max_score"],
+                        "topic": record["topic"],
+                        "passed": record["score"] == record["max_score"],
                         "criteria": criteria,
                     }
-                )
-                total_score += scored
-                max_score += possible
-
-        # Parse total score if available
-        # Format: TOTAL SCORE: 87 / 113 (77%)
-        total_pattern = r"TOTAL SCORE:\s*(\d+)\s*/\s*(\d+)\s*\((\d+)%\)"
-        total_match = re.search(total_pattern, output)
-        if total_match:
-            total_score = int(total_match.group(1))
-            max_score = int(total_match.group(2))
-            percentage = int(total_match.group(3))
-        else:
-            percentage = int((total_score / max_score * 100) if max_score > 0 else 0)
-
-        # Check pass/fail (66% threshold)
-        passed = percentage >= 66
-
+                    questions.append(question)
+                    if on_question:
+                        on_question(question)
+                criteria = []
+            elif record_type == "summary":
+                summary = record
+
+        if summary is None:
+            passing = read_exam_config(exam_id)["passing_percentage"]
+            return {"success": True, "questions": questions, **score_totals(questions, passing)}
         return {
             "success": True,
             "questions": questions,
-            "total_score": total_score,
-            "max_score": max_score,
-            "percentage": percentage,
-            "passed": passed,
-            "output": output,
+            "total_score": summary["score"],
+            "max_score": summary["max_score"],
+            "percentage": summary["percentage"],
+            "passed": summary["passed"],
         }
 
+    except (BrokenPipeError, ConnectionResetError):
+        raise
     except subprocess.TimeoutExpired:
         return {
             "success": False,
@@ -256,12 +386,150 @@ def run_scoring_script(exam_id: str = None) -> dict:
             "percentage": 0,
             "passed": False,
         }
+    finally:
+        # Stops the scoring script as soon as we stop reading it
+        records.close()
 
 
-def parse_solutions_md(exam_id: str) -> list:
-    """Parse solutions.md file and extract solutions"""
-    solutions_file = EXAMS_DIR / exam_id / "solutions.md"
+class ScoreBoard:
+    """Last result of every question per exam, for targeted re-scoring.
 
+    The first targeted re-score starts a score_watch.ChangeTracker on the
+    cluster objects and answer files the exam's questions read (the dependency
+    map of the exam index), so only the questions whose inputs changed need
+    scoring again. One exam is tracked at a time: tracking another exam, or
+    starting its timer, stops the previous tracker.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+        self.tracked_exam = None
+        self.tracking = None
+        self.client = None
+
+    def tracker(self, exam_id: str):
+        """Change tracker of an exam, started on first use"""
+        with self.lock:
+            if self.tracked_exam == exam_id:
+                return self.tracking
+            self.stop_tracking_locked()
+            if self.client is None:
+                try:
+                    self.client = kube_client.KubeClient.from_kubeconfig()
+                except (kube_client.Unsupported, OSError):
+                    self.client = False
+            dependencies = exam_index.load(EXAMS_DIR)["exams"][exam_id]["dependencies"]
+            tracker = score_watch.ChangeTracker(
+                dependencies, str(PROJECT_DIR / "exam" / "course"), self.client or None
+            )
+            tracker.start()
+            if exam_id in self.results:
+                # Changes since the last score happened before anyone watched
+                tracker.mark_changed(dependencies)
+            self.tracked_exam, self.tracking = exam_id, tracker
+            return tracker
+
+    def active_tracker(self, exam_id: str):
+        """Change tracker of an exam if it is the tracked one, else None"""
+        with self.lock:
+            return self.tracking if self.tracked_exam == exam_id else None
+
+    def switch_exam(self, exam_id: str):
+        """Stop tracking changes unless exam_id is the tracked exam"""
+        with self.lock:
+            if self.tracked_exam != exam_id:
+                self.stop_tracking_locked()
+
+    def stop_tracking_locked(self):
+        if self.tracking is not None:
+            self.tracking.stop()
+        self.tracked_exam = self.tracking = None
+
+    def scored(self, exam_id: str) -> bool:
+        with self.lock:
+            return exam_id in self.results
+
+    def question_ids(self, exam_id: str) -> list:
+        """IDs of the questions that count towards the score"""
+        questions = exam_index.load(EXAMS_DIR)["exams"][exam_id]["questions"]
+        return [q["id"] for q in questions if not q["id"].startswith("P")]
+
+    def changed(self, exam_id: str) -> list:
+        """Questions changed since last scored (every question before the first
+        score, or while the exam is not tracked)"""
+        regular = self.question_ids(exam_id)
+        tracker = self.active_tracker(exam_id)
+        if not self.scored(exam_id) or tracker is None:
+            return regular
+        changed = tracker.changed()
+        return [q for q in regular if q in changed]
+
+    def watch_status(self, exam_id: str) -> dict:
+        """What the exam's change tracker sees, None while it is not tracked"""
+        tracker = self.active_tracker(exam_id)
+        return tracker.status() if tracker else None
+
+    def begin_full(self, exam_id: str) -> set:
+        """Forget every pending change before a full score.
+
+        Returns the questions forgotten; re-add them with lost() if the score
+        never gets recorded.
+        """
+        tracker = self.active_tracker(exam_id)
+        return tracker.take() if tracker else set()
+
+    def begin(self, exam_id: str, questions: list = None) -> list:
+        """Start tracking and forget the pending changes of the questions about
+        to be re-scored.
+
+        Returns the questions to score: `questions`, or for None the changed ones
+        (None again when the exam has no score yet and must be scored in full).
+        """
+        tracker = self.tracker(exam_id)
+        if questions is not None:
+            tracker.mark_scored(questions)
+            return questions
+        if not self.scored(exam_id):
+            tracker.take()
+            return None
+        changed = self.changed(exam_id)
+        tracker.mark_scored(changed)
+        return changed
+
+    def lost(self, exam_id: str, questions):
+        """Mark questions as changed again after their score was lost"""
+        tracker = self.active_tracker(exam_id)
+        if tracker:
+            tracker.mark_changed(questions)
+
+    def record(self, exam_id: str, score_result: dict, questions: list = None):
+        """Store a scoring result (questions = None for a full score)"""
+        if not score_result.get("success"):
+            all_questions = exam_index.load(EXAMS_DIR)["exams"][exam_id]["dependencies"]
+            self.lost(exam_id, questions or all_questions)
+            return
+        with self.lock:
+            if questions is None:
+                self.results[exam_id] = {}
+            board = self.results.setdefault(exam_id, {})
+            for question in score_result["questions"]:
+                board[question["id"]] = question
+
+    def result(self, exam_id: str) -> dict:
+        """Body of POST /api/score built from the last result of every question"""
+        with self.lock:
+            board = dict(self.results.get(exam_id, {}))
+        questions = [board[q] for q in sorted(board, key=int)]
+        passing = read_exam_config(exam_id)["passing_percentage"]
+        return {"success": True, "questions": questions, **score_totals(questions, passing)}
+
+
+score_board = ScoreBoard()
+
+
+def read_solutions_md(solutions_file: Path) -> list:
+    """Parse solutions.md file and extract solutions"""
     if not solutions_file.exists():
         return []
 
@@ -313,25 +581,14 @@ def parse_solutions_md(exam_id: str) -> list:
     return solutions
 
 
-def get_solution(exam_id: str, question_id: str) -> dict:
-    """Get a specific solution by question ID"""
-    solutions = parse_solutions_md(exam_id)
-    for solution in solutions:
-        if str(solution["id"]) == str(question_id):
-            return solution
-    return None
-
-
 def solutions_available(exam_id: str) -> bool:
     """Check if solutions file exists for an exam"""
     solutions_file = EXAMS_DIR / exam_id / "solutions.md"
     return solutions_file.exists()
 
 
-def parse_questions_md(exam_id: str) -> list:
+def read_questions_md(questions_file: Path) -> list:
     """Parse questions.md file and extract questions"""
-    questions_file = EXAMS_DIR / exam_id / "questions.md"
-
     if not questions_file.exists():
         return []
 
@@ -408,9 +665,8 @@ def parse_questions_md(exam_id: str) -> list:
     return questions
 
 
-def load_exam_config(exam_id: str) -> dict:
-    """Load exam configuration from exam.conf"""
-    config_file = EXAMS_DIR / exam_id / "exam.conf"
+def read_exam_config(exam_id: str) -> dict:
+    """Exam settings from the compiled exam index, falling back to defaults for missing keys"""
     config = {
         "exam_name": exam_id,
         "exam_id": exam_id,
@@ -422,31 +678,202 @@ def load_exam_config(exam_id: str) -> dict:
         "allow_timer_pause": True,
     }
 
-    if config_file.exists():
-        content = config_file.read_text()
-        # Parse bash-style config
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-
-            if key == "EXAM_NAME":
-                config["exam_name"] = value
-            elif key == "EXAM_DURATION":
-                config["duration"] = int(value)
-            elif key == "EXAM_WARNING_TIME":
-                config["warning_time"] = int(value)
-            elif key == "TOTAL_QUESTIONS":
-                config["total_questions"] = int(value)
-            elif key == "TOTAL_POINTS":
-                config["total_points"] = int(value)
-            elif key == "PASSING_PERCENTAGE":
-                config["passing_percentage"] = int(value)
-            elif key == "ALLOW_TIMER_PAUSE":
-                config["allow_timer_pause"] = value.lower() == "true"
+    exam = exam_index.load(EXAMS_DIR)["exams"].get(exam_id)
+    if exam:
+        summary = exam["summary"]
+        config["exam_name"] = summary["name"]
+        config["duration"] = summary["duration"]
+        config["total_questions"] = summary["questions"]
+        config["total_points"] = summary["points"]
+        config["passing_percentage"] = summary["passing"]
+        warning_time = exam["config"].get("EXAM_WARNING_TIME", "")
+        if warning_time.isdigit():
+            config["warning_time"] = int(warning_time)
+        if "ALLOW_TIMER_PAUSE" in exam["config"]:
+            config["allow_timer_pause"] = exam["config"]["ALLOW_TIMER_PAUSE"].lower() == "true"
+
+    return config
+
+
+class FileCache:
+    """In-process cache of values derived from files.
+
+    Entries are keyed by file path and revalidated against the file's mtime
+    and size on every lookup, so edits on disk are picked up without a
+    restart.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Path, reader):
+        """Return reader(path), re-reading the file only if it changed"""
+        try:
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = reader(path)
+        with self._lock:
+            self._entries[key] = (signature, value)
+        return value
+
+    def stats(self) -> dict:
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+def indexed(reader):
+    """Wrap a list reader so it returns (items, items_by_id)"""
+
+    def read(path: Path):
+        items = reader(path)
+        return items, {str(item["id"]): item for item in items}
+
+    return read
+
+
+class ExamCatalog(FileCache):
+    """Cache of parsed exam files, with questions and solutions indexed by ID"""
+
+    def questions(self, exam_id: str) -> list:
+        """Parsed questions of an exam, in file order"""
+        return self.load(EXAMS_DIR / exam_id / "questions.md", indexed(read_questions_md))[0]
+
+    def question(self, exam_id: str, question_id: str) -> dict:
+        """One question by ID, or None"""
+        return self.load(EXAMS_DIR / exam_id / "questions.md", indexed(read_questions_md))[1].get(
+            str(question_id)
+        )
+
+    def solutions(self, exam_id: str) -> list:
+        """Parsed solutions of an exam, in file order"""
+        return self.load(EXAMS_DIR / exam_id / "solutions.md", indexed(read_solutions_md))[0]
+
+    def solution(self, exam_id: str, question_id: str) -> dict:
+        """One solution by ID, or None"""
+        return self.load(EXAMS_DIR / exam_id / "solutions.md", indexed(read_solutions_md))[1].get(
+            str(question_id)
+        )
+
+
+exam_catalog = ExamCatalog()
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag from the content hash of a response body"""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def gzip_body(body: bytes, content_type: str) -> bytes:
+    """Gzip a body if it is large enough and of a compressible type, else None"""
+    if len(body) < GZIP_MIN_SIZE or not content_type.startswith(COMPRESSIBLE_TYPES):
+        return None
+    return gzip.compress(body, mtime=0)
+
+
+def accepts_gzip(header: str) -> bool:
+    """Check an Accept-Encoding header for gzip with a non-zero q-value.
+
+    An explicit gzip (or x-gzip) coding decides; otherwise "*" applies.
+    """
+    wildcard = False
+    for coding in (header or "").split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name in ("gzip", "x-gzip"):
+            return q > 0
+        if name == "*":
+            wildcard = q > 0
+    return wildcard
+
+
+def read_static_file(path: Path) -> dict:
+    """Load a static asset with its ETag and gzipped body, computed once per version"""
+    body = path.read_bytes()
+    content_type = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+    if content_type.startswith(("text/", "application/javascript")):
+        content_type += "; charset=utf-8"
+    return {
+        "body": body,
+        "content_type": content_type,
+        "etag": make_etag(body),
+        "gzip": gzip_body(body, content_type),
+    }
+
+
+static_files = FileCache()
+
+# Gzipped JSON bodies by ETag, so repeated identical responses compress once
+compressed_json = {}
+compressed_json_lock = threading.Lock()
+COMPRESSED_JSON_LIMIT = 64
+
+
+def gzip_json(body: bytes, etag: str) -> bytes:
+    """Gzip a JSON body, reusing the compressed bytes for a known ETag"""
+    if len(body) < GZIP_MIN_SIZE:
+        return None
+    with compressed_json_lock:
+        if etag in compressed_json:
+            return compressed_json[etag]
+    compressed = gzip_body(body, "application/json")
+    with compressed_json_lock:
+        if len(compressed_json) >= COMPRESSED_JSON_LIMIT:
+            compressed_json.pop(next(iter(compressed_json)))
+        compressed_json[etag] = compressed
+    return compressed
+
+
+def parse_questions_md(exam_id: str) -> list:
+    """Get the parsed questions of an exam"""
+    return exam_catalog.questions(exam_id)
+
+
+def parse_solutions_md(exam_id: str) -> list:
+    """Get the parsed solutions of an exam"""
+    return exam_catalog.solutions(exam_id)
+
+
+def get_solution(exam_id: str, question_id: str) -> dict:
+    """Get a specific solution by question ID"""
+    return exam_catalog.solution(exam_id, question_id)
+
+
+def load_exam_config(exam_id: str) -> dict:
+    """Load exam configuration from the exam index"""
+    config = read_exam_config(exam_id)
 
     # Environment variable override (NO_PAUSE=true disables pause)
     if os.environ.get("NO_PAUSE", "").lower() == "true":
@@ -458,22 +885,28 @@ def load_exam_config(exam_id: str) -> dict:
 def list_exams() -> list:
     """List all available exams"""
     exams = []
-    if EXAMS_DIR.exists():
-        for exam_dir in EXAMS_DIR.iterdir():
-            if exam_dir.is_dir() and (exam_dir / "exam.conf").exists():
-                config = load_exam_config(exam_dir.name)
-                exams.append(
-                    {
-                        "id": exam_dir.name,
-                        "name": config["exam_name"],
-                        "duration": config["duration"],
-                        "questions": config["total_questions"],
-                        "points": config["total_points"],
-                    }
-                )
+    for exam_id, exam in exam_index.load(EXAMS_DIR)["exams"].items():
+        summary = exam["summary"]
+        exams.append(
+            {
+                "id": exam_id,
+                "name": summary["name"],
+                "duration": summary["duration"],
+                "questions": summary["questions"],
+                "points": summary["points"],
+            }
+        )
     return exams
 
 
+class ExamServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server so slow scoring or cleanup never blocks timer polling"""
+
+    # Allow port reuse to avoid "Address already in use" after restart
+    allow_reuse_address = True
+    daemon_threads = True
+
+
 class ExamHandler(http.server.SimpleHTTPRequestHandler):
     """Custom HTTP handler for exam interface"""
 
@@ -497,9 +930,34 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
             config = load_exam_config(exam_id)
             self.send_json(config)
         elif path == "/api/timer":
-            self.send_json(self.get_timer_state())
+            with state_lock:
+                timer = self.get_timer_state()
+            self.send_json(timer)
+        elif path == "/api/timer/events":
+            self.stream_timer()
+        elif path == "/api/score/changed":
+            query = urllib.parse.parse_qs(parsed.query)
+            exam_id = self.scoring_exam(query.get("exam_id", [None])[0])
+            if not exam_id:
+                self.send_error(400, "No exam selected")
+                return
+            self.send_json(
+                {
+                    "exam_id": exam_id,
+                    "scored": score_board.scored(exam_id),
+                    "questions": score_board.changed(exam_id),
+                    "watch": score_board.watch_status(exam_id),
+                }
+            )
+        elif path == "/api/score/stream":
+            query = urllib.parse.parse_qs(parsed.query)
+            self.stream_score(query.get("exam_id", [None])[0])
+        elif path == "/api/catalog/stats":
+            self.send_json(exam_catalog.stats())
         elif path == "/api/flags":
-            self.send_json(list(flagged_questions))
+            with state_lock:
+                flags = list(flagged_questions)
+            self.send_json(flags)
         elif path == "/api/terminal/status":
             # Check if terminal is disabled via environment
             no_terminal = os.environ.get("NO_TERMINAL", "false").lower() == "true"
@@ -541,17 +999,66 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
             # Serve static files
             if path == "/":
                 self.path = "/index.html"
-            super().do_GET()
+            file_path = Path(self.translate_path(self.path))
+            if file_path.is_file():
+                asset = static_files.load(file_path, read_static_file)
+                self.send_body(asset["body"], asset["content_type"], asset["etag"], asset["gzip"])
+            else:
+                super().do_GET()
 
     def end_headers(self):
         """Add cache control headers for development"""
-        # Disable caching for JS and CSS files to avoid stale code issues
+        # Always revalidate JS, CSS and HTML: the ETag changes with the file,
+        # so an edited file is fetched again and an unchanged one is a 304
         if self.path.endswith(('.js', '.css', '.html')):
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
+            self.send_header('Cache-Control', 'no-cache')
         super().end_headers()
 
+    def etag_matches(self, etag: str) -> bool:
+        """Check the request's If-None-Match header against an ETag"""
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        tags = [tag.strip() for tag in header.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+    def send_body(self, body: bytes, content_type: str, etag: str, gzipped=None,
+                  headers: dict = None):
+        """Send a response body with ETag revalidation and optional gzip encoding.
+
+        gzipped is the compressed body, or a function returning it that is only
+        called for a 200 to a client accepting gzip.
+        """
+        if self.etag_matches(etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        if gzipped is not None and accepts_gzip(self.headers.get("Accept-Encoding")):
+            if callable(gzipped):
+                gzipped = gzipped()
+        else:
+            gzipped = None
+        use_gzip = gzipped is not None
+        payload = gzipped if use_gzip else body
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
     def do_POST(self):
         """Handle POST requests"""
         parsed = urllib.parse.urlparse(self.path)
@@ -572,100 +1079,105 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
         if path == "/api/timer/start":
             exam_id = data.get("exam_id", "ckad-simulation1")
             config = load_exam_config(exam_id)
-            timer_state["start_time"] = time.time()
-            timer_state["duration_minutes"] = config["duration"]
-            timer_state["exam_id"] = exam_id
-            timer_state["exam_name"] = config["exam_name"]
-            timer_state["running"] = True
-            timer_state["paused"] = False
-            timer_state["pause_time"] = None
-            timer_state["total_paused_seconds"] = 0
-            flagged_questions.clear()
-            self.send_json({"status": "started", "timer": self.get_timer_state()})
+            with state_lock:
+                timer_state["start_time"] = time.time()
+                timer_state["duration_minutes"] = config["duration"]
+                timer_state["exam_id"] = exam_id
+                timer_state["exam_name"] = config["exam_name"]
+                timer_state["running"] = True
+                timer_state["paused"] = False
+                timer_state["pause_time"] = None
+                timer_state["total_paused_seconds"] = 0
+                flagged_questions.clear()
+                notify_timer_change()
+                timer = self.get_timer_state()
+            score_board.switch_exam(exam_id)
+            self.send_json({"status": "started", "timer": timer})
 
         elif path == "/api/timer/stop":
-            timer_state["running"] = False
+            with state_lock:
+                timer_state["running"] = False
+                notify_timer_change()
             self.send_json({"status": "stopped"})
 
         elif path == "/api/flag":
             question_id = data.get("question_id")
             if question_id:
-                if question_id in flagged_questions:
-                    flagged_questions.remove(question_id)
-                    self.send_json({"flagged": False})
-                else:
-                    flagged_questions.add(question_id)
-                    self.send_json({"flagged": True})
+                with state_lock:
+                    flagged = question_id not in flagged_questions
+                    if flagged:
+                        flagged_questions.add(question_id)
+                    else:
+                        flagged_questions.remove(question_id)
+                self.send_json({"flagged": flagged})
             else:
                 self.send_error(400, "Missing question_id")
 
         elif path == "/api/timer/pause":
             # Toggle pause state
-            if timer_state["running"]:
-                if timer_state.get("paused"):
-                    # Resume timer
-                    paused_duration = time.time() - timer_state["pause_time"]
-                    timer_state["total_paused_seconds"] = (
-                        timer_state.get("total_paused_seconds", 0) + paused_duration
-                    )
-                    timer_state["paused"] = False
-                    timer_state["pause_time"] = None
-                    self.send_json({"paused": False, "timer": self.get_timer_state()})
+            with state_lock:
+                if timer_state["running"]:
+                    if timer_state.get("paused"):
+                        # Resume timer
+                        paused_duration = time.time() - timer_state["pause_time"]
+                        timer_state["total_paused_seconds"] = (
+                            timer_state.get("total_paused_seconds", 0) + paused_duration
+                        )
+                        timer_state["paused"] = False
+                        timer_state["pause_time"] = None
+                    else:
+                        # Pause timer
+                        timer_state["paused"] = True
+                        timer_state["pause_time"] = time.time()
+                    notify_timer_change()
+                    response = {
+                        "paused": timer_state["paused"],
+                        "timer": self.get_timer_state(),
+                    }
                 else:
-                    # Pause timer
-                    timer_state["paused"] = True
-                    timer_state["pause_time"] = time.time()
-                    self.send_json({"paused": True, "timer": self.get_timer_state()})
-            else:
-                self.send_json({"error": "Timer not running", "paused": False})
+                    response = {"error": "Timer not running", "paused": False}
+            self.send_json(response)
 
         elif path == "/api/score":
-            # Stop the timer
-            timer_state["running"] = False
-            timer_state["paused"] = False
-
-            # Run the scoring script
-            exam_id = timer_state.get("exam_id") or data.get("exam_id")
-            print(f"\n{'=' * 60}")
-            print(f"  Scoring exam: {exam_id or 'unknown'}")
-            print(f"{'=' * 60}\n")
-            score_result = run_scoring_script(exam_id)
-            if score_result.get("success"):
-                print(
-                    f"  Score: {score_result.get('total_score')}/{score_result.get('max_score')} ({score_result.get('percentage')}%)"
-                )
-                print(
-                    f"  Status: {'PASSED' if score_result.get('passed') else 'FAILED'}\n"
-                )
-
-            # Add timer info to result
-            if timer_state["start_time"]:
-                total_paused = timer_state.get("total_paused_seconds", 0)
-                elapsed = time.time() - timer_state["start_time"] - total_paused
-                score_result["elapsed_seconds"] = int(elapsed)
-                score_result["elapsed_formatted"] = (
-                    f"{int(elapsed // 60)}:{int(elapsed % 60):02d}"
-                )
-
-            # Add solutions availability
-            score_result["solutions_available"] = (
-                solutions_available(exam_id) if exam_id else False
-            )
-            score_result["exam_id"] = exam_id
-
+            exam_id = self.begin_scoring(data.get("exam_id"))
+            tracked = exam_id in exam_index.load(EXAMS_DIR)["exams"]
+            if tracked:
+                score_board.begin_full(exam_id)
+            score_result = full_score_job(exam_id).future.result()
+            if tracked:
+                score_board.record(exam_id, score_result)
+            # Copy: identical concurrent requests share one result
+            score_result = dict(score_result)
+            self.finish_scoring(score_result, exam_id)
             self.send_json(score_result)
 
+        elif path.startswith("/api/score/"):
+            # Re-score one question (/api/score/{question}) or the changed ones
+            exam_id = self.scoring_exam(data.get("exam_id"))
+            question_id = path[len("/api/score/"):]
+            if not exam_id:
+                self.send_error(400, "No exam selected")
+            elif question_id == "changed":
+                self.send_json(self.rescore(exam_id))
+            elif question_id in score_board.question_ids(exam_id):
+                self.send_json(self.rescore(exam_id, [question_id]))
+            else:
+                self.send_error(404, f"Unknown question: {question_id}")
+
         elif path == "/api/cleanup":
             # Run cleanup script
-            exam_id = timer_state.get("exam_id") or data.get("exam_id")
-            cleanup_result = run_cleanup_script(exam_id)
+            with state_lock:
+                exam_id = timer_state.get("exam_id") or data.get("exam_id")
+            cleanup_result = run_in_background(f"cleanup:{exam_id}", run_cleanup_script, exam_id)
             self.send_json(cleanup_result)
 
         elif path == "/api/shutdown":
             global shutdown_requested
             # Stop timer if running
-            timer_state["running"] = False
-            timer_state["paused"] = False
+            with state_lock:
+                timer_state["running"] = False
+                timer_state["paused"] = False
+                notify_timer_change()
             # Signal shutdown
             shutdown_requested = True
             self.send_json({"status": "shutdown_initiated"})
@@ -677,8 +1189,6 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
             print("\n  Server stopped.\n")
 
             # Schedule shutdown after response is sent
-            import threading
-
             def delayed_shutdown():
                 time.sleep(0.5)
                 os._exit(0)
@@ -688,8 +1198,162 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
         else:
             self.send_error(404, "Not found")
 
+    def begin_scoring(self, requested_exam_id: str = None) -> str:
+        """Stop the timer and return the exam to score"""
+        with state_lock:
+            timer_state["running"] = False
+            timer_state["paused"] = False
+            notify_timer_change()
+            exam_id = timer_state.get("exam_id") or requested_exam_id
+
+        print(f"\n{'=' * 60}")
+        print(f"  Scoring exam: {exam_id or 'unknown'}")
+        print(f"{'=' * 60}\n")
+        return exam_id
+
+    def finish_scoring(self, score_result: dict, exam_id: str):
+        """Log the score and add timer and solutions info to the result"""
+        if score_result.get("success"):
+            print(
+                f"  Score: {score_result.get('total_score')}/{score_result.get('max_score')} ({score_result.get('percentage')}%)"
+            )
+            print(
+                f"  Status: {'PASSED' if score_result.get('passed') else 'FAILED'}\n"
+            )
+
+        # Add timer info to result
+        with state_lock:
+            start_time = timer_state["start_time"]
+            total_paused = timer_state.get("total_paused_seconds", 0)
+        if start_time:
+            elapsed = time.time() - start_time - total_paused
+            score_result["elapsed_seconds"] = int(elapsed)
+            score_result["elapsed_formatted"] = (
+                f"{int(elapsed // 60)}:{int(elapsed % 60):02d}"
+            )
+
+        # Add solutions availability
+        score_result["solutions_available"] = (
+            solutions_available(exam_id) if exam_id else False
+        )
+        score_result["exam_id"] = exam_id
+
+    def scoring_exam(self, requested_exam_id: str = None) -> str:
+        """Exam of the running session (or the requested one), None if unknown"""
+        with state_lock:
+            exam_id = timer_state.get("exam_id") or requested_exam_id
+        return exam_id if exam_id in exam_index.load(EXAMS_DIR)["exams"] else None
+
+    def rescore(self, exam_id: str, questions: list = None) -> dict:
+        """Score the given questions (default: those whose inputs changed) without
+        stopping the timer, and return the exam result merged with the last score.
+
+        An exam that was never scored is scored in full. `rescored` lists the
+        questions that were scored by this request, `watch` what the change
+        tracker can see (questions on a failing watch always count as changed).
+        """
+        questions = score_board.begin(exam_id, questions)
+        if questions is None:
+            score_result = full_score_job(exam_id).future.result()
+        elif questions:
+            score_result = run_in_background(
+                f"score:{exam_id}:{','.join(questions)}", run_scoring_script, exam_id, None, questions
+            )
+        else:
+            score_result = {"success": True, "questions": []}
+        score_board.record(exam_id, score_result, questions)
+
+        result = score_board.result(exam_id) if score_result.get("success") else dict(score_result)
+        result["rescored"] = [q["id"] for q in score_result["questions"]]
+        result["watch"] = score_board.watch_status(exam_id)
+        self.finish_scoring(result, exam_id)
+        return result
+
+    def stream_score(self, requested_exam_id: str = None):
+        """Score the exam, sending each question as a Server-Sent Event.
+
+        Emits a `question` event per scored question, then one `summary`
+        event carrying the same body as POST /api/score. The stream follows
+        the exam's shared scoring job, so it never runs a second ckad-score.sh
+        next to a POST /api/score or another stream.
+        """
+        exam_id = self.begin_scoring(requested_exam_id)
+        tracked = exam_id in exam_index.load(EXAMS_DIR)["exams"]
+        taken = set()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+
+            if tracked:
+                taken = score_board.begin_full(exam_id)
+            job = full_score_job(exam_id)
+            try:
+                for question in job.follow():
+                    self.send_event("question", question)
+            except (BrokenPipeError, ConnectionResetError):
+                job.leave()
+                raise
+            score_result = job.future.result()
+            if tracked:
+                score_board.record(exam_id, score_result)
+            # Copy: other requests following the job share its result
+            score_result = dict(score_result)
+            self.finish_scoring(score_result, exam_id)
+            self.send_event("summary", score_result)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client closed the stream; scoring stops unless another request
+            # follows it, and its result is lost here, so the changes it took
+            # are pending again
+            if tracked:
+                score_board.lost(exam_id, taken)
+
+    def stream_timer(self):
+        """Push the timer state as Server-Sent Events whenever it changes.
+
+        The browser counts down locally between events, so an idle exam costs
+        one keep-alive comment every TIMER_KEEPALIVE seconds. A running timer
+        also wakes the stream when it runs out, so expiry is pushed too.
+        """
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+
+            version = None
+            while True:
+                with timer_changed:
+                    if version == timer_version:
+                        left = timer_seconds_left()
+                        if left is None or left > 0:
+                            timer_changed.wait(TIMER_KEEPALIVE if left is None else min(TIMER_KEEPALIVE, left))
+                        left = timer_seconds_left()
+                        if left is not None and left <= 0:
+                            # Ran out while idle: this stops the timer and bumps timer_version
+                            self.get_timer_state()
+                    timer = self.get_timer_state() if version != timer_version else None
+                    version = timer_version
+                if timer is not None:
+                    self.send_event("timer", timer)
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away (page closed or reconnecting)
+            pass
+
+    def send_event(self, event: str, data):
+        """Write one Server-Sent Event and flush it to the client"""
+        payload = json.dumps(data, ensure_ascii=False)
+        self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
     def get_timer_state(self) -> dict:
-        """Get current timer state"""
+        """Get current timer state (caller must hold state_lock)"""
         if not timer_state["running"] or timer_state["start_time"] is None:
             return {
                 "running": False,
@@ -719,6 +1383,7 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
 
         if remaining <= 0:
             timer_state["running"] = False
+            notify_timer_change()
 
         return {
             "running": timer_state["running"],
@@ -746,14 +1411,16 @@ class ExamHandler(http.server.SimpleHTTPRequestHandler):
 
     def send_json(self, data):
         """Send JSON response"""
-        response = json.dumps(data, ensure_ascii=False)
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        etag = make_etag(body)
         try:
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json; charset=utf-8")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.send_header("Content-Length", len(response.encode("utf-8")))
-            self.end_headers()
-            self.wfile.write(response.encode("utf-8"))
+            self.send_body(
+                body,
+                "application/json; charset=utf-8",
+                etag,
+                lambda: gzip_json(body, etag),
+                headers={"Access-Control-Allow-Origin": "*"},
+            )
         except (BrokenPipeError, ConnectionResetError):
             # Client disconnected before response was sent (common for long operations)
             pass
@@ -787,9 +1454,7 @@ def main():
         except ValueError:
             start_question = 1
 
-    # Allow port reuse to avoid "Address already in use" after restart
-    socketserver.TCPServer.allow_reuse_address = True
-    with socketserver.TCPServer((HOST, PORT), ExamHandler) as httpd:
+    with ExamServer((HOST, PORT), ExamHandler) as httpd:
         print(f"\n{'=' * 60}")
         print("  ckad-dojo - CKAD Exam Simulator")
         print(f"{'=' * 60}")
@@ -798,12 +1463,13 @@ def main():
 
         if exam_id:
             config = load_exam_config(exam_id)
-            timer_state["start_time"] = time.time()
-            timer_state["duration_minutes"] = config["duration"]
-            timer_state["exam_id"] = exam_id
-            timer_state["exam_name"] = config["exam_name"]
-            timer_state["running"] = True
-            timer_state["start_question"] = start_question
+            with state_lock:
+                timer_state["start_time"] = time.time()
+                timer_state["duration_minutes"] = config["duration"]
+                timer_state["exam_id"] = exam_id
+                timer_state["exam_name"] = config["exam_name"]
+                timer_state["running"] = True
+                timer_state["start_question"] = start_question
             print(f"  Exam started: {config['exam_name']}")
             print(f"  Duration: {config['duration']} minutes")
             print(f"  Starting at question: {start_question}\n")